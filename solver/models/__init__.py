@@ -1,18 +1,40 @@
 """Modelos de solvers para el problema DTP."""
 
-from .solver import ABCSolver
+from .solver import ABCSolver, CancelToken
+from .cache import RouteEvaluationCache
+from .batch import SimulationWorkspace, evaluate_routes, greedy_purchases, simulate_routes
+from .trading import TradePolicy, GreedyKnapsack, ExactKnapsack, BeamTrading
 from .brute import BruteForceSolver
+from .dp_trades import DPTradeOptimizer
+from .branch_bound import BranchAndBoundSolver
 from .greedy import GreedySolver
 from .aco import ACOSolver
+from .colonies import MultiColonyACOSolver
 from .ga_beam import GABeamSolver
-from .heuristics import MultiGreedySolver, GreedyWithLocalSearch
+from .island import IslandGASolver
+from .heuristics import MultiGreedySolver, GreedyWithLocalSearch, MultiStartLocalSearch
 
 __all__ = [
     "ABCSolver",
+    "CancelToken",
+    "RouteEvaluationCache",
+    "SimulationWorkspace",
+    "evaluate_routes",
+    "greedy_purchases",
+    "simulate_routes",
+    "TradePolicy",
+    "GreedyKnapsack",
+    "ExactKnapsack",
+    "BeamTrading",
     "BruteForceSolver",
+    "DPTradeOptimizer",
+    "BranchAndBoundSolver",
     "GreedySolver",
     "ACOSolver",
+    "MultiColonyACOSolver",
     "GABeamSolver",
+    "IslandGASolver",
     "MultiGreedySolver",
     "GreedyWithLocalSearch",
+    "MultiStartLocalSearch",
 ]
@@ -2,13 +2,15 @@
 Ant Colony Optimization (ACO) Solver para el Problema del Comerciante Holandés.
 
 Este solver utiliza optimización de colonias de hormigas para encontrar buenas rutas
-entre puertos, y aplica el algoritmo greedy de knapsack para optimizar las decisiones
-de compra/venta en cada puerto.
+entre puertos, y aplica una política de trading (por defecto, la mochila greedy)
+para optimizar las decisiones de compra/venta en cada puerto.
 """
 
 import numpy as np
-from typing import Optional
-from solver.models.solver import ABCSolver
+from typing import Callable, Literal, Optional
+from solver.models.cache import RouteEvaluationCache
+from solver.models.solver import ABCSolver, CancelToken, ProgressCallback
+from solver.models.trading import TradePolicy, make_trade_policy
 from solver.schemas.dtp import DTPInstance, DTPSolution
 
 
@@ -18,7 +20,12 @@ class ACOSolver(ABCSolver):
     
     El algoritmo funciona en dos fases:
     1. ACO construye rutas entre puertos usando feromonas y heurística
-    2. Greedy Knapsack optimiza compra/venta en cada puerto de la ruta
+    2. La política de trading (por defecto, Greedy Knapsack) optimiza
+       compra/venta en cada puerto de la ruta
+    
+    Las rutas de cada iteración se evalúan en lote con la política de trading
+    (``TradePolicy.simulate_many``), agrupadas por longitud, en lugar de una
+    por una.
     
     Parámetros:
         n_ants: Número de hormigas por iteración
@@ -27,8 +34,28 @@ class ACOSolver(ABCSolver):
         beta: Peso de la información heurística (default: 2.0)
         evaporation_rate: Tasa de evaporación de feromonas (default: 0.5)
         q: Constante para depositar feromonas (default: 100.0)
+        subset_routes: Si es True, una hormiga solo se mueve a puertos desde los
+            que aún puede volver a Ámsterdam a tiempo y termina su ruta cuando
+            no queda ninguno, así que toda ruta construida es factible en
+            tiempo. Si es False, se descartan las rutas cuyo regreso excede el
+            tiempo máximo (default: True)
+        n_candidates: Si se indica, cada hormiga elige entre los
+            ``n_candidates`` puertos más cercanos (costo/tiempo combinado) al
+            actual y solo recurre a todos los puertos si ninguno es factible
+            (None = considerar siempre todos los puertos)
+        knapsack: Mochila de compras de cada tramo: "greedy" (fraccionaria
+            truncada) o "exact" (entera acotada exacta, memoizada por tramo en
+            ``instance.derived.knapsack``)
+        trade_policy: Política de trading con la que se evalúan las rutas
+            (None = la de ``knapsack``; ver ``trading``)
+        cache: Caché de evaluaciones de rutas (compartible con otros solvers)
+        progress_callback: Recibe un evento "iteration" cada ``progress_interval``
+            iteraciones (ver ABCSolver)
+        progress_interval: Iteraciones entre eventos
+        cancel_token: Token para cancelar el solve desde fuera
+        time_budget: Segundos de reloj máximos para el solve
     """
-    
+
     def __init__(
         self,
         n_ants: int = 10,
@@ -36,7 +63,16 @@ class ACOSolver(ABCSolver):
         alpha: float = 1.0,
         beta: float = 2.0,
         evaporation_rate: float = 0.5,
-        q: float = 100.0
+        q: float = 100.0,
+        subset_routes: bool = True,
+        n_candidates: Optional[int] = None,
+        knapsack: Literal["greedy", "exact"] = "greedy",
+        trade_policy: Optional[TradePolicy] = None,
+        cache: Optional[RouteEvaluationCache] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        progress_interval: int = 1,
+        cancel_token: Optional[CancelToken] = None,
+        time_budget: Optional[float] = None
     ):
         self.n_ants = n_ants
         self.n_iterations = n_iterations
@@ -44,13 +80,35 @@ class ACOSolver(ABCSolver):
         self.beta = beta
         self.evaporation_rate = evaporation_rate
         self.q = q
+        self.subset_routes = subset_routes
+        self.n_candidates = n_candidates
+        self.knapsack = knapsack
+        self.trade_policy = (
+            trade_policy if trade_policy is not None else make_trade_policy(knapsack)
+        )
+        self.cache = cache if cache is not None else RouteEvaluationCache()
+        self._configure_progress(
+            progress_callback, progress_interval, cancel_token, time_budget
+        )
+
+    @property
+    def policy_id(self) -> str:
+        """Identificador de la política de trading."""
+        return f"aco:{self.trade_policy.policy_id}"
         
-    def solve(self, instance: DTPInstance) -> DTPSolution:
+    def solve(
+        self,
+        instance: DTPInstance,
+        time_limit: Optional[float] = None,
+        node_limit: Optional[int] = None
+    ) -> DTPSolution:
         """
         Resuelve la instancia usando ACO + Greedy Knapsack.
         
         Args:
             instance: Instancia del problema DTP
+            time_limit: Segundos de reloj para esta llamada
+            node_limit: Máximo de rutas evaluadas
             
         Returns:
             Mejor solución encontrada
@@ -58,32 +116,68 @@ class ACOSolver(ABCSolver):
         Raises:
             ValueError: Si no se encuentra una solución factible.
         """
+        self._start_run(time_limit, node_limit)
+        best_solution, routes_evaluated = self._run_colony(instance)
+        
+        # Si no se encontró solución, retornar solución trivial
+        if best_solution is None:
+            if not self.interrupted:
+                raise ValueError("No se encontró una solución factible para la instancia dada.")
+            best_solution = self._build_trivial_solution(instance)
+        
+        return self._finish_run(best_solution, routes_evaluated)
+    
+    def _run_colony(
+        self,
+        instance: DTPInstance,
+        on_iteration: Optional[Callable[[int, np.ndarray], bool]] = None,
+        rng: np.random.RandomState = np.random
+    ) -> tuple[Optional[DTPSolution], int]:
+        """
+        Ciclo de la colonia; devuelve la mejor solución y las rutas evaluadas.
+        
+        Args:
+            on_iteration: Se llama tras cada iteración con (iteración,
+                feromonas); puede modificar las feromonas en el lugar y
+                devuelve True si lo hizo (p. ej. al combinarlas con las de
+                otras colonias)
+            rng: Generador de las ruletas (por defecto, el estado global de
+                ``np.random``, que se siembra con ``np.random.seed``)
+        """
         n = instance.tiempos.shape[0] - 1  # Número de puertos (sin Ámsterdam)
+        routes_evaluated = 0
         
         # Inicializar matriz de feromonas
         pheromones = self._init_pheromones(n)
         
-        # Calcular matriz de información heurística (inverso de costo normalizado)
-        heuristic = self._compute_heuristic(instance)
+        # Calcular matriz de información heurística (inverso de costo normalizado).
+        # heurística^beta es constante durante el solve: se calcula una sola vez
+        heuristic_beta = self._compute_heuristic(instance) ** self.beta
+        attractiveness = self._attractiveness(pheromones, heuristic_beta)
         
         # Mejor solución global
         best_solution = None
         best_capital = float('-inf')
         
         for iteration in range(self.n_iterations):
+            if self._should_stop(routes_evaluated):
+                break
+            
             # Soluciones de esta iteración
             iteration_solutions = []
             
-            for ant in range(self.n_ants):
-                # Construir ruta con esta hormiga
-                route = self._construct_route(instance, pheromones, heuristic)
-                
-                if route is None:
-                    continue
-                
-                # Evaluar ruta con greedy knapsack
-                solution = self._evaluate_route(instance, route)
-                
+            # Construir las rutas de todas las hormigas
+            routes = [
+                route
+                for route in self._construct_routes(instance, attractiveness, rng)
+                if route is not None
+            ]
+            
+            # Evaluar todas las rutas con la política de trading en un solo lote
+            solutions = self._evaluate_routes(instance, routes)
+            routes_evaluated += len(routes)
+            
+            for route, solution in zip(routes, solutions):
                 if solution is not None:
                     iteration_solutions.append((route, solution))
                     
@@ -95,12 +189,20 @@ class ACOSolver(ABCSolver):
             # Actualizar feromonas
             if iteration_solutions:
                 self._update_pheromones(pheromones, iteration_solutions)
+                attractiveness = self._attractiveness(pheromones, heuristic_beta)
+            
+            if on_iteration is not None and on_iteration(iteration + 1, pheromones):
+                attractiveness = self._attractiveness(pheromones, heuristic_beta)
+            
+            if (iteration + 1) % self.progress_interval == 0:
+                self._emit(
+                    "iteration",
+                    iteration=iteration + 1,
+                    visited_nodes=routes_evaluated,
+                    best_benefit=best_solution.beneficio_final if best_solution else None,
+                )
         
-        # Si no se encontró solución, retornar solución trivial
-        if best_solution is None:
-            raise ValueError("No se encontró una solución factible para la instancia dada.")
-        
-        return best_solution
+        return best_solution, routes_evaluated
     
     def _init_pheromones(self, n: int) -> np.ndarray:
         """Inicializa matriz de feromonas con valor constante."""
@@ -112,110 +214,201 @@ class ACOSolver(ABCSolver):
         Combina costo y tiempo de viaje (menor es mejor).
         """
         n = instance.tiempos.shape[0]
-        heuristic = np.zeros((n, n))
-        
-        # Normalizar costos y tiempos
-        max_cost = np.max(instance.costos[instance.costos < np.inf])
-        max_time = np.max(instance.tiempos[instance.tiempos < np.inf])
-        
-        for i in range(n):
-            for j in range(n):
-                if i != j and instance.costos[i, j] < np.inf:
-                    # Combinar costo y tiempo normalizados
-                    normalized_cost = instance.costos[i, j] / max_cost
-                    normalized_time = instance.tiempos[i, j] / max_time
-                    combined = 0.5 * normalized_cost + 0.5 * normalized_time
-                    
-                    # Heurística es inverso (menor costo/tiempo = mayor heurística)
-                    heuristic[i, j] = 1.0 / (combined + 1e-6)
         
-        return heuristic
+        # Costo y tiempo normalizados y combinados (memoizado en la instancia)
+        combined = instance.derived.combined_cost
+        valid = ~np.eye(n, dtype=bool) & (instance.costos < np.inf)
+        
+        # Heurística es inverso (menor costo/tiempo = mayor heurística)
+        with np.errstate(divide="ignore"):
+            return np.where(valid, 1.0 / (combined + 1e-6), 0.0)
     
-    def _construct_route(
+    def _attractiveness(
         self,
-        instance: DTPInstance,
         pheromones: np.ndarray,
-        heuristic: np.ndarray
-    ) -> Optional[list[int]]:
+        heuristic_beta: np.ndarray
+    ) -> np.ndarray:
         """
-        Construye una ruta usando selección probabilística basada en feromonas y heurística.
-        """
-        n = instance.tiempos.shape[0] - 1
+        Matriz feromona^alpha × heurística^beta usada para elegir el próximo puerto.
         
-        current = 0  # Comenzar en Ámsterdam
-        visited = {0}
-        route = [0]
+        Se recalcula solo cuando cambian las feromonas (una vez por iteración).
+        """
+        pheromone_alpha = pheromones if self.alpha == 1.0 else pheromones ** self.alpha
+        return pheromone_alpha * heuristic_beta
+    
+    def _construct_routes(
+        self,
+        instance: DTPInstance,
+        attractiveness: np.ndarray,
+        rng: np.random.RandomState = np.random
+    ) -> list[Optional[list[int]]]:
+        """
+        Construye las rutas de todas las hormigas a la vez.
         
-        time_accumulated = 0.0
-        capital = instance.capital_inicial
+        Todas las hormigas avanzan en paralelo: en cada paso se enmascaran los
+        puertos ya visitados o infactibles (tiempo acumulado, incluido el
+        regreso a Ámsterdam con ``subset_routes``; capital para el viaje)
+        sobre la matriz feromona^alpha × heurística^beta, y se elige el
+        próximo puerto de cada hormiga con una ruleta vectorizada. Una hormiga
+        sin puertos factibles regresa a Ámsterdam.
         
-        # Construir ruta visitando todos los puertos
-        while len(visited) <= n:
-            # # Si ya visitamos todos, regresar a Ámsterdam
-            # if len(visited) == n + 1:
-            #     route.append(0)
-            #     break
-            
-            # Calcular probabilidades para próximo puerto
-            unvisited = [p for p in range(1, n + 1) if p not in visited]
-            
-            if not unvisited:
-                # Todos visitados, regresar a Ámsterdam
-                route.append(0)
-                break
-            
-            # Calcular probabilidades
-            probabilities = []
-            valid_ports = []
+        Args:
+            instance: Instancia del problema DTP
+            attractiveness: Matriz feromona^alpha × heurística^beta
+            rng: Generador de las ruletas
             
-            for port in unvisited:
-                # Verificar factibilidad básica
-                travel_time = instance.tiempos[current, port]
-                travel_cost = instance.costos[current, port]
+        Returns:
+            Una ruta por hormiga, o None si excede el tiempo máximo
+        """
+        n = instance.tiempos.shape[0] - 1
+        n_ants = self.n_ants
+        ants = np.arange(n_ants)
+        
+        current = np.zeros(n_ants, dtype=int)  # Comenzar en Ámsterdam
+        visited = np.zeros((n_ants, n + 1), dtype=bool)
+        visited[:, 0] = True
+        routes = np.zeros((n_ants, n + 2), dtype=int)
+        lengths = np.ones(n_ants, dtype=int)
+        active = np.ones(n_ants, dtype=bool)
+        
+        time_accumulated = np.zeros(n_ants)
+        capital = np.full(n_ants, float(instance.capital_inicial))
+        
+        # Tiempo para llegar a cada puerto y volver desde él a Ámsterdam
+        # (chequeo de inserción del regreso); sin subset_routes solo cuenta la ida
+        tiempos = (
+            instance.tiempos + instance.tiempos[:, 0][None, :]
+            if self.subset_routes
+            else instance.tiempos
+        )
+        
+        # Listas de candidatos (vecindario restringido), si se usan
+        candidates = (
+            instance.derived.candidates("combined", self.n_candidates)
+            if self.n_candidates is not None
+            else None
+        )
+        
+        # Construir rutas visitando todos los puertos
+        for _ in range(n):
+            if candidates is None:
+                # Verificar factibilidad básica de cada puerto para cada hormiga
+                feasible = (
+                    ~visited
+                    & (time_accumulated[:, None] + tiempos[current] <= instance.tiempo_maximo)
+                    & (capital[:, None] >= instance.costos[current])
+                    & active[:, None]
+                )
                 
-                if (time_accumulated + travel_time <= instance.tiempo_maximo and
-                    capital >= travel_cost):
-                    
-                    # Probabilidad = (feromona^alpha) * (heurística^beta)
-                    pheromone = pheromones[current, port] ** self.alpha
-                    heur = heuristic[current, port] ** self.beta
-                    prob = pheromone * heur
-                    
-                    probabilities.append(prob)
-                    valid_ports.append(port)
-            
-            if not valid_ports:
-                # No hay puertos factibles, terminar ruta
-                route.append(0)
-                break
-            
-            # Normalizar probabilidades
-            probabilities = np.array(probabilities)
-            probabilities /= probabilities.sum()
-            
-            # Seleccionar próximo puerto
-            next_port = np.random.choice(valid_ports, p=probabilities)
+                # Probabilidad = (feromona^alpha) * (heurística^beta)
+                weights = np.where(feasible, attractiveness[current], 0.0)
+                totals = weights.sum(axis=1)
+                
+                # Hormigas sin puertos factibles terminan su ruta
+                active &= totals > 0
+                if not np.any(active):
+                    break
+                
+                # Ruleta vectorizada: primer puerto cuyo acumulado supera el umbral
+                cumulative = np.cumsum(weights, axis=1)
+                threshold = rng.random_sample(n_ants) * totals
+                next_port = np.argmax(cumulative > threshold[:, None], axis=1)
+            else:
+                next_port = self._candidate_step(
+                    instance, tiempos, attractiveness, candidates,
+                    current, visited, active, time_accumulated, capital, rng
+                )
+                if next_port is None:
+                    break
             
-            # Actualizar estado
-            time_accumulated += instance.tiempos[current, next_port]
-            capital -= instance.costos[current, next_port]
+            # Actualizar estado de las hormigas activas
+            moving = ants[active]
+            step = next_port[moving]
+            time_accumulated[moving] += instance.tiempos[current[moving], step]
+            capital[moving] -= instance.costos[current[moving], step]
             
-            route.append(next_port)
-            visited.add(next_port)
-            current = next_port
+            routes[moving, lengths[moving]] = step
+            lengths[moving] += 1
+            visited[moving, step] = True
+            current[moving] = step
         
-        # Verificar que la ruta sea válida (termina en Ámsterdam)
-        if route[-1] != 0:
-            route.append(0)
+        # Regresar a Ámsterdam (las rutas ya terminan en 0 por el relleno)
+        lengths += 1
+        total_time = time_accumulated + instance.tiempos[current, 0]
         
         # Verificar factibilidad de tiempo total
-        total_time = sum(instance.tiempos[route[i], route[i+1]] 
-                        for i in range(len(route) - 1))
+        return [
+            routes[a, :lengths[a]].tolist() if total_time[a] <= instance.tiempo_maximo else None
+            for a in ants
+        ]
+    
+    def _candidate_step(
+        self,
+        instance: DTPInstance,
+        tiempos: np.ndarray,
+        attractiveness: np.ndarray,
+        candidates: np.ndarray,
+        current: np.ndarray,
+        visited: np.ndarray,
+        active: np.ndarray,
+        time_accumulated: np.ndarray,
+        capital: np.ndarray,
+        rng: np.random.RandomState = np.random
+    ) -> Optional[np.ndarray]:
+        """
+        Elige el próximo puerto de cada hormiga dentro de sus listas de candidatos.
+        
+        La ruleta se hace sobre los candidatos del puerto actual (O(k) por
+        hormiga en lugar de O(n)); solo las hormigas sin candidatos factibles
+        evalúan todos los puertos. Las hormigas sin ningún puerto factible se
+        desactivan en ``active``. ``tiempos`` es la matriz con la que se
+        verifica el tiempo de cada salto (solo la ida, o ida y regreso).
+        
+        Returns:
+            Próximo puerto de cada hormiga (solo es válido para las activas),
+            o None si ya no queda ninguna hormiga activa
+        """
+        n_ants = len(current)
+        ants = np.arange(n_ants)
+        origin = current[:, None]
+        
+        cand = candidates[current]
+        feasible = (
+            ~visited[ants[:, None], cand]
+            & (time_accumulated[:, None] + tiempos[origin, cand] <= instance.tiempo_maximo)
+            & (capital[:, None] >= instance.costos[origin, cand])
+            & active[:, None]
+        )
+        weights = np.where(feasible, attractiveness[origin, cand], 0.0)
+        totals = weights.sum(axis=1)
+        
+        # Respaldo: vecindario completo para las hormigas sin candidatos factibles
+        fallback = ants[active & (totals <= 0)]
+        feasible_all = (
+            ~visited[fallback]
+            & (time_accumulated[fallback, None] + tiempos[current[fallback]] <= instance.tiempo_maximo)
+            & (capital[fallback, None] >= instance.costos[current[fallback]])
+        )
+        weights_all = np.where(feasible_all, attractiveness[current[fallback]], 0.0)
+        totals_all = weights_all.sum(axis=1)
         
-        if total_time > instance.tiempo_maximo:
+        active &= totals > 0
+        active[fallback[totals_all > 0]] = True
+        if not np.any(active):
             return None
         
-        return route
+        # Ruleta vectorizada sobre candidatos y, para el respaldo, sobre todos
+        draw = rng.random_sample(n_ants)
+        next_port = np.zeros(n_ants, dtype=int)
+        if cand.shape[1]:
+            pick = np.argmax(np.cumsum(weights, axis=1) > (draw * totals)[:, None], axis=1)
+            next_port = cand[ants, pick]
+        if len(fallback):
+            next_port[fallback] = np.argmax(
+                np.cumsum(weights_all, axis=1) > (draw[fallback] * totals_all)[:, None],
+                axis=1
+            )
+        return next_port
     
     def _evaluate_route(
         self,
@@ -223,148 +416,53 @@ class ACOSolver(ABCSolver):
         route: list[int]
     ) -> Optional[DTPSolution]:
         """
-        Evalúa una ruta aplicando greedy knapsack en cada puerto.
+        Evalúa una ruta, reutilizando el resultado si ya está en el caché.
         """
-        m = instance.pesos.shape[0]
-        n_stops = len(route)
-        
-        # Matrices para registrar operaciones
-        compras = np.zeros((m, n_stops))
-        ventas = np.zeros((m, n_stops))
-        
-        # Estado inicial
-        capital = instance.capital_inicial
-        cargo = np.zeros(m)
-        time_accumulated = 0.0
-        
-        for idx in range(n_stops - 1):
-            current_port = route[idx]
-            next_port = route[idx + 1]
-            
-            # Vender todo lo que tengamos en el puerto actual
-            for k in range(m):
-                if cargo[k] > 0:
-                    precio_venta = instance.precios_compra[k, current_port]
-                    capital += cargo[k] * precio_venta
-                    ventas[k, idx] = cargo[k]
-                    cargo[k] = 0
-            
-            # Calcular costo de viaje
-            travel_cost = instance.costos[current_port, next_port]
-            travel_time = instance.tiempos[current_port, next_port]
-            
-            # Verificar factibilidad
-            if capital < travel_cost:
-                return None
-            
-            time_accumulated += travel_time
-            if time_accumulated > instance.tiempo_maximo:
-                return None
-            
-            # Reservar capital para el viaje
-            capital_disponible = capital - travel_cost
-            
-            # Calcular capacidad disponible
-            capacidad_disponible = instance.capacidad_bodega - np.sum(cargo * instance.pesos)
-            
-            # Aplicar greedy knapsack para compras
-            if idx < n_stops - 2:  # No comprar en el último puerto antes de Ámsterdam
-                purchases = self._knapsack_greedy(
-                    instance,
-                    current_port,
-                    next_port,
-                    capital_disponible,
-                    capacidad_disponible
-                )
-                
-                # Ejecutar compras
-                for k, cantidad in purchases:
-                    precio_compra = instance.precios_venta[k, current_port]
-                    cargo[k] += cantidad
-                    capital -= cantidad * precio_compra
-                    compras[k, idx] = cantidad
-            
-            # Viajar al siguiente puerto (descontar costo de viaje)
-            capital -= travel_cost
-        
-        # El beneficio_final es el capital final (no la ganancia neta)
-        beneficio_final = capital
-        
-        return DTPSolution(
-            ruta=tuple(route),
-            compras=compras,
-            ventas=ventas,
-            beneficio_final=beneficio_final
+        return self.cache.get_or_compute(
+            instance,
+            route,
+            self.policy_id,
+            lambda: self._simulate_route(instance, route)
         )
     
-    def _knapsack_greedy(
+    def _evaluate_routes(
         self,
         instance: DTPInstance,
-        current_port: int,
-        next_port: int,
-        capital: float,
-        capacidad: float
-    ) -> list[tuple[int, int]]:
+        routes: list[list[int]]
+    ) -> list[Optional[DTPSolution]]:
         """
-        Resuelve el problema de la mochila de forma greedy para maximizar ganancias.
-        Retorna lista de (mercancía, cantidad) a comprar.
+        Evalúa un lote de rutas; las que no están en el caché se simulan juntas.
         """
-        m = instance.pesos.shape[0]
-        opportunities = []
-        
-        for k in range(m):
-            precio_compra = instance.precios_venta[k, current_port]
-            precio_venta = instance.precios_compra[k, next_port]
-            profit = precio_venta - precio_compra
-            
-            if profit <= 0:
-                continue
-            
-            oferta = instance.oferta_max[k, current_port]
-            if oferta <= 0:
-                continue
-            
-            peso = instance.pesos[k]
-            
-            # Calcular cantidad máxima factible
-            max_by_offer = oferta
-            max_by_capital = capital / precio_compra if precio_compra > 0 else float('inf')
-            max_by_capacity = capacidad / peso if peso > 0 else float('inf')
-            
-            max_units = min(max_by_offer, max_by_capital, max_by_capacity)
-            
-            if max_units < 1:
-                continue
-            
-            # Ratio de ganancia por peso
-            ratio = profit / peso if peso > 0 else float('inf')
-            
-            opportunities.append((k, ratio, profit, precio_compra, peso, max_units))
-        
-        # Ordenar por ratio descendente
-        opportunities.sort(key=lambda x: x[1], reverse=True)
-        
-        # Seleccionar mercancías greedily
-        purchases = []
-        capital_restante = capital
-        capacidad_restante = capacidad
-        
-        for k, ratio, profit, precio, peso, max_units in opportunities:
-            # Calcular cuánto podemos comprar
-            cantidad = min(
-                max_units,
-                capital_restante / precio if precio > 0 else float('inf'),
-                capacidad_restante / peso if peso > 0 else float('inf')
-            )
-            
-            cantidad = int(cantidad)
-            
-            if cantidad > 0:
-                purchases.append((k, cantidad))
-                capital_restante -= cantidad * precio
-                capacidad_restante -= cantidad * peso
+        if not routes:
+            return []
+        return self.cache.get_or_compute_many(
+            instance,
+            routes,
+            self.policy_id,
+            lambda missing: self._simulate_routes(instance, missing)
+        )
+    
+    def _simulate_routes(
+        self,
+        instance: DTPInstance,
+        routes: list[tuple[int, ...]]
+    ) -> list[Optional[DTPSolution]]:
+        """
+        Simula varias rutas con la política de trading (en lote si la admite).
         
-        return purchases
+        Equivale a llamar ``_simulate_route`` sobre cada ruta.
+        """
+        return self.trade_policy.simulate_many(instance, routes)
+    
+    def _simulate_route(
+        self,
+        instance: DTPInstance,
+        route: list[int]
+    ) -> Optional[DTPSolution]:
+        """
+        Simula una ruta resolviendo la mochila de compras en cada puerto.
+        """
+        return self.trade_policy.simulate(instance, route)
     
     def _update_pheromones(
         self,
@@ -377,17 +475,18 @@ class ACOSolver(ABCSolver):
         # Evaporación
         pheromones *= (1.0 - self.evaporation_rate)
         
-        # Depositar feromonas
-        for route, solution in solutions:
-            # Cantidad de feromona proporcional a la calidad de la solución
-            if solution.beneficio_final > 0:
-                delta = self.q * solution.beneficio_final / abs(solution.beneficio_final + 1)
-            else:
-                delta = 0.1  # Depositar algo mínimo para soluciones válidas
-            
-            # Depositar en cada arista de la ruta
-            for i in range(len(route) - 1):
-                pheromones[route[i], route[i + 1]] += delta
+        # Cantidad de feromona proporcional a la calidad de la solución
+        # (algo mínimo para soluciones válidas sin beneficio)
+        benefits = np.array([solution.beneficio_final for _, solution in solutions], dtype=float)
+        deltas = np.full(benefits.shape, 0.1)
+        positive = benefits > 0
+        deltas[positive] = self.q * benefits[positive] / np.abs(benefits[positive] + 1)
+        
+        # Depositar en cada arista de cada ruta (np.add.at acumula aristas repetidas)
+        sources = np.concatenate([route[:-1] for route, _ in solutions]).astype(int)
+        targets = np.concatenate([route[1:] for route, _ in solutions]).astype(int)
+        edge_deltas = np.repeat(deltas, [len(route) - 1 for route, _ in solutions])
+        np.add.at(pheromones, (sources, targets), edge_deltas)
     
     def _build_trivial_solution(self, instance: DTPInstance) -> DTPSolution:
         """Construye solución trivial: ir y volver de Ámsterdam sin comerciar."""
@@ -0,0 +1,370 @@
+"""Simulación vectorizada de muchas rutas a la vez para el DTP.
+
+Implementa la política "vender todo y llenar la bodega con la mochila del
+tramo hacia el próximo puerto" sobre un lote de rutas de igual longitud: cada
+paso de la ruta se procesa para todas las rutas en paralelo con arreglos 2-D
+de numpy (rutas × mercancías), en lugar de recorrer cada ruta con bucles
+escalares. ``greedy_purchases`` es la única implementación de la mochila
+greedy; la usan todas las políticas de trading (ver ``trading``).
+
+Los capitales se actualizan siempre mercancía por mercancía en orden de
+índice, así que simular una ruta sola o dentro de un lote da exactamente el
+mismo resultado.
+
+Todos los pasos escriben en buffers de un ``SimulationWorkspace`` (ufuncs con
+``out=`` y búsquedas con ``np.take`` sobre las matrices aplanadas, en lugar de
+indexado avanzado que crea arreglos nuevos). Un solver que conserva su
+workspace entre lotes simula sin reservar memoria por ruta.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+from solver.schemas.dtp import DTPInstance
+from solver.schemas.trade_table import trade_table
+
+
+@dataclass(slots=True)
+class BatchSimulation:
+    """Resultado de simular un lote de rutas.
+
+    Atributos:
+        beneficio_final: Capital final de cada ruta (-inf si es infactible)
+        factible: Si cada ruta respeta capital y tiempo máximo
+        compras: Compras por ruta (rutas × mercancías × pasos)
+        ventas: Ventas por ruta (rutas × mercancías × pasos)
+    """
+
+    beneficio_final: np.ndarray
+    factible: np.ndarray
+    compras: np.ndarray
+    ventas: np.ndarray
+
+
+class SimulationWorkspace:
+    """Buffers preasignados para ``simulate_routes`` y ``greedy_purchases``.
+
+    Cada buffer se pide por nombre y forma, y se reasigna solo cuando hace
+    falta más espacio que el de la vez anterior: un solver que simula lotes de
+    tamaño parecido una y otra vez deja de reservar memoria por ruta. Los
+    arreglos devueltos son vistas que se sobrescriben en la siguiente
+    simulación con el mismo workspace. No es seguro compartirlo entre hilos;
+    al copiarlo a otro proceso se envía vacío.
+    """
+
+    __slots__ = ("_buffers",)
+
+    def __init__(self):
+        self._buffers: dict[str, np.ndarray] = {}
+
+    def __getstate__(self) -> dict:
+        return {}
+
+    def __setstate__(self, state: dict) -> None:
+        self._buffers = {}
+
+    @property
+    def nbytes(self) -> int:
+        """Memoria total reservada por los buffers."""
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def array(self, name: str, shape: tuple[int, ...], dtype: type = np.float64) -> np.ndarray:
+        """Buffer ``name`` con la forma pedida (contenido sin inicializar)."""
+        size = math.prod(shape)
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.size < size or buffer.dtype != dtype:
+            buffer = np.empty(size, dtype=dtype)
+            self._buffers[name] = buffer
+        return buffer[:size].reshape(shape)
+
+
+def evaluate_routes(
+    instance: DTPInstance,
+    routes: np.ndarray,
+    workspace: SimulationWorkspace | None = None,
+) -> np.ndarray:
+    """Capital final de cada ruta con la política vender todo / mochila greedy.
+
+    Args:
+        instance: Instancia del problema
+        routes: Rutas completas de igual longitud (rutas × pasos), 0 ... 0
+        workspace: Buffers reutilizables (ver ``simulate_routes``)
+
+    Returns:
+        Capital final por ruta; -inf para las rutas infactibles
+    """
+    return simulate_routes(instance, routes, workspace=workspace).beneficio_final
+
+
+def _take(matrix: np.ndarray, rows, cols, n_cols: int, index: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """``matrix[rows, cols]`` escrito en ``out`` sin crear arreglos intermedios.
+
+    ``matrix`` debe ser C-contigua y ``index`` un buffer entero del tamaño de ``out``.
+    ``mode="clip"`` evita que ``np.take`` copie ``out`` a un buffer temporal
+    (lo hace con el modo por defecto), pero no detecta índices fuera de rango:
+    los puertos deben validarse antes con ``_check_ports``.
+    """
+    np.multiply(rows, n_cols, out=index)
+    np.add(index, cols, out=index)
+    return np.take(matrix.reshape(-1), index, out=out, mode="clip")
+
+
+def _check_ports(instance: DTPInstance, ports: np.ndarray) -> None:
+    """Lanza IndexError si algún puerto no existe en la instancia."""
+    if ports.size and (ports.min() < 0 or ports.max() > instance.n):
+        raise IndexError(
+            f"Puertos fuera de rango [0, {instance.n}]: "
+            f"mínimo {int(ports.min())}, máximo {int(ports.max())}"
+        )
+
+
+def greedy_purchases(
+    instance: DTPInstance,
+    ports,
+    next_ports,
+    capital: np.ndarray,
+    capacity: np.ndarray,
+    max_goods: int | None = None,
+    workspace: SimulationWorkspace | None = None,
+) -> np.ndarray:
+    """Mochila greedy (fraccionaria truncada a enteros) para muchos estados.
+
+    Cada estado compra en su puerto las mercancías con ganancia hacia su
+    próximo puerto, por ratio ganancia/peso descendente, tanto como permitan
+    la oferta, el capital y la bodega que le quedan.
+
+    Args:
+        instance: Instancia del problema
+        ports: Puerto de compra de cada estado (arreglo o un único puerto)
+        next_ports: Puerto de venta de cada estado (arreglo o un único puerto)
+        capital: Capital disponible de cada estado
+        capacity: Capacidad de bodega disponible de cada estado
+        max_goods: Si se indica, solo se consideran las ``max_goods``
+            mercancías de mejor ratio
+        workspace: Buffers reutilizables; con él, el resultado es un buffer
+            que se sobrescribe en la siguiente llamada
+
+    Returns:
+        Cantidades a comprar (estados × mercancías)
+    """
+    if workspace is None:
+        return greedy_purchases(
+            instance, ports, next_ports, capital, capacity, max_goods, SimulationWorkspace()
+        ).copy()
+
+    m = instance.m
+    n_ports = instance.n + 1
+    n_states = len(capital)
+    table = trade_table(instance)
+    derived = instance.derived
+
+    def buffer(name: str, dtype: type = np.float64) -> np.ndarray:
+        return workspace.array("purchase_" + name, (n_states,), dtype)
+
+    # Puertos de cada estado (un único puerto se repite para todos)
+    port = buffer("port", np.intp)
+    port[:] = ports
+    next_port = buffer("next_port", np.intp)
+    next_port[:] = next_ports
+    _check_ports(instance, port)
+    _check_ports(instance, next_port)
+    index = buffer("index", np.intp)
+
+    capital_restante = buffer("capital")
+    capital_restante[:] = capital
+    capacidad_restante = buffer("capacity")
+    capacidad_restante[:] = capacity
+
+    # Orden de compra y mercancías comprables del tramo de cada estado
+    np.multiply(port, n_ports, out=index)
+    np.add(index, next_port, out=index)
+    order = workspace.array("purchase_order", (n_states, m), np.intp)
+    np.take(table.order.reshape(n_ports * n_ports, m), index, axis=0, out=order, mode="clip")
+    n_buyable = np.take(
+        table.n_buyable.reshape(-1), index, out=buffer("n_buyable", np.intp), mode="clip"
+    )
+
+    # Índices planos de cada fila de la matriz de compras
+    row_start = buffer("row_start", np.intp)
+    row_start.fill(m)
+    if n_states:
+        row_start[0] = 0
+    np.cumsum(row_start, out=row_start)
+
+    compras = workspace.array("purchase_compras", (n_states, m))
+    compras.fill(0.0)
+    k = buffer("k", np.intp)
+    precio = buffer("precio")
+    peso = buffer("peso")
+    oferta = buffer("oferta")
+    by_capital = buffer("by_capital")
+    by_capacity = buffer("by_capacity")
+    mask = buffer("mask", np.bool_)
+    skip = buffer("skip", np.bool_)
+
+    precios_venta = derived.as_array("precios_venta")
+    oferta_max = derived.as_array("oferta_max")
+    pesos = derived.as_array("pesos")
+
+    n_ranks = m if max_goods is None else min(max_goods, m)
+    for rank in range(n_ranks):
+        k[:] = order[:, rank]
+        _take(precios_venta, k, port, n_ports, index, precio)
+        _take(oferta_max, k, port, n_ports, index, oferta)
+        np.take(pesos, k, out=peso, mode="clip")
+
+        # Cuánto se puede comprar por capital y por bodega (inf si es gratis o no pesa)
+        by_capital.fill(np.inf)
+        np.greater(precio, 0, out=mask)
+        np.divide(capital_restante, precio, out=by_capital, where=mask)
+        by_capacity.fill(np.inf)
+        np.greater(peso, 0, out=mask)
+        np.divide(capacidad_restante, peso, out=by_capacity, where=mask)
+
+        cantidad = by_capital
+        np.minimum(by_capital, by_capacity, out=cantidad)
+        np.minimum(oferta, cantidad, out=cantidad)
+        np.floor(cantidad, out=cantidad)
+
+        # Solo mercancías comprables y cantidades positivas
+        np.less_equal(n_buyable, rank, out=skip)
+        np.less_equal(cantidad, 0, out=mask)
+        np.logical_or(skip, mask, out=skip)
+        np.copyto(cantidad, 0.0, where=skip)
+
+        np.multiply(cantidad, precio, out=by_capacity)
+        np.subtract(capital_restante, by_capacity, out=capital_restante)
+        np.multiply(cantidad, peso, out=by_capacity)
+        np.subtract(capacidad_restante, by_capacity, out=capacidad_restante)
+
+        np.add(row_start, k, out=index)
+        np.put(compras, index, cantidad)
+
+    return compras
+
+
+def simulate_routes(
+    instance: DTPInstance,
+    routes: np.ndarray,
+    purchases: Callable[..., np.ndarray] | None = None,
+    workspace: SimulationWorkspace | None = None,
+) -> BatchSimulation:
+    """Simula un lote de rutas de igual longitud registrando las operaciones.
+
+    Args:
+        instance: Instancia del problema
+        routes: Rutas completas de igual longitud (rutas × pasos), 0 ... 0
+        purchases: Mochila de cada tramo, con la firma de ``greedy_purchases``
+            sin ``max_goods`` (por defecto, ``greedy_purchases``)
+        workspace: Buffers reutilizables. Con él, los arreglos del resultado
+            son vistas que la siguiente simulación sobrescribe (copiarlos si
+            hay que conservarlos); sin él, el resultado es propio
+
+    Returns:
+        Capitales finales, factibilidad y matrices de compras/ventas por ruta
+    """
+    if workspace is None:
+        batch = simulate_routes(instance, routes, purchases, SimulationWorkspace())
+        return BatchSimulation(
+            beneficio_final=batch.beneficio_final.copy(),
+            factible=batch.factible.copy(),
+            compras=batch.compras.copy(),
+            ventas=batch.ventas.copy(),
+        )
+    if purchases is None:
+        purchases = greedy_purchases
+    routes = np.asarray(routes, dtype=np.intp)
+    if routes.ndim == 1:
+        routes = routes.reshape(1, -1)
+    _check_ports(instance, routes)
+    n_routes, n_stops = routes.shape
+    m = instance.m
+    n_ports = instance.n + 1
+    derived = instance.derived
+
+    def buffer(name: str, dtype: type = np.float64) -> np.ndarray:
+        return workspace.array(name, (n_routes,), dtype)
+
+    # Paso en el eje más externo: cada paso es un bloque contiguo
+    compras = workspace.array("compras", (n_stops, n_routes, m))
+    ventas = workspace.array("ventas", (n_stops, n_routes, m))
+    compras.fill(0.0)
+    ventas.fill(0.0)
+
+    # Estado inicial
+    capital = buffer("capital")
+    capital.fill(float(instance.capital_inicial))
+    time_accumulated = buffer("time")
+    time_accumulated.fill(0.0)
+    feasible = buffer("feasible", np.bool_)
+    feasible.fill(True)
+    ok = buffer("ok", np.bool_)
+    capacidad = buffer("capacidad")
+    capacidad.fill(float(instance.capacidad_bodega))
+    current_port = buffer("current_port", np.intp)
+    next_port = buffer("next_port", np.intp)
+    index = buffer("index", np.intp)
+    travel_cost = buffer("travel_cost")
+    travel_time = buffer("travel_time")
+    disponible = buffer("disponible")
+    precio = buffer("precio")
+    monto = buffer("monto")
+
+    precios_compra = derived.as_array("precios_compra")
+    precios_venta = derived.as_array("precios_venta")
+    costos = derived.as_array("costos")
+    tiempos = derived.as_array("tiempos")
+    k_index = buffer("k_index", np.intp)
+
+    for idx in range(n_stops - 1):
+        current_port[:] = routes[:, idx]
+        next_port[:] = routes[:, idx + 1]
+
+        # Vender todo lo que tengamos en el puerto actual (la carga es lo
+        # comprado en el paso anterior, que ya está en ``ventas[idx]``)
+        cargo = ventas[idx]
+        for k in range(m):
+            k_index.fill(k)
+            _take(precios_compra, k_index, current_port, n_ports, index, precio)
+            np.multiply(cargo[:, k], precio, out=monto)
+            np.add(capital, monto, out=capital)
+
+        # Verificar factibilidad del viaje
+        _take(costos, current_port, next_port, n_ports, index, travel_cost)
+        _take(tiempos, current_port, next_port, n_ports, index, travel_time)
+        np.add(time_accumulated, travel_time, out=time_accumulated)
+        np.greater_equal(capital, travel_cost, out=ok)
+        np.logical_and(feasible, ok, out=feasible)
+        np.less_equal(time_accumulated, instance.tiempo_maximo, out=ok)
+        np.logical_and(feasible, ok, out=feasible)
+
+        # Mochila del tramo (no comprar en el último puerto antes de Ámsterdam)
+        if idx < n_stops - 2:
+            np.subtract(capital, travel_cost, out=disponible)
+            bought = purchases(
+                instance, current_port, next_port, disponible, capacidad, workspace=workspace
+            )
+            compras[idx] = bought
+            for k in range(m):
+                k_index.fill(k)
+                _take(precios_venta, k_index, current_port, n_ports, index, precio)
+                np.multiply(compras[idx, :, k], precio, out=monto)
+                np.subtract(capital, monto, out=capital)
+            # Se vende al llegar al próximo puerto
+            ventas[idx + 1] = compras[idx]
+
+        # Viajar al siguiente puerto (descontar costo de viaje)
+        np.subtract(capital, travel_cost, out=capital)
+
+    np.logical_not(feasible, out=ok)
+    np.copyto(capital, -np.inf, where=ok)
+
+    return BatchSimulation(
+        beneficio_final=capital,
+        factible=feasible,
+        compras=compras.transpose(1, 2, 0),
+        ventas=ventas.transpose(1, 2, 0),
+    )
@@ -0,0 +1,273 @@
+"""Solver exacto por ramificación y acotación (Branch & Bound) para el DTP.
+
+A diferencia de BruteForceSolver, que solo enumera permutaciones completas y
+poda por factibilidad, este solver:
+
+- Construye rutas en profundidad eligiendo qué puertos visitar (cualquier
+  subconjunto ordenado, cerrando en Ámsterdam cuando conviene)
+- Mantiene en cada nodo la frontera exacta del DP de trading (DPTradeOptimizer)
+- Poda estados y nodos cuya cota optimista no supera a la mejor solución
+  conocida (inicializada con GreedySolver)
+"""
+
+from solver.schemas.dtp import DTPInstance, DTPSolution
+from solver.schemas.trade_table import buy_bounds
+from .dp_trades import DPTradeOptimizer, Frontier
+from .greedy import GreedySolver
+from .solver import ABCSolver, CancelToken, ProgressCallback
+
+import numpy as np
+
+
+class BranchAndBoundSolver(ABCSolver):
+    """Branch & Bound sobre rutas y trading con cotas de mochila fraccionaria.
+
+    COTA SUPERIOR de un estado (capital K, carga c) al llegar al puerto p:
+
+        K + c · mejor_precio_venta
+          + Σ cota_compra[s]  para p y los mejores k puertos restantes
+          - costo_mínimo(p → Ámsterdam)
+
+    donde:
+    - cota_compra[s] es la mochila fraccionaria (capacidad de bodega, oferta
+      de s) con ganancia unitaria "mejor precio de venta - precio en s".
+      Acota lo que se gana con todo lo comprado en s, ignorando el capital.
+    - Además, cada compra gana a lo sumo capital × mejor margen relativo, así
+      que la riqueza crece como mucho geométricamente; se usa la menor de
+      ambas cotas.
+    - k es el máximo de puertos adicionales que caben en el tiempo restante
+      (cada tramo dura al menos el menor tiempo de viaje de la instancia).
+    - costo_mínimo y tiempo_mínimo de regreso son caminos mínimos (Floyd-Warshall).
+
+    GARANTÍA:
+    - Devuelve el óptimo entre todas las rutas simples 0 → ... → 0 (no solo
+      las que visitan todos los puertos), con trading entero exacto.
+    - Si se agota el presupuesto (``time_limit``, ``node_limit`` contando
+      nodos explorados, o cancelación) devuelve el incumbente con
+      ``es_optimo = False``.
+    """
+
+    def __init__(
+        self,
+        verbose: bool = False,
+        progress_callback: ProgressCallback | None = None,
+        progress_interval: int = 100,
+        cancel_token: CancelToken | None = None,
+        time_budget: float | None = None,
+    ):
+        """Inicializa el solver.
+
+        Args:
+            verbose: Si mostrar progreso (mejoras del incumbente)
+            progress_callback: Recibe un evento "dfs_progress" cada
+                ``progress_interval`` nodos explorados (ver ABCSolver)
+            progress_interval: Nodos entre eventos
+            cancel_token: Token para cancelar el solve desde fuera
+            time_budget: Segundos de reloj máximos para el solve
+        """
+        self.verbose = verbose
+        self._configure_progress(
+            progress_callback, progress_interval, cancel_token, time_budget
+        )
+        self.nodes_explored = 0
+        self.nodes_pruned = 0
+
+    def solve(
+        self,
+        instance: DTPInstance,
+        time_limit: float | None = None,
+        node_limit: int | None = None,
+    ) -> DTPSolution:
+        """Resuelve la instancia de forma exacta (o hasta agotar el presupuesto)."""
+        n_ports = instance.n
+        optimizer = DPTradeOptimizer(instance)
+        self.nodes_explored = 0
+        self.nodes_pruned = 0
+        self._start_run(time_limit, node_limit)
+
+        # -------- Precálculo de cotas --------
+        best_sell = instance.precios_compra.max(axis=1)
+        buy_bound, return_rate = buy_bounds(instance, best_sell)
+        sp_time = self._shortest_paths(instance.tiempos)
+        sp_cost = self._shortest_paths(instance.costos)
+        off_diagonal = ~np.eye(n_ports + 1, dtype=bool)
+        min_leg_time = float(np.min(instance.tiempos[off_diagonal]))
+
+        # -------- Incumbente inicial: greedy (o quedarse en Ámsterdam) --------
+        best = self._trivial_solution(instance)
+        greedy_solution = GreedySolver().solve(instance)
+        if (
+            self._is_closed_route(instance, greedy_solution)
+            and greedy_solution.beneficio_final > best.beneficio_final
+        ):
+            best = greedy_solution
+        best_benefit = best.beneficio_final
+
+        def future_buys(port: int, time_spent: float, unvisited: set[int]) -> list[float]:
+            """Cotas de las compras que aún pueden hacerse desde ``port``."""
+            # Puertos adicionales que caben en el tiempo restante
+            slack = instance.tiempo_maximo - time_spent
+            extra_ports = len(unvisited)
+            if min_leg_time > 0:
+                extra_ports = min(extra_ports, max(0, int(slack // min_leg_time) - 1))
+
+            # Ámsterdam solo se comercia con futuro en la raíz: allí también compra
+            buy_steps = [buy_bound[port]]
+            buy_steps += sorted((buy_bound[p] for p in unvisited), reverse=True)[
+                :extra_ports
+            ]
+            return buy_steps
+
+        def upper_bounds(
+            frontier: Frontier, port: int, time_spent: float, unvisited: set[int]
+        ) -> np.ndarray:
+            """Cota optimista del capital final para cada estado al llegar a ``port``."""
+            buy_steps = future_buys(port, time_spent, unvisited)
+
+            # Cada compra gana a lo sumo su cota y a lo sumo capital × margen
+            wealth = frontier.capital + frontier.cargo @ best_sell
+            additive = wealth + sum(buy_steps)
+            geometric = wealth * (1.0 + return_rate) ** len(buy_steps)
+
+            return np.minimum(additive, geometric) - sp_cost[port, 0]
+
+        def dfs(
+            arrival: Frontier,
+            route: list[int],
+            unvisited: set[int],
+            time_spent: float,
+        ) -> None:
+            nonlocal best, best_benefit
+            if self._should_stop(self.nodes_explored):
+                return
+            self.nodes_explored += 1
+            if self.nodes_explored % self.progress_interval == 0:
+                self._emit(
+                    "dfs_progress",
+                    visited_nodes=self.nodes_explored,
+                    best_benefit=best_benefit,
+                    route=tuple(route),
+                )
+            current = route[-1]
+            step = len(route) - 1
+
+            # Durante el trading se descartan estados que, aun con la cota
+            # aditiva de compras futuras, no superan al incumbente
+            floor = (
+                best_benefit
+                + sp_cost[current, 0]
+                - sum(future_buys(current, time_spent, unvisited))
+            )
+            # Solo importa el precio de venta en los puertos aún alcanzables
+            # (``trade`` añade el de ``current`` mientras quede por vender)
+            liquidation = instance.precios_compra[:, [0, *unvisited]].max(axis=1)
+            after_trade = optimizer.trade(
+                arrival, current, step, liquidation=liquidation, wealth_floor=floor
+            )
+            if len(after_trade) == 0:
+                self.nodes_pruned += 1
+                return
+
+            # Opción 1: cerrar la ruta regresando a Ámsterdam
+            if current != 0 and time_spent + instance.tiempos[current, 0] <= instance.tiempo_maximo:
+                back = optimizer.travel(after_trade, current, 0)
+                if len(back) > 0:
+                    final = optimizer.trade(back, 0, step + 1, last=True)
+                    if final.capital[0] > best_benefit:
+                        closed_route = route + [0]
+                        best = optimizer.build_solution(closed_route, final, 0)
+                        best_benefit = best.beneficio_final
+                        if self.verbose:
+                            print(f"  Nuevo incumbente {closed_route}: ${best_benefit:.2f}")
+
+            # Opción 2: continuar hacia un puerto no visitado
+            children = []
+            for port in unvisited:
+                arrival_time = time_spent + instance.tiempos[current, port]
+                if arrival_time + sp_time[port, 0] > instance.tiempo_maximo:
+                    continue
+
+                child = optimizer.travel(after_trade, current, port)
+                if len(child) == 0:
+                    continue
+
+                remaining = unvisited - {port}
+                bounds = upper_bounds(child, port, arrival_time, remaining)
+                promising = bounds > best_benefit
+                if not np.any(promising):
+                    self.nodes_pruned += 1
+                    continue
+
+                children.append(
+                    (float(bounds.max()), port, child.subset(promising), arrival_time)
+                )
+
+            # Explorar primero los hijos más prometedores
+            children.sort(key=lambda c: c[0], reverse=True)
+            for bound, port, child, arrival_time in children:
+                if bound <= best_benefit:
+                    self.nodes_pruned += 1
+                    continue
+                # Re-podar con el incumbente actualizado
+                bounds = upper_bounds(child, port, arrival_time, unvisited - {port})
+                child = child.subset(bounds > best_benefit)
+                if len(child) == 0:
+                    self.nodes_pruned += 1
+                    continue
+                dfs(child, route + [port], unvisited - {port}, arrival_time)
+
+        dfs(optimizer.initial_frontier(), [0], set(range(1, n_ports + 1)), 0.0)
+
+        if self.verbose:
+            print(
+                f"B&B: {self.nodes_explored} nodos explorados, "
+                f"{self.nodes_pruned} podados, óptimo ${best_benefit:.2f}"
+            )
+
+        return self._finish_run(best, self.nodes_explored, optimal=True)
+
+    # -------- Cotas --------
+    @staticmethod
+    def _shortest_paths(matrix: np.ndarray) -> np.ndarray:
+        """Caminos mínimos entre todos los pares (Floyd-Warshall)."""
+        dist = matrix.astype(float).copy()
+        np.fill_diagonal(dist, 0.0)
+        for k in range(dist.shape[0]):
+            dist = np.minimum(dist, dist[:, k : k + 1] + dist[k : k + 1, :])
+        return dist
+
+    # -------- Helpers --------
+    def _is_closed_route(self, instance: DTPInstance, solution: DTPSolution) -> bool:
+        route = solution.ruta
+        return (
+            len(route) >= 2
+            and route[0] == 0
+            and route[-1] == 0
+            and self._route_time(instance, route) <= instance.tiempo_maximo
+        )
+
+    def _trivial_solution(self, instance: DTPInstance) -> DTPSolution:
+        """Quedarse en Ámsterdam sin comerciar."""
+        return DTPSolution(
+            ruta=(0, 0),
+            compras=np.zeros((instance.m, 2), dtype=float),
+            ventas=np.zeros((instance.m, 2), dtype=float),
+            beneficio_final=instance.capital_inicial,
+        )
+
+    def is_feasible(self, instance: DTPInstance, solution: DTPSolution) -> bool:
+        """Verifica si la solución es factible."""
+        if not solution.ruta or not self._is_closed_route(instance, solution):
+            return False
+
+        if solution.beneficio_final < instance.capital_minimo:
+            return False
+
+        if np.any(solution.compras < 0) or np.any(solution.ventas < 0):
+            return False
+
+        return True
+
+    def evaluate(self, instance: DTPInstance, solution: DTPSolution) -> float:
+        """Evalúa la solución y retorna el beneficio final."""
+        return solution.beneficio_final
@@ -1,11 +1,50 @@
 from solver.schemas.dtp import DTPInstance, DTPSolution
-from typing import Sequence
-from .solver import ABCSolver
+from solver.schemas.trade_table import buy_bounds
+from concurrent.futures import ProcessPoolExecutor, wait
+from typing import Iterable, Literal, Sequence
+from .dp_trades import DPTradeOptimizer
+from .solver import ABCSolver, CancelToken, ProgressCallback
 
+import copy
 import itertools
+import math
+import multiprocessing as mp
+import os
+import time
 import numpy as np
 
 
+# Estado de cada proceso trabajador (lo fija _init_shard_worker)
+_SHARD_CONTEXT: dict = {}
+
+
+def _init_shard_worker(
+    solver: "BruteForceSolver", instance: DTPInstance, shared_best, stop_event, deadline
+) -> None:
+    solver.cancel_token = CancelToken(stop_event)
+    _SHARD_CONTEXT["solver"] = solver
+    _SHARD_CONTEXT["instance"] = instance
+    _SHARD_CONTEXT["shared_best"] = shared_best
+    _SHARD_CONTEXT["deadline"] = deadline
+
+
+def _solve_shard(
+    prefix: tuple[int, ...], node_limit: int | None
+) -> tuple[DTPSolution | None, int]:
+    """Mejor solución entre las rutas que empiezan por ``prefix`` y nodos visitados."""
+    solver = _SHARD_CONTEXT["solver"]
+    instance = _SHARD_CONTEXT["instance"]
+    deadline = _SHARD_CONTEXT["deadline"]
+    time_limit = deadline - time.monotonic() if deadline is not None else None
+
+    solver.visited_nodes = 0
+    solver._start_run(time_limit, node_limit)
+    rest = [p for p in range(1, instance.n + 1) if p not in prefix]
+    perms = (prefix + tail for tail in itertools.permutations(rest))
+    best = solver._solve_routes(instance, perms, _SHARD_CONTEXT["shared_best"])
+    return best, solver.visited_nodes
+
+
 class BruteForceSolver(ABCSolver):
     """VERDADERO BRUTE-FORCE EXHAUSTIVO - Baseline teórico formal para DAA.
 
@@ -40,19 +79,144 @@ class BruteForceSolver(ABCSolver):
     - Si termina, encuentra la solución ÓPTIMA
     - Exploración exhaustiva completa del espacio de soluciones
     - Sin aproximaciones ni heurísticas
+
+    MOTORES DE TRADING (parámetro ``engine``):
+    - "exhaustive": DFS puro descrito arriba (baseline teórico, por defecto)
+    - "dp": programación dinámica sobre (paso, carga) con dominancia por
+      capital (ver ``DPTradeOptimizer``). Mismo óptimo por ruta; MICRO y TINY
+      se resuelven en milisegundos.
+
+    MODO PARALELO (parámetro ``n_jobs``):
+    - Divide las permutaciones por prefijo (primer puerto, o los primeros
+      puertos si hay más procesos que puertos) y reparte los bloques en un
+      ProcessPoolExecutor. Los bloques, en orden, recorren las rutas en el
+      mismo orden que el modo serial, y ante empates gana el primer bloque:
+      el óptimo es idéntico al serial.
+    - Los procesos comparten el mejor beneficio encontrado (multiprocessing.Value).
+      Con el motor "dp" se usa como cota: se descartan estados cuyo capital,
+      liquidando la carga al mejor precio y sumando la cota de mochila
+      fraccionaria de las compras restantes, no alcanza ese beneficio.
+      El motor "exhaustive" no poda (sigue siendo el baseline puro).
+
+    PROGRESO Y CANCELACIÓN (ver ABCSolver):
+    - "route_progress" cada ``progress_interval`` rutas evaluadas (o por bloque
+      en modo paralelo), con la mejor solución hasta el momento.
+    - "dfs_progress" cada ``progress_interval`` nodos del DFS exhaustivo (con
+      el motor "dp", tras cada ruta, contando estados del DP).
+    - Al cancelar o agotar ``time_budget`` se devuelve la mejor ruta completa
+      encontrada. En modo paralelo los procesos comparten un
+      ``multiprocessing.Event`` y el plazo absoluto: este proceso vigila el
+      token y los límites mientras espera, y al detenerse avisa a los bloques
+      en curso (que devuelven lo mejor que llevan) y descarta los pendientes.
+
+    LÍMITES POR LLAMADA: ``solve(instance, time_limit=..., node_limit=...)``.
+    ``node_limit`` cuenta nodos del DFS (o estados del DP); se verifica cada
+    256 nodos en el DFS y entre rutas con el DP. En modo paralelo se suman los
+    nodos de todos los bloques terminados, y cada bloque se detiene además al
+    alcanzar ``node_limit`` por sí solo. ``es_optimo`` es True solo si
+    se recorrieron todas las permutaciones (óptimo del modelo de rutas completas).
     """
 
-    def solve(self, instance: DTPInstance) -> DTPSolution:
-        n_ports = instance.n
+    POLL_INTERVAL = 0.05
+
+    def __init__(
+        self,
+        engine: Literal["exhaustive", "dp"] = "exhaustive",
+        n_jobs: int | None = 1,
+        progress_callback: ProgressCallback | None = None,
+        progress_interval: int = 1000,
+        cancel_token: CancelToken | None = None,
+        time_budget: float | None = None,
+    ):
+        """Inicializa el solver.
+
+        Args:
+            engine: Motor para optimizar el trading de cada ruta
+                - "exhaustive": enumeración DFS completa
+                - "dp": programación dinámica exacta
+            n_jobs: Procesos para enumerar rutas (1 = serial, None = todos los núcleos)
+            progress_callback: Función que recibe los eventos de progreso
+            progress_interval: Rutas / nodos del DFS entre eventos
+            cancel_token: Token para cancelar el solve desde fuera
+            time_budget: Segundos de reloj máximos para el solve
+        """
+        if engine not in ("exhaustive", "dp"):
+            raise ValueError(f"Motor de trading desconocido: {engine!r}")
+        if n_jobs is not None and n_jobs < 1:
+            raise ValueError(f"n_jobs debe ser positivo: {n_jobs!r}")
+        self.engine = engine
+        self.n_jobs = n_jobs
+        self._configure_progress(
+            progress_callback, progress_interval, cancel_token, time_budget
+        )
+        self.visited_nodes = 0
+        self._best_benefit = None
+
+    def solve(
+        self,
+        instance: DTPInstance,
+        time_limit: float | None = None,
+        node_limit: int | None = None,
+    ) -> DTPSolution:
+        n_jobs = self.n_jobs or os.cpu_count() or 1
+        self.visited_nodes = 0
+        self._best_benefit = None
+        self._start_run(time_limit, node_limit)
+
+        # Enumerate all routes exhaustively
+        if n_jobs > 1 and instance.n > 1:
+            best = self._solve_parallel(instance, n_jobs)
+        else:
+            best = self._solve_routes(instance, self._port_permutations(instance.n))
+
+        # If no valid solution, return trivial
+        if best is None:
+            best = DTPSolution(
+                ruta=(0, 0),
+                compras=np.zeros((instance.m, 2), dtype=float),
+                ventas=np.zeros((instance.m, 2), dtype=float),
+                beneficio_final=instance.capital_inicial,
+            )
+
+        return self._finish_run(best, self.visited_nodes, optimal=True)
+
+    def _solve_routes(
+        self,
+        instance: DTPInstance,
+        perms: Iterable[tuple[int, ...]],
+        shared_best=None,
+    ) -> DTPSolution | None:
+        """Mejor solución factible entre las permutaciones dadas (la primera ante empates).
+
+        Args:
+            instance: Instancia del problema
+            perms: Permutaciones de puertos a evaluar, en orden
+            shared_best: multiprocessing.Value con el mejor beneficio global
+                (solo en modo paralelo)
+        """
         best_benefit = -np.inf
         best = None
 
-        # Enumerate all routes exhaustively
-        for perm in self._port_permutations(n_ports):
+        optimizer = DPTradeOptimizer(instance) if self.engine == "dp" else None
+        buy_bound = None
+        if optimizer is not None and shared_best is not None:
+            best_sell = instance.precios_compra.max(axis=1)
+            buy_bound, _ = buy_bounds(instance, best_sell)
+
+        for routes_done, perm in enumerate(perms, start=1):
+            if self._should_stop(self.visited_nodes):
+                break
             route = (0, *perm, 0)
 
-            # For this route, exhaustively enumerate all trade combinations
-            candidate = self._search_trades_exhaustive(instance, route)
+            # For this route, find the best trade combination
+            if buy_bound is not None:
+                candidate = self._optimize_bounded(
+                    optimizer, instance, route, buy_bound, shared_best
+                )
+            elif optimizer is not None:
+                candidate = optimizer.optimize(route)
+            else:
+                candidate = self._search_trades_exhaustive(instance, route)
             if (
                 candidate
                 and candidate.beneficio_final > best_benefit
@@ -60,18 +224,145 @@ class BruteForceSolver(ABCSolver):
             ):
                 best = candidate
                 best_benefit = candidate.beneficio_final
+                self._publish_best(best_benefit)
+                if shared_best is not None:
+                    with shared_best.get_lock():
+                        if best_benefit > shared_best.value:
+                            shared_best.value = best_benefit
+
+            if optimizer is not None:
+                self.visited_nodes += optimizer.visited_states
+                optimizer.visited_states = 0
+                self._emit(
+                    "dfs_progress",
+                    visited_nodes=self.visited_nodes,
+                    best_benefit=self._best_benefit,
+                    route=route,
+                )
+            if routes_done % self.progress_interval == 0:
+                self._emit(
+                    "route_progress",
+                    routes_evaluated=routes_done,
+                    visited_nodes=self.visited_nodes,
+                    best_benefit=self._best_benefit,
+                    route=route,
+                )
 
-        # If no valid solution, return trivial
-        if best is None:
-            best = DTPSolution(
-                ruta=(0, 0),
-                compras=np.zeros((instance.m, 2), dtype=float),
-                ventas=np.zeros((instance.m, 2), dtype=float),
-                beneficio_final=instance.capital_inicial,
-            )
+        return best
 
+    def _publish_best(self, benefit: float) -> None:
+        if self._best_benefit is None or benefit > self._best_benefit:
+            self._best_benefit = benefit
+
+    def _solve_parallel(self, instance: DTPInstance, n_jobs: int) -> DTPSolution | None:
+        """Reparte las permutaciones por prefijo entre ``n_jobs`` procesos."""
+        ports = range(1, instance.n + 1)
+
+        # Prefijo más corto que genere al menos un bloque por proceso
+        depth = 1
+        while depth < instance.n - 1 and math.perm(instance.n, depth) < n_jobs:
+            depth += 1
+        prefixes = list(itertools.permutations(ports, depth))
+
+        # Los procesos no reportan progreso: se detienen con el evento compartido
+        # (cancelación o límites vigilados por este proceso) o con el plazo
+        worker = copy.copy(self)
+        worker._configure_progress(None, self.progress_interval, None, None)
+
+        ctx = mp.get_context()
+        shared_best = ctx.Value("d", -np.inf)
+        stop_event = ctx.Event()
+        deadline = (
+            time.monotonic() + self._time_limit - self._elapsed()
+            if self._time_limit is not None
+            else None
+        )
+        best = None
+        with ProcessPoolExecutor(
+            max_workers=min(n_jobs, len(prefixes)),
+            mp_context=ctx,
+            initializer=_init_shard_worker,
+            initargs=(worker, instance, shared_best, stop_event, deadline),
+        ) as pool:
+            futures = [
+                pool.submit(_solve_shard, prefix, self._node_limit) for prefix in prefixes
+            ]
+
+            # Mismo criterio que el modo serial: gana el primer bloque ante empates
+            for shards_done, future in enumerate(futures, start=1):
+                # Mientras se espera, vigilar la cancelación y los límites
+                while not wait([future], timeout=self.POLL_INTERVAL).done:
+                    if self._should_stop(self.visited_nodes):
+                        stop_event.set()
+                        pool.shutdown(wait=False, cancel_futures=True)
+                if future.cancelled():
+                    continue
+                candidate, visited = future.result()
+                self.visited_nodes += visited
+                if candidate is not None and (
+                    best is None or candidate.beneficio_final > best.beneficio_final
+                ):
+                    best = candidate
+                    self._publish_best(candidate.beneficio_final)
+                self._emit(
+                    "route_progress",
+                    shards_done=shards_done,
+                    shards_total=len(prefixes),
+                    visited_nodes=self.visited_nodes,
+                    best_benefit=self._best_benefit,
+                )
+                if self._should_stop(self.visited_nodes):
+                    stop_event.set()
+                    pool.shutdown(wait=False, cancel_futures=True)
         return best
 
+    def _optimize_bounded(
+        self,
+        optimizer: DPTradeOptimizer,
+        instance: DTPInstance,
+        route: Sequence[int],
+        buy_bound: np.ndarray,
+        shared_best,
+    ) -> DTPSolution | None:
+        """Igual que ``optimizer.optimize`` pero podando contra el mejor global.
+
+        Solo descarta estados que no pueden alcanzar el mejor beneficio
+        publicado; los empates se conservan para no alterar el óptimo.
+        """
+        steps = len(route)
+        arr = np.asarray(route, dtype=int)
+        legs = instance.costos[arr[:-1], arr[1:]]
+        buys = buy_bound[arr].astype(float)
+        buys[-1] = 0.0
+
+        # Lo máximo que aún puede ganarse desde cada paso, neto de viajes
+        gain_left = np.cumsum(buys[::-1])[::-1]
+        gain_left[:-1] -= np.cumsum(legs[::-1])[::-1]
+        liquidation = instance.precios_compra.max(axis=1)
+
+        time_spent = 0.0
+        frontier = optimizer.initial_frontier()
+        for idx in range(steps):
+            if idx > 0:
+                time_spent += instance.tiempos[route[idx - 1], route[idx]]
+                if time_spent > instance.tiempo_maximo:
+                    return None
+                frontier = optimizer.travel(frontier, route[idx - 1], route[idx])
+                if len(frontier) == 0:
+                    return None
+
+            if idx == steps - 1:
+                frontier = optimizer.trade(frontier, route[idx], idx, last=True)
+            else:
+                floor = shared_best.value - gain_left[idx] - 1e-9
+                frontier = optimizer.trade(
+                    frontier, route[idx], idx, liquidation=liquidation, wealth_floor=floor
+                )
+                if len(frontier) == 0:
+                    return None
+
+        return optimizer.build_solution(route, frontier, int(np.argmax(frontier.capital)))
+
     def is_feasible(self, instance: DTPInstance, solution: DTPSolution) -> bool:
         route = solution.ruta
         if not route or route[0] != 0 or route[-1] != 0:
@@ -137,6 +428,20 @@ class BruteForceSolver(ABCSolver):
             """
             nonlocal best_capital, best_compras, best_ventas
 
+            # Monitoreo: progreso y cancelación cooperativa
+            self.visited_nodes += 1
+            if self.visited_nodes % self.progress_interval == 0:
+                self._emit(
+                    "dfs_progress",
+                    visited_nodes=self.visited_nodes,
+                    best_benefit=self._best_benefit,
+                    route=tuple(route),
+                )
+            if self.interrupted or (
+                self.visited_nodes % 256 == 0 and self._should_stop(self.visited_nodes)
+            ):
+                return
+
             # Aplicar costo/tiempo del viaje anterior
             if idx > 0:
                 prev_port = route[idx - 1]
@@ -0,0 +1,163 @@
+"""Caché de evaluaciones de rutas compartida por los solvers del DTP.
+
+ACO, GA+Beam y Greedy+2-OPT evalúan la misma permutación de puertos muchas
+veces (hormigas que repiten camino, hijos idénticos a sus padres, reversiones
+que deshacen otras). La simulación completa de compras/ventas es cara, así que
+se memoiza por ruta y por política de trading.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Sequence
+
+from solver.schemas.dtp import DTPInstance
+
+
+class RouteEvaluationCache:
+    """Caché LRU de evaluaciones de rutas.
+
+    La clave es ``(policy_id, ruta)``: ``policy_id`` identifica la política de
+    trading del solver (dos solvers con políticas distintas no comparten
+    resultados) y ``ruta`` es la tupla completa de puertos, incluyendo
+    Ámsterdam al inicio y al final.
+
+    El caché está ligado a una única instancia: al consultarlo con una
+    instancia distinta (o con la misma tras modificarla, lo que renueva
+    ``instance.derived``) se vacía automáticamente. También se memoizan los
+    resultados ``None`` (rutas infactibles).
+
+    Parámetros:
+        maxsize: Número máximo de rutas almacenadas (None = sin límite)
+    """
+
+    def __init__(self, maxsize: int | None = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple[Hashable, tuple[int, ...]], Any] = (
+            OrderedDict()
+        )
+        self._instance: DTPInstance | None = None
+        self._view = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fracción de consultas resueltas desde el caché."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_or_compute(
+        self,
+        instance: DTPInstance,
+        route: Sequence[int],
+        policy_id: Hashable,
+        compute: Callable[[], Any],
+    ) -> Any:
+        """Retorna la evaluación memoizada de la ruta o la calcula con ``compute``.
+
+        Args:
+            instance: Instancia a la que pertenece la ruta
+            route: Ruta completa (0, ..., 0)
+            policy_id: Identificador de la política de trading del solver
+            compute: Función sin argumentos que evalúa la ruta si no está en caché
+
+        Returns:
+            El valor devuelto por ``compute`` (posiblemente memoizado)
+        """
+        self._bind(instance)
+        key = (policy_id, tuple(int(p) for p in route))
+
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self.misses += 1
+        value = compute()
+        self._entries[key] = value
+
+        if self.maxsize is not None and len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+        return value
+
+    def get_or_compute_many(
+        self,
+        instance: DTPInstance,
+        routes: Sequence[Sequence[int]],
+        policy_id: Hashable,
+        compute_many: Callable[[list[tuple[int, ...]]], Sequence[Any]],
+    ) -> list[Any]:
+        """Versión por lotes de ``get_or_compute``.
+
+        Las rutas no memoizadas (sin repetir) se evalúan con una sola llamada a
+        ``compute_many``. Una ruta repetida dentro del lote cuenta como acierto
+        a partir de su segunda aparición, igual que si se consultara en serie.
+
+        Args:
+            instance: Instancia a la que pertenecen las rutas
+            routes: Rutas completas (0, ..., 0)
+            policy_id: Identificador de la política de trading del solver
+            compute_many: Recibe la lista de rutas faltantes y devuelve sus
+                valores en el mismo orden
+
+        Returns:
+            Un valor por ruta, en el orden de ``routes``
+        """
+        self._bind(instance)
+        keys = [(policy_id, tuple(int(p) for p in route)) for route in routes]
+
+        values: dict[tuple[Hashable, tuple[int, ...]], Any] = {}
+        missing = []
+        for key in keys:
+            if key in values:
+                self.hits += 1
+            elif key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                values[key] = self._entries[key]
+            else:
+                self.misses += 1
+                values[key] = None
+                missing.append(key)
+
+        if missing:
+            for key, value in zip(missing, compute_many([route for _, route in missing])):
+                values[key] = value
+                self._entries[key] = value
+                if self.maxsize is not None and len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+
+        return [values[key] for key in keys]
+
+    def clear(self) -> None:
+        """Vacía el caché y reinicia los contadores."""
+        self._entries.clear()
+        self._instance = None
+        self._view = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict:
+        """Resumen de uso del caché."""
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+    def _bind(self, instance: DTPInstance) -> None:
+        """Liga el caché a la instancia; si cambia, descarta las entradas previas."""
+        if instance is not self._instance or instance.derived is not self._view:
+            self._entries.clear()
+            self._instance = instance
+            self._view = instance.derived
@@ -0,0 +1,339 @@
+"""
+ACO con varias colonias en paralelo para el Problema del Comerciante Holandés.
+
+Cada colonia es un ACOSolver que corre en su propio proceso con su propia
+matriz de feromonas. Cada ``merge_interval`` iteraciones la colonia publica
+su matriz en un bloque de memoria compartida (``SharedMemory``, sin copias
+serializadas) y reemplaza la suya por el promedio de las matrices publicadas
+por todas las colonias. La mejor solución global es la mejor de las colonias.
+"""
+
+import copy
+import multiprocessing as mp
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing.shared_memory import SharedMemory
+from typing import Literal, Optional
+
+import numpy as np
+
+from solver.models.aco import ACOSolver
+from solver.models.solver import ABCSolver, CancelToken, ProgressCallback
+from solver.models.trading import TradePolicy
+from solver.schemas.dtp import DTPInstance, DTPSolution
+
+
+class PheromoneExchange:
+    """
+    Matrices de feromonas de todas las colonias en memoria compartida.
+
+    El bloque contiene una matriz (n + 1) × (n + 1) por colonia y una marca
+    por colonia que indica si ya publicó su matriz. Se puede enviar a otros
+    procesos: al deserializarse se vuelve a adjuntar al mismo bloque.
+    Quien lo crea debe llamar a ``close`` al terminar (libera el bloque).
+    """
+
+    def __init__(self, n_colonies: int, n_ports: int, lock=None):
+        self.n_colonies = n_colonies
+        self.n_ports = n_ports
+        self._lock = lock if lock is not None else threading.Lock()
+        size = (n_colonies * (n_ports + 1) ** 2 + n_colonies) * np.dtype(float).itemsize
+        self._shm = SharedMemory(create=True, size=size)
+        self._owner = True
+        self._attach()
+        self._published[:] = 0.0
+
+    def _attach(self) -> None:
+        side = self.n_ports + 1
+        buffer = np.ndarray(
+            (self.n_colonies * side * side + self.n_colonies,), dtype=float, buffer=self._shm.buf
+        )
+        self._slots = buffer[: self.n_colonies * side * side].reshape(self.n_colonies, side, side)
+        self._published = buffer[self.n_colonies * side * side :]
+
+    def __getstate__(self) -> dict:
+        return {
+            "n_colonies": self.n_colonies,
+            "n_ports": self.n_ports,
+            "lock": self._lock,
+            "name": self._shm.name,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.n_colonies = state["n_colonies"]
+        self.n_ports = state["n_ports"]
+        self._lock = state["lock"]
+        self._shm = SharedMemory(name=state["name"])
+        self._owner = False
+        self._attach()
+
+    def merge(self, colony: int, pheromones: np.ndarray) -> None:
+        """Publica las feromonas de ``colony`` y las reemplaza por el promedio."""
+        with self._lock:
+            self._slots[colony] = pheromones
+            self._published[colony] = 1.0
+            published = self._published > 0
+            np.mean(self._slots[published], axis=0, out=pheromones)
+
+    def close(self) -> None:
+        """Libera la vista y, si este objeto creó el bloque, lo elimina."""
+        self._slots = self._published = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+# Estado de cada proceso trabajador (lo fija _init_colony_worker)
+_COLONY_CONTEXT: dict = {}
+
+
+def _init_colony_worker(
+    solver: "MultiColonyACOSolver",
+    instance: DTPInstance,
+    exchange: PheromoneExchange,
+    stop_event,
+    deadline,
+) -> None:
+    _COLONY_CONTEXT["solver"] = solver
+    _COLONY_CONTEXT["instance"] = instance
+    _COLONY_CONTEXT["exchange"] = exchange
+    _COLONY_CONTEXT["stop"] = CancelToken(stop_event)
+    _COLONY_CONTEXT["deadline"] = deadline
+
+
+def _run_colony_in_worker(index: int) -> tuple[Optional[DTPSolution], int]:
+    """Ejecuta la colonia ``index`` con el contexto del proceso."""
+    return _COLONY_CONTEXT["solver"]._run_colony(
+        _COLONY_CONTEXT["instance"],
+        index,
+        _COLONY_CONTEXT["exchange"],
+        _COLONY_CONTEXT["stop"],
+        _COLONY_CONTEXT["deadline"],
+    )
+
+
+class MultiColonyACOSolver(ABCSolver):
+    """
+    Varias colonias de ACOSolver con feromonas combinadas periódicamente.
+
+    - Cada colonia usa la semilla ``seed + índice`` y corre en su propio proceso
+    - Cada ``merge_interval`` iteraciones publica su matriz de feromonas en la
+      memoria compartida y adopta el promedio de las matrices publicadas
+    - La mejor solución global es la mejor de todas las colonias (ante
+      empates, la de menor índice)
+
+    Con ``n_jobs=1`` las colonias se ejecutan una tras otra en este proceso
+    (cada una combina sus feromonas con las de las anteriores) y el resultado
+    es reproducible.
+
+    Parámetros:
+        n_colonies: Número de colonias
+        merge_interval: Iteraciones entre combinaciones de feromonas
+        n_jobs: Procesos (None = uno por colonia, hasta el número de núcleos)
+        seed: Semilla base
+        n_ants, n_iterations, alpha, beta, evaporation_rate, q,
+        subset_routes, n_candidates, knapsack, trade_policy:
+            Configuración de cada colonia (ver ACOSolver)
+        progress_callback: Recibe un evento "iteration" por colonia terminada
+        progress_interval: Colonias entre eventos
+        cancel_token: Token para cancelar el solve desde fuera
+        time_budget: Segundos de reloj máximos para el solve
+    """
+
+    # Segundos entre chequeos de cancelación mientras se esperan las colonias
+    POLL_INTERVAL = 0.05
+
+    def __init__(
+        self,
+        n_colonies: int = 4,
+        merge_interval: int = 5,
+        n_jobs: Optional[int] = None,
+        seed: int = 0,
+        n_ants: int = 10,
+        n_iterations: int = 50,
+        alpha: float = 1.0,
+        beta: float = 2.0,
+        evaporation_rate: float = 0.5,
+        q: float = 100.0,
+        subset_routes: bool = True,
+        n_candidates: Optional[int] = None,
+        knapsack: Literal["greedy", "exact"] = "greedy",
+        trade_policy: Optional[TradePolicy] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        progress_interval: int = 1,
+        cancel_token: Optional[CancelToken] = None,
+        time_budget: Optional[float] = None,
+    ):
+        if n_colonies < 1:
+            raise ValueError(f"n_colonies debe ser positivo: {n_colonies!r}")
+        if merge_interval < 1:
+            raise ValueError(f"merge_interval debe ser positivo: {merge_interval!r}")
+        if n_jobs is not None and n_jobs < 1:
+            raise ValueError(f"n_jobs debe ser positivo: {n_jobs!r}")
+        self.n_colonies = n_colonies
+        self.merge_interval = merge_interval
+        self.n_jobs = n_jobs
+        self.seed = seed
+        self.n_ants = n_ants
+        self.n_iterations = n_iterations
+        self.alpha = alpha
+        self.beta = beta
+        self.evaporation_rate = evaporation_rate
+        self.q = q
+        self.subset_routes = subset_routes
+        self.n_candidates = n_candidates
+        self.knapsack = knapsack
+        self.trade_policy = trade_policy
+        self._configure_progress(
+            progress_callback, progress_interval, cancel_token, time_budget
+        )
+        self.visited_nodes = 0
+
+    def solve(
+        self,
+        instance: DTPInstance,
+        time_limit: Optional[float] = None,
+        node_limit: Optional[int] = None,
+    ) -> DTPSolution:
+        """
+        Ejecuta todas las colonias y devuelve la mejor solución.
+
+        Args:
+            instance: Instancia del problema DTP
+            time_limit: Segundos de reloj para esta llamada (plazo común a
+                todas las colonias)
+            node_limit: Máximo de rutas evaluadas (se verifica entre colonias)
+
+        Raises:
+            ValueError: Si ninguna colonia encuentra una solución factible.
+        """
+        self._start_run(time_limit, node_limit)
+        self.visited_nodes = 0
+        n_jobs = min(self.n_jobs or os.cpu_count() or 1, self.n_colonies)
+
+        deadline = (
+            time.monotonic() + self._time_limit if self._time_limit is not None else None
+        )
+        lock = mp.get_context().Lock() if n_jobs > 1 else None
+        exchange = PheromoneExchange(self.n_colonies, instance.n, lock)
+
+        best: Optional[DTPSolution] = None
+        try:
+            for index, (solution, evaluated) in enumerate(
+                self._run_colonies(instance, n_jobs, exchange, deadline)
+            ):
+                self.visited_nodes += evaluated
+                if solution is not None and (
+                    best is None or solution.beneficio_final > best.beneficio_final
+                ):
+                    best = solution
+
+                if (index + 1) % self.progress_interval == 0:
+                    self._emit(
+                        "iteration",
+                        iteration=index + 1,
+                        visited_nodes=self.visited_nodes,
+                        best_benefit=best.beneficio_final if best else None,
+                    )
+                self._should_stop(self.visited_nodes)
+        finally:
+            exchange.close()
+
+        if best is None:
+            if not self.interrupted:
+                raise ValueError("No se encontró una solución factible para la instancia dada.")
+            best = self._make_colony(None)._build_trivial_solution(instance)
+        return self._finish_run(best, self.visited_nodes)
+
+    def _run_colonies(
+        self,
+        instance: DTPInstance,
+        n_jobs: int,
+        exchange: PheromoneExchange,
+        deadline: Optional[float],
+    ):
+        """Resultados ``(mejor solución, rutas evaluadas)`` de cada colonia, en orden."""
+        if n_jobs == 1:
+            stop = self.cancel_token or CancelToken()
+            for index in range(self.n_colonies):
+                if self._should_stop(self.visited_nodes):
+                    return
+                yield self._run_colony(instance, index, exchange, stop, deadline)
+            return
+
+        ctx = mp.get_context()
+        stop_event = ctx.Event()
+
+        # Los procesos no reportan progreso ni se cancelan: lo hace este proceso
+        worker = copy.copy(self)
+        worker._configure_progress(None, self.progress_interval, None, None)
+
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            mp_context=ctx,
+            initializer=_init_colony_worker,
+            initargs=(worker, instance, exchange, stop_event, deadline),
+        ) as pool:
+            futures = [pool.submit(_run_colony_in_worker, i) for i in range(self.n_colonies)]
+            for future in futures:
+                # Mientras se espera, vigilar la cancelación y el plazo
+                while not wait([future], timeout=self.POLL_INTERVAL).done:
+                    if self._should_stop(self.visited_nodes):
+                        stop_event.set()
+                        for pending in futures:
+                            pending.cancel()
+                if not future.cancelled():
+                    yield future.result()
+
+    def _make_colony(self, stop: Optional[CancelToken]) -> ACOSolver:
+        return ACOSolver(
+            n_ants=self.n_ants,
+            n_iterations=self.n_iterations,
+            alpha=self.alpha,
+            beta=self.beta,
+            evaporation_rate=self.evaporation_rate,
+            q=self.q,
+            subset_routes=self.subset_routes,
+            n_candidates=self.n_candidates,
+            knapsack=self.knapsack,
+            trade_policy=self.trade_policy,
+            cancel_token=stop,
+        )
+
+    def _run_colony(
+        self,
+        instance: DTPInstance,
+        index: int,
+        exchange: PheromoneExchange,
+        stop: CancelToken,
+        deadline: Optional[float],
+    ) -> tuple[Optional[DTPSolution], int]:
+        """Ejecuta una colonia, combinando sus feromonas cada ``merge_interval``."""
+        time_limit = None
+        if deadline is not None:
+            time_limit = deadline - time.monotonic()
+            if time_limit <= 0:
+                return None, 0
+
+        # Generador propio: en serie no se toca el estado global de ``np.random``
+        rng = np.random.RandomState(self.seed + index)
+        aco = self._make_colony(stop)
+
+        def merge(iteration: int, pheromones: np.ndarray) -> bool:
+            if iteration % self.merge_interval:
+                return False
+            exchange.merge(index, pheromones)
+            return True
+
+        aco._start_run(time_limit)
+        return aco._run_colony(instance, merge, rng)
+
+    def is_feasible(self, instance: DTPInstance, solution: DTPSolution) -> bool:
+        """Verifica factibilidad de la solución."""
+        return self._make_colony(None).is_feasible(instance, solution)
+
+    def evaluate(self, instance: DTPInstance, solution: DTPSolution) -> float:
+        """Evalúa la solución."""
+        return solution.beneficio_final
@@ -0,0 +1,309 @@
+"""Optimizador exacto de compras/ventas para una ruta fija del DTP.
+
+Programación dinámica sobre estados (paso, vector de carga): dos estados en el
+mismo paso con la misma carga solo difieren en el capital, y el de mayor
+capital domina al otro (todo lo que puede hacer el pobre lo puede hacer el
+rico). Por eso basta guardar, para cada carga posible, el mejor capital.
+
+Las decisiones en un puerto se procesan mercancía por mercancía (primero todas
+las ventas, luego todas las compras), fusionando estados dominados entre cada
+mercancía. Así el costo por puerto es O(estados × m × cantidad máxima) en lugar
+del producto cartesiano O(cantidad máxima^m) que enumera la fuerza bruta. Cada
+fase se ejecuta vectorizada sobre toda la frontera con numpy.
+
+Las restricciones son las mismas que en BruteForceSolver._search_trades_exhaustive:
+cantidades enteras, oferta por puerto, capacidad de bodega, capital no negativo
+tras comprar y al llegar a cada puerto, y tiempo máximo de la ruta.
+"""
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from solver.schemas.dtp import DTPInstance, DTPSolution
+
+
+@dataclass(slots=True)
+class Frontier:
+    """Conjunto de estados no dominados del DP en un punto de la ruta.
+
+    Atributos:
+        cargo: Carga de cada estado (estados × mercancías, enteros)
+        capital: Capital de cada estado
+        parent: Índice del estado origen en ``previous`` (-1 si no hay)
+        previous: Frontera post-trading del paso anterior
+        step: Posición en la ruta donde se comerció (-1 si es frontera de llegada)
+        ventas: Ventas realizadas en ``step`` por cada estado
+        compras: Compras realizadas en ``step`` por cada estado
+    """
+
+    cargo: np.ndarray
+    capital: np.ndarray
+    parent: np.ndarray
+    previous: "Frontier | None" = None
+    step: int = -1
+    ventas: np.ndarray | None = None
+    compras: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return self.capital.shape[0]
+
+    def subset(self, keep: np.ndarray) -> "Frontier":
+        """Frontera con solo los estados indicados (índices o máscara)."""
+        return Frontier(
+            cargo=self.cargo[keep],
+            capital=self.capital[keep],
+            parent=self.parent[keep],
+            previous=self.previous,
+            step=self.step,
+            ventas=self.ventas[keep] if self.ventas is not None else None,
+            compras=self.compras[keep] if self.compras is not None else None,
+        )
+
+
+class DPTradeOptimizer:
+    """Calcula el trading óptimo de una ruta fija mediante DP con dominancia.
+
+    Uso típico::
+
+        optimizer = DPTradeOptimizer(instance)
+        solution = optimizer.optimize((0, 2, 1, 0))
+
+    También expone los pasos del DP (``initial_frontier``, ``trade``,
+    ``travel``) para solvers que construyen la ruta incrementalmente.
+    """
+
+    def __init__(self, instance: DTPInstance):
+        self.instance = instance
+        self.m = instance.m
+        # Perspectiva del comerciante: compra a precios_venta, vende a precios_compra
+        self._buy_price = instance.precios_venta
+        self._sell_price = instance.precios_compra
+        self._offer = np.floor(instance.oferta_max).astype(np.int64)
+        self._weights = instance.pesos.astype(float)
+        self._capacity = float(instance.capacidad_bodega)
+        # Comprar k a un precio >= al mejor precio de venta nunca mejora el capital
+        self._best_sell = instance.precios_compra.max(axis=1)
+
+        # Codificación de cada vector de carga en un entero (base mixta)
+        max_units = np.floor(self._capacity / self._weights + 1e-9).astype(np.int64)
+        radix = max_units + 1
+        if np.prod(radix.astype(float)) < 2**62:
+            self._strides = np.concatenate(([1], np.cumprod(radix[:-1]))).astype(
+                np.int64
+            )
+        else:
+            self._strides = None
+
+        self.visited_states = 0
+
+    # -------- Pasos del DP --------
+    def initial_frontier(self) -> Frontier:
+        """Frontera inicial: en Ámsterdam, sin carga y con el capital inicial."""
+        return Frontier(
+            cargo=np.zeros((1, self.m), dtype=np.int64),
+            capital=np.array([float(self.instance.capital_inicial)]),
+            parent=np.array([-1], dtype=np.int64),
+        )
+
+    def trade(
+        self,
+        frontier: Frontier,
+        port: int,
+        step: int,
+        last: bool = False,
+        liquidation: np.ndarray | None = None,
+        wealth_floor: float = -np.inf,
+    ) -> Frontier:
+        """Aplica todas las ventas/compras posibles en ``port``.
+
+        Args:
+            frontier: Estados al llegar al puerto (resultado de ``travel`` o inicial)
+            port: Puerto donde se comercia
+            step: Posición del puerto en la ruta (para reconstruir la solución)
+            last: Si es el último puerto de la ruta. Allí comprar nunca mejora
+                el capital final y vender todo domina cualquier venta parcial.
+            liquidation: Precio optimista de cada mercancía en carga en los
+                puertos siguientes (por defecto, el mejor precio de venta de la
+                instancia). Solo se compran mercancías con precio menor que su
+                liquidación, y junto con ``wealth_floor`` permite descartar,
+                entre fase y fase, los estados con capital + carga · liquidation
+                <= wealth_floor. Durante las ventas la carga aún puede venderse
+                en ``port``, así que allí se valora con el mayor de ambos precios.
+            wealth_floor: Umbral de poda (solo si se pasa ``liquidation``)
+
+        Returns:
+            Estados después de comerciar
+        """
+        m = self.m
+        sell_price = self._sell_price[:, port]
+        prune = liquidation is not None
+        if liquidation is None:
+            liquidation = self._best_sell
+        # Lo que queda por vender de la carga aún vale al menos su precio aquí
+        sell_liquidation = np.maximum(liquidation, sell_price)
+
+        if last:
+            capital = frontier.capital + frontier.cargo @ sell_price
+            best = int(np.argmax(capital))
+            self.visited_states += len(frontier)
+            return Frontier(
+                cargo=np.zeros((1, m), dtype=np.int64),
+                capital=capital[best : best + 1],
+                parent=frontier.parent[best : best + 1],
+                previous=frontier.previous,
+                step=step,
+                ventas=frontier.cargo[best : best + 1].copy(),
+                compras=np.zeros((1, m), dtype=np.int64),
+            )
+
+        cargo = frontier.cargo
+        capital = frontier.capital
+        parent = frontier.parent
+        ventas = np.zeros_like(cargo)
+        compras = np.zeros_like(cargo)
+
+        # 1. VENTAS: para cada mercancía, vender q ∈ [0, carga[k]]
+        for k in range(m):
+            rows, q = self._expand(cargo[:, k])
+            cargo = cargo[rows]
+            cargo[:, k] -= q
+            capital = capital[rows] + q * sell_price[k]
+            parent, ventas, compras = parent[rows], ventas[rows], compras[rows]
+            ventas[:, k] = q
+            keep = self._dominance(cargo, capital)
+            if prune:
+                wealth = capital[keep] + cargo[keep] @ sell_liquidation
+                keep = keep[wealth > wealth_floor]
+            cargo, capital = cargo[keep], capital[keep]
+            parent, ventas, compras = parent[keep], ventas[keep], compras[keep]
+
+        # 2. COMPRAS: para cada mercancía, comprar q ∈ [0, máximo factible]
+        for k in range(m):
+            price = self._buy_price[k, port]
+            if price >= liquidation[k]:
+                continue
+            weight = self._weights[k]
+            free = self._capacity - cargo @ self._weights
+
+            bound = np.full(capital.shape[0], self._offer[k, port], dtype=np.int64)
+            if weight > 0:
+                bound = np.minimum(bound, np.floor((free + 1e-9) / weight) + 1)
+            if price > 0:
+                bound = np.minimum(bound, np.floor(capital / price) + 1)
+            bound = np.maximum(bound, 0).astype(np.int64)
+
+            rows, q = self._expand(bound)
+            new_capital = capital[rows] - q * price
+            feasible = (new_capital >= 0) & (q * weight <= free[rows] + 1e-9)
+            rows, q, new_capital = rows[feasible], q[feasible], new_capital[feasible]
+
+            cargo = cargo[rows]
+            cargo[:, k] += q
+            capital = new_capital
+            parent, ventas, compras = parent[rows], ventas[rows], compras[rows]
+            compras[:, k] = q
+            keep = self._dominance(cargo, capital)
+            if prune:
+                wealth = capital[keep] + cargo[keep] @ liquidation
+                keep = keep[wealth > wealth_floor]
+            cargo, capital = cargo[keep], capital[keep]
+            parent, ventas, compras = parent[keep], ventas[keep], compras[keep]
+
+        return Frontier(
+            cargo=cargo,
+            capital=capital,
+            parent=parent,
+            previous=frontier.previous,
+            step=step,
+            ventas=ventas,
+            compras=compras,
+        )
+
+    def travel(self, frontier: Frontier, from_port: int, to_port: int) -> Frontier:
+        """Descuenta el costo del viaje y descarta estados con capital negativo."""
+        capital = frontier.capital - self.instance.costos[from_port, to_port]
+        keep = np.flatnonzero(capital >= 0)
+        return Frontier(
+            cargo=frontier.cargo[keep],
+            capital=capital[keep],
+            parent=keep,
+            previous=frontier,
+        )
+
+    # -------- Ruta completa --------
+    def optimize(self, route: Sequence[int]) -> DTPSolution | None:
+        """Trading óptimo para la ruta dada.
+
+        Returns:
+            La solución de mayor capital final, o None si la ruta es infactible
+        """
+        instance = self.instance
+        steps = len(route)
+        time_spent = 0.0
+
+        frontier = self.initial_frontier()
+        for idx in range(steps):
+            if idx > 0:
+                time_spent += instance.tiempos[route[idx - 1], route[idx]]
+                if time_spent > instance.tiempo_maximo:
+                    return None
+                frontier = self.travel(frontier, route[idx - 1], route[idx])
+                if len(frontier) == 0:
+                    return None
+            frontier = self.trade(frontier, route[idx], idx, last=idx == steps - 1)
+
+        return self.build_solution(route, frontier, int(np.argmax(frontier.capital)))
+
+    def build_solution(
+        self, route: Sequence[int], frontier: Frontier, index: int
+    ) -> DTPSolution:
+        """Reconstruye las matrices de compras/ventas siguiendo los punteros."""
+        steps = len(route)
+        compras = np.zeros((self.m, steps), dtype=float)
+        ventas = np.zeros((self.m, steps), dtype=float)
+
+        final_capital = float(frontier.capital[index])
+        node: Frontier | None = frontier
+        while node is not None and index >= 0:
+            if node.step >= 0:
+                compras[:, node.step] = node.compras[index]
+                ventas[:, node.step] = node.ventas[index]
+            index = int(node.parent[index])
+            node = node.previous
+
+        return DTPSolution(
+            ruta=tuple(route),
+            compras=compras,
+            ventas=ventas,
+            beneficio_final=final_capital,
+        )
+
+    # -------- Helpers --------
+    def _expand(self, counts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Repite cada estado i para q = 0..counts[i] (inclusive).
+
+        Returns:
+            (índice del estado origen, cantidad q) para cada fila expandida
+        """
+        reps = counts.astype(np.int64) + 1
+        rows = np.repeat(np.arange(reps.shape[0]), reps)
+        offsets = np.cumsum(reps) - reps
+        q = np.arange(rows.shape[0], dtype=np.int64) - offsets[rows]
+        self.visited_states += rows.shape[0]
+        return rows, q
+
+    def _dominance(self, cargo: np.ndarray, capital: np.ndarray) -> np.ndarray:
+        """Índices de los estados no dominados: el mayor capital por cada carga."""
+        if self._strides is not None:
+            keys = cargo @ self._strides
+        else:
+            _, keys = np.unique(cargo, axis=0, return_inverse=True)
+            keys = keys.ravel()
+
+        order = np.lexsort((-capital, keys))
+        sorted_keys = keys[order]
+        first = np.ones(order.shape[0], dtype=bool)
+        first[1:] = sorted_keys[1:] != sorted_keys[:-1]
+        return order[first]
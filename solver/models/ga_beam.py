@@ -7,12 +7,32 @@ Este solver utiliza:
 """
 
 import numpy as np
-from typing import Optional, List, Tuple
-from solver.models.solver import ABCSolver
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional, List, Tuple
+from solver.models.cache import RouteEvaluationCache
+from solver.models.solver import ABCSolver, CancelToken, ProgressCallback
 from solver.schemas.dtp import DTPInstance, DTPSolution
+from solver.models.trading import BeamTrading, TradePolicy
+import copy
+import multiprocessing as mp
+import os
 import random
 
 
+# Estado de cada proceso trabajador del fitness (lo fija _init_fitness_worker)
+_FITNESS_CONTEXT: dict = {}
+
+
+def _init_fitness_worker(solver: "GABeamSolver", instance: DTPInstance) -> None:
+    _FITNESS_CONTEXT["solver"] = solver
+    _FITNESS_CONTEXT["instance"] = instance
+
+
+def _simulate_in_worker(route: Tuple[int, ...]) -> Optional[Tuple[DTPSolution, float]]:
+    """Fitness de una ruta completa con el solver y la instancia del proceso."""
+    return _FITNESS_CONTEXT["solver"]._simulate_route(_FITNESS_CONTEXT["instance"], list(route))
+
+
 class GABeamSolver(ABCSolver):
     """
     Solver híbrido GA + Beam Search.
@@ -23,13 +43,35 @@ class GABeamSolver(ABCSolver):
     Parámetros:
         population_size: Tamaño de la población de rutas
         n_generations: Número de generaciones a evolucionar
-        beam_width: Número de estados a mantener en beam search
+        beam_width: Número de estados a mantener en beam search (el beam es
+            vectorizado: anchos de 50 a 200 siguen siendo baratos)
+        trade_policy: Política de trading con la que se evalúa cada ruta
+            (None = ``BeamTrading(beam_width)``)
         crossover_rate: Probabilidad de crossover (default: 0.8)
         mutation_rate: Probabilidad de mutación (default: 0.2)
         tournament_size: Tamaño del torneo para selección (default: 3)
         elitism: Mantener mejores individuos sin modificar (default: 2)
+        subset_routes: Si es True, cada individuo (permutación de todos los
+            puertos) se decodifica en la ruta que recorre la permutación y
+            omite los puertos desde los que ya no se podría volver a Ámsterdam
+            a tiempo; así toda ruta evaluada cumple el tiempo máximo. Si es
+            False, la ruta visita todos los puertos y se descarta si excede el
+            tiempo (default: True)
+        n_jobs: Procesos para evaluar el fitness de cada generación (1 = serial,
+            None = todos los núcleos). Los hijos se generan en el mismo orden
+            y con los mismos números aleatorios que en serie, así que para una
+            semilla dada el resultado no depende de ``n_jobs``
+        cache: Caché de evaluaciones de rutas (compartible con otros solvers)
+        progress_callback: Recibe un evento "iteration" cada ``progress_interval``
+            generaciones (ver ABCSolver)
+        progress_interval: Generaciones entre eventos
+        cancel_token: Token para cancelar el solve desde fuera
+        time_budget: Segundos de reloj máximos para el solve
     """
 
+    # Hijos que se intentan generar por lugar de la población en cada generación
+    MAX_ATTEMPTS_PER_SLOT = 10
+
     def __init__(
         self,
         population_size: int = 50,
@@ -39,6 +81,14 @@ class GABeamSolver(ABCSolver):
         mutation_rate: float = 0.2,
         tournament_size: int = 3,
         elitism: int = 2,
+        subset_routes: bool = True,
+        n_jobs: Optional[int] = 1,
+        trade_policy: Optional[TradePolicy] = None,
+        cache: Optional[RouteEvaluationCache] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        progress_interval: int = 1,
+        cancel_token: Optional[CancelToken] = None,
+        time_budget: Optional[float] = None,
     ):
         self.population_size = population_size
         self.n_generations = n_generations
@@ -47,18 +97,79 @@ class GABeamSolver(ABCSolver):
         self.mutation_rate = mutation_rate
         self.tournament_size = tournament_size
         self.elitism = elitism
+        self.subset_routes = subset_routes
+        if n_jobs is not None and n_jobs < 1:
+            raise ValueError(f"n_jobs debe ser positivo: {n_jobs!r}")
+        self.n_jobs = n_jobs
+        self.trade_policy = (
+            trade_policy if trade_policy is not None else BeamTrading(beam_width)
+        )
+        self.cache = cache if cache is not None else RouteEvaluationCache()
+        self._configure_progress(
+            progress_callback, progress_interval, cancel_token, time_budget
+        )
 
-    def solve(self, instance: DTPInstance) -> DTPSolution:
+    @property
+    def policy_id(self) -> str:
+        """Identificador de la política de trading."""
+        return f"ga_beam:{self.trade_policy.policy_id}"
+
+    def solve(
+        self,
+        instance: DTPInstance,
+        time_limit: Optional[float] = None,
+        node_limit: Optional[int] = None,
+    ) -> DTPSolution:
         """
         Resuelve la instancia usando Genetic Algorithm (GA) para routing y Beam Search para trading.
+
+        Args:
+            instance: Instancia del problema DTP
+            time_limit: Segundos de reloj para esta llamada
+            node_limit: Máximo de rutas evaluadas (se verifica por generación)
+        """
+        self._start_run(time_limit, node_limit)
+        pool = self._make_pool(instance)
+        try:
+            best_solution, routes_evaluated = self._evolve(instance, pool)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        # Si no se encontró solución, retornar trivial
+        if best_solution is None:
+            best_solution = self._build_trivial_solution(instance)
+
+        return self._finish_run(best_solution, routes_evaluated)
+
+    def _evolve(
+        self,
+        instance: DTPInstance,
+        pool: Optional[ProcessPoolExecutor],
+        on_generation: Optional[Callable[[int, List[List[int]], List], None]] = None,
+        rng: random.Random = random,
+    ) -> Tuple[Optional[DTPSolution], int]:
+        """
+        Ciclo del GA; devuelve la mejor solución y las rutas evaluadas.
+
+        Args:
+            on_generation: Se llama tras cada generación con (generación,
+                población, fitness); puede modificar ambas listas en el lugar
+                (p. ej. para la migración del modelo de islas)
+            rng: Generador aleatorio de los operadores (por defecto, el
+                módulo ``random``, que se siembra con ``random.seed``)
         """
         n = instance.tiempos.shape[0] - 1  # Número de puertos (sin Ámsterdam)
 
         # Inicializar población de rutas
-        population = self._initialize_population(n)
+        population = self._initialize_population(n, rng)
 
         # Evaluar población inicial
-        fitness_scores = [self._evaluate_route(instance, route) for route in population]
+        if pool is not None:
+            fitness_scores = self._evaluate_routes(instance, population, pool)
+        else:
+            fitness_scores = [self._evaluate_route(instance, route) for route in population]
+        routes_evaluated = len(population)
 
         # Mejor solución global
         best_idx = np.argmax(
@@ -77,6 +188,9 @@ class GABeamSolver(ABCSolver):
 
         # Evolución
         for generation in range(self.n_generations):
+            if self._should_stop(routes_evaluated):
+                break
+
             # Nueva población
             new_population = []
             new_fitness = []
@@ -98,297 +212,213 @@ class GABeamSolver(ABCSolver):
                         new_population.append(population[idx][:])
                         new_fitness.append(fitness_scores[idx])
 
-            # Generar resto de la población
-            while len(new_population) < self.population_size:
-                # Selección
-                parent1 = self._tournament_selection(population, fitness_scores)
-                parent2 = self._tournament_selection(population, fitness_scores)
-
-                # Crossover
-                if random.random() < self.crossover_rate:
-                    child1, child2 = self._ordered_crossover(parent1, parent2)
-                else:
-                    child1, child2 = parent1[:], parent2[:]
-
-                # Mutación
-                if random.random() < self.mutation_rate:
-                    child1 = self._swap_mutation(child1)
-                if random.random() < self.mutation_rate:
-                    child2 = self._swap_mutation(child2)
-
-                # Evaluar hijos
-                result1 = self._evaluate_route(instance, child1)
-                if result1 is not None:
-                    new_population.append(child1)
-                    new_fitness.append(result1)
-
-                    # Actualizar mejor solución
-                    if result1[1] > best_fitness:
-                        best_solution = result1[0]
-                        best_fitness = result1[1]
-
-                if len(new_population) < self.population_size:
-                    result2 = self._evaluate_route(instance, child2)
-                    if result2 is not None:
-                        new_population.append(child2)
-                        new_fitness.append(result2)
-
-                        # Actualizar mejor solución
-                        if result2[1] > best_fitness:
-                            best_solution = result2[0]
-                            best_fitness = result2[1]
-
-            # Actualizar población
-            population = new_population[: self.population_size]
-            fitness_scores = new_fitness[: self.population_size]
+            # Generar resto de la población (con un tope de intentos, por si
+            # casi todos los hijos resultan infactibles)
+            attempts = 0
+            max_attempts = self.MAX_ATTEMPTS_PER_SLOT * self.population_size
+            while len(new_population) < self.population_size and attempts < max_attempts:
+                # Parejas de hijos que seguro se generarían en serie: cada pareja
+                # agrega a lo sumo dos individuos, así que ninguna sobra
+                missing = self.population_size - len(new_population)
+                n_pairs = min((missing + 1) // 2, max_attempts - attempts)
+                attempts += n_pairs
+                pairs = [
+                    self._make_children(population, fitness_scores, rng)
+                    for _ in range(n_pairs)
+                ]
+
+                # Con pool, todos los hijos del lote se evalúan en paralelo
+                results = (
+                    self._evaluate_routes(instance, [c for pair in pairs for c in pair], pool)
+                    if pool is not None
+                    else None
+                )
 
-        # Si no se encontró solución, retornar trivial
-        if best_solution is None:
-            return self._build_trivial_solution(instance)
+                for p, pair in enumerate(pairs):
+                    for c, child in enumerate(pair):
+                        # El segundo hijo solo se evalúa si aún hay lugar
+                        if c == 1 and len(new_population) >= self.population_size:
+                            break
+
+                        # Evaluar hijo
+                        result = (
+                            results[2 * p + c]
+                            if results is not None
+                            else self._evaluate_route(instance, child)
+                        )
+                        routes_evaluated += 1
+                        if result is not None:
+                            new_population.append(child)
+                            new_fitness.append(result)
+
+                            # Actualizar mejor solución
+                            if result[1] > best_fitness:
+                                best_solution = result[0]
+                                best_fitness = result[1]
+
+            # Actualizar población (si no hubo ningún hijo factible, conservar la anterior)
+            if new_population:
+                population = new_population[: self.population_size]
+                fitness_scores = new_fitness[: self.population_size]
+
+            if on_generation is not None:
+                on_generation(generation + 1, population, fitness_scores)
+
+            if (generation + 1) % self.progress_interval == 0:
+                self._emit(
+                    "iteration",
+                    iteration=generation + 1,
+                    visited_nodes=routes_evaluated,
+                    best_benefit=best_fitness if best_solution is not None else None,
+                )
 
-        return best_solution
+        return best_solution, routes_evaluated
 
-    def _initialize_population(self, n: int) -> List[List[int]]:
+    def _initialize_population(
+        self, n: int, rng: random.Random = random
+    ) -> List[List[int]]:
         """Genera población inicial de rutas aleatorias."""
         population = []
         ports = list(range(1, n + 1))
 
         for _ in range(self.population_size):
             route = ports[:]
-            random.shuffle(route)
+            rng.shuffle(route)
             population.append(route)
 
         return population
 
-    def _evaluate_route(
-        self, instance: DTPInstance, route_ports: List[int]
-    ) -> Optional[Tuple[DTPSolution, float]]:
-        """
-        Evalúa una ruta usando Beam Search para optimizar trading.
-
-        Returns:
-            (DTPSolution, fitness) o None si la ruta no es factible
-        """
-        # Construir ruta completa: 0 -> ports -> 0
-        route = [0] + route_ports + [0]
-
-        # Verificar factibilidad de tiempo
-        total_time = sum(
-            instance.tiempos[route[i], route[i + 1]] for i in range(len(route) - 1)
-        )
-        if total_time > instance.tiempo_maximo:
-            return None
-
-        # Aplicar Beam Search para encontrar mejor estrategia de trading
-        solution = self._beam_search_trading(instance, route)
-
-        if solution is None:
-            return None
+    def _make_children(
+        self,
+        population: List[List[int]],
+        fitness_scores: List[Optional[Tuple[DTPSolution, float]]],
+        rng: random.Random = random,
+    ) -> Tuple[List[int], List[int]]:
+        """Selecciona dos padres y genera dos hijos (crossover + mutación)."""
+        # Selección
+        parent1 = self._tournament_selection(population, fitness_scores, rng)
+        parent2 = self._tournament_selection(population, fitness_scores, rng)
+
+        # Crossover
+        if rng.random() < self.crossover_rate:
+            child1, child2 = self._ordered_crossover(parent1, parent2, rng)
+        else:
+            child1, child2 = parent1[:], parent2[:]
+
+        # Mutación
+        if rng.random() < self.mutation_rate:
+            child1 = self._swap_mutation(child1, rng)
+        if rng.random() < self.mutation_rate:
+            child2 = self._swap_mutation(child2, rng)
 
-        return (solution, solution.beneficio_final)
+        return child1, child2
 
-    def _beam_search_trading(
-        self, instance: DTPInstance, route: List[int]
-    ) -> Optional[DTPSolution]:
-        """
-        Beam Search para optimizar trading en una ruta dada.
+    def _make_pool(self, instance: DTPInstance) -> Optional[ProcessPoolExecutor]:
+        """Pool de procesos para el fitness (None si ``n_jobs`` es 1).
 
-        Mantiene los k mejores estados (capital, cargo) en cada puerto.
+        La instancia y una copia del solver (sin caché ni callbacks) se envían
+        una sola vez a cada proceso, en su inicializador.
         """
-        m = instance.pesos.shape[0]
-        n_stops = len(route)
-
-        # Estado: (capital, cargo, compras_historia, ventas_historia)
-        # Inicializar beam con estado inicial
-        initial_state = (
-            float(instance.capital_inicial),
-            np.zeros(m),
-            [np.zeros(m) for _ in range(n_stops)],
-            [np.zeros(m) for _ in range(n_stops)],
-        )
-        beam = [initial_state]
-
-        # Procesar cada transición en la ruta
-        for idx in range(n_stops - 1):
-            current_port = route[idx]
-            next_port = route[idx + 1]
-
-            # Generar nuevos estados desde cada estado en el beam
-            new_states = []
-
-            for capital, cargo, compras_hist, ventas_hist in beam:
-                # Generar estados sucesor
-                successors = self._generate_successors(
-                    instance,
-                    current_port,
-                    next_port,
-                    capital,
-                    cargo,
-                    compras_hist,
-                    ventas_hist,
-                    idx,
-                )
-                new_states.extend(successors)
-
-            if not new_states:
-                return None
-
-            # Ordenar por capital y mantener los mejores k
-            new_states.sort(key=lambda s: s[0], reverse=True)
-            beam = new_states[: self.beam_width]
-
-        # Mejor estado final
-        if not beam:
+        n_jobs = self.n_jobs or os.cpu_count() or 1
+        if n_jobs <= 1:
             return None
 
-        best_capital, final_cargo, compras_hist, ventas_hist = beam[0]
-
-        # Construir matrices de operaciones
-        compras_matrix = np.zeros((m, n_stops))
-        ventas_matrix = np.zeros((m, n_stops))
-
-        for i in range(n_stops):
-            compras_matrix[:, i] = compras_hist[i]
-            ventas_matrix[:, i] = ventas_hist[i]
-
-        return DTPSolution(
-            ruta=tuple(route),
-            compras=compras_matrix,
-            ventas=ventas_matrix,
-            beneficio_final=best_capital,
+        worker = copy.copy(self)
+        worker.cache = RouteEvaluationCache(maxsize=0)
+        worker._configure_progress(None, self.progress_interval, None, None)
+        return ProcessPoolExecutor(
+            max_workers=n_jobs,
+            mp_context=mp.get_context(),
+            initializer=_init_fitness_worker,
+            initargs=(worker, instance),
         )
 
-    def _generate_successors(
+    def _evaluate_routes(
         self,
         instance: DTPInstance,
-        current_port: int,
-        next_port: int,
-        capital: float,
-        cargo: np.ndarray,
-        compras_hist: List[np.ndarray],
-        ventas_hist: List[np.ndarray],
-        idx: int,
-    ) -> List[Tuple[float, np.ndarray, List[np.ndarray], List[np.ndarray]]]:
+        population: List[List[int]],
+        pool: ProcessPoolExecutor,
+    ) -> List[Optional[Tuple[DTPSolution, float]]]:
         """
-        Genera estados sucesores explorando diferentes combinaciones de venta/compra.
+        Evalúa varios individuos; las rutas que no están en el caché se
+        simulan en el pool. Los resultados vuelven en el orden de ``population``.
         """
+        routes = [[0] + self._decode_route(instance, ports) + [0] for ports in population]
 
-        m = instance.pesos.shape[0]
-        successors = []
+        def compute_many(missing: List[Tuple[int, ...]]) -> List:
+            n_jobs = self.n_jobs or os.cpu_count() or 1
+            chunksize = max(1, len(missing) // (4 * n_jobs))
+            return list(pool.map(_simulate_in_worker, missing, chunksize=chunksize))
 
-        # 1. VENDER todo lo que tengamos
-        new_capital = capital
-        ventas = np.zeros(m)
+        return self.cache.get_or_compute_many(instance, routes, self.policy_id, compute_many)
 
-        for k in range(m):
-            if cargo[k] > 0:
-                precio_venta = instance.precios_compra[k, current_port]
-                new_capital += cargo[k] * precio_venta
-                ventas[k] = cargo[k]
-
-        new_cargo = np.zeros(m)
-
-        # 2. Calcular costo de viaje
-        travel_cost = instance.costos[current_port, next_port]
+    def _decode_route(self, instance: DTPInstance, route_ports: List[int]) -> List[int]:
+        """
+        Puertos que visita un individuo.
 
-        if new_capital < travel_cost:
-            return []  # No factible
+        Con ``subset_routes`` recorre la permutación e inserta cada puerto solo
+        si desde él aún se puede volver a Ámsterdam dentro del tiempo máximo;
+        el resto se omite (selección de subconjunto al estilo orienteering).
+        """
+        if not self.subset_routes:
+            return route_ports
+
+        tiempos = instance.tiempos
+        visited = []
+        last = 0
+        time_spent = 0.0
+        for port in route_ports:
+            arrival = time_spent + tiempos[last, port]
+            if arrival + tiempos[port, 0] <= instance.tiempo_maximo:
+                visited.append(port)
+                last = port
+                time_spent = arrival
+        return visited
 
-        # 3. COMPRAR: explorar diferentes combinaciones
-        capital_disponible = new_capital - travel_cost
-        capacidad_disponible = instance.capacidad_bodega
+    def _evaluate_route(
+        self, instance: DTPInstance, route_ports: List[int]
+    ) -> Optional[Tuple[DTPSolution, float]]:
+        """
+        Evalúa una ruta usando Beam Search para optimizar trading.
 
-        # No comprar nada (opción base)
-        new_compras_hist = [c.copy() for c in compras_hist]
-        new_ventas_hist = [v.copy() for v in ventas_hist]
-        new_ventas_hist[idx] = ventas
+        Las rutas ya evaluadas se resuelven desde el caché; con
+        ``subset_routes`` se evalúa la ruta decodificada, así que individuos
+        distintos con la misma ruta comparten la evaluación.
 
-        final_capital = new_capital - travel_cost
+        Returns:
+            (DTPSolution, fitness) o None si la ruta no es factible
+        """
+        # Construir ruta completa: 0 -> ports -> 0
+        route = [0] + self._decode_route(instance, route_ports) + [0]
 
-        successors.append(
-            (final_capital, new_cargo.copy(), new_compras_hist, new_ventas_hist)
+        return self.cache.get_or_compute(
+            instance,
+            route,
+            self.policy_id,
+            lambda: self._simulate_route(instance, route),
         )
 
-        # Si no es el último puerto antes de volver, considerar compras
-        if idx < len(compras_hist) - 2:
-            # Generar combinaciones de compra (greedy top-k)
-            opportunities = []
-
-            for k in range(m):
-                precio_compra = instance.precios_venta[k, current_port]
-                precio_venta = instance.precios_compra[k, next_port]
-                profit = precio_venta - precio_compra
-
-                if profit > 0 and instance.oferta_max[k, current_port] > 0:
-                    peso = instance.pesos[k]
-                    ratio = profit / peso if peso > 0 else float("inf")
-                    opportunities.append((k, ratio, profit, precio_compra, peso))
-
-            # Ordenar por ratio
-            opportunities.sort(key=lambda x: x[1], reverse=True)
-
-            # Generar algunas combinaciones de compra (top mercancías)
-            for num_items in range(min(3, len(opportunities) + 1)):
-                if num_items == 0:
-                    continue
-
-                compras = np.zeros(m)
-                cap_temp = capital_disponible
-                cap_temp_disponible = capacidad_disponible
-                cargo_temp = new_cargo.copy()
-
-                for i in range(num_items):
-                    k, ratio, profit, precio_compra, peso = opportunities[i]
-
-                    # Calcular cuánto comprar
-                    max_by_offer = instance.oferta_max[k, current_port]
-                    max_by_capital = (
-                        cap_temp / precio_compra if precio_compra > 0 else float("inf")
-                    )
-                    max_by_capacity = (
-                        cap_temp_disponible / peso if peso > 0 else float("inf")
-                    )
-
-                    cantidad = min(max_by_offer, max_by_capital, max_by_capacity)
-                    cantidad = int(cantidad)
-
-                    if cantidad > 0:
-                        compras[k] = cantidad
-                        cargo_temp[k] = cantidad
-                        cap_temp -= cantidad * precio_compra
-                        cap_temp_disponible -= cantidad * peso
-
-                # Crear estado sucesor
-                new_compras_hist2 = [c.copy() for c in compras_hist]
-                new_ventas_hist2 = [v.copy() for v in ventas_hist]
-                new_compras_hist2[idx] = compras
-                new_ventas_hist2[idx] = ventas
-
-                final_capital2 = (
-                    new_capital
-                    - compras.dot(instance.precios_venta[:, current_port])
-                    - travel_cost
-                )
+    def _simulate_route(
+        self, instance: DTPInstance, route: List[int]
+    ) -> Optional[Tuple[DTPSolution, float]]:
+        """Aplica la política de trading (por defecto, Beam Search) a la ruta."""
+        solution = self.trade_policy.simulate(instance, route)
 
-                if final_capital2 >= 0:
-                    successors.append(
-                        (
-                            final_capital2,
-                            cargo_temp.copy(),
-                            new_compras_hist2,
-                            new_ventas_hist2,
-                        )
-                    )
+        if solution is None:
+            return None
 
-        return successors
+        return (solution, solution.beneficio_final)
 
     def _tournament_selection(
         self,
         population: List[List[int]],
         fitness_scores: List[Optional[Tuple[DTPSolution, float]]],
+        rng: random.Random = random,
     ) -> List[int]:
         """Selección por torneo."""
-        tournament = random.sample(range(len(population)), self.tournament_size)
+        tournament = rng.sample(
+            range(len(population)), min(self.tournament_size, len(population))
+        )
         best_idx = max(
             tournament,
             key=lambda i: fitness_scores[i][1]
@@ -398,7 +428,7 @@ class GABeamSolver(ABCSolver):
         return population[best_idx][:]
 
     def _ordered_crossover(
-        self, parent1: List[int], parent2: List[int]
+        self, parent1: List[int], parent2: List[int], rng: random.Random = random
     ) -> Tuple[List[int], List[int]]:
         """
         Order Crossover (OX) - mantiene el orden relativo de los elementos.
@@ -406,7 +436,7 @@ class GABeamSolver(ABCSolver):
         size = len(parent1)
 
         # Seleccionar dos puntos de corte
-        start, end = sorted(random.sample(range(size), 2))
+        start, end = sorted(rng.sample(range(size), 2))
 
         # Crear hijos
         child1 = [None] * size
@@ -431,13 +461,13 @@ class GABeamSolver(ABCSolver):
 
         return child1, child2
 
-    def _swap_mutation(self, route: List[int]) -> List[int]:
+    def _swap_mutation(self, route: List[int], rng: random.Random = random) -> List[int]:
         """Mutación por intercambio de dos posiciones."""
         if len(route) < 2:
             return route
 
         mutated = route[:]
-        i, j = random.sample(range(len(route)), 2)
+        i, j = rng.sample(range(len(route)), 2)
         mutated[i], mutated[j] = mutated[j], mutated[i]
         return mutated
 
@@ -6,8 +6,10 @@ seleccionando en cada paso las opciones localmente óptimas.
 
 from solver.schemas.dtp import DTPInstance, DTPSolution
 from .solver import ABCSolver
+from .trading import make_trade_policy
 
 import numpy as np
+import random
 from typing import Literal
 
 
@@ -26,6 +28,9 @@ class GreedySolver(ABCSolver):
         buy_criterion: Literal[
             "profit_margin", "profit_per_weight", "cheapest"
         ] = "profit_per_weight",
+        rcl_size: int = 1,
+        seed: int | None = None,
+        knapsack: Literal["greedy", "exact"] = "greedy",
     ):
         """Inicializa el solver greedy.
 
@@ -38,12 +43,36 @@ class GreedySolver(ABCSolver):
                 - "profit_margin": maximiza diferencia entre precio compra y venta
                 - "profit_per_weight": maximiza ganancia por unidad de peso
                 - "cheapest": compra lo más barato primero
+            rcl_size: Tamaño de la lista restringida de candidatos: el próximo
+                puerto se elige al azar entre los ``rcl_size`` mejores viables
+                (1 = greedy determinista; >1 = greedy aleatorizado, GRASP)
+            seed: Semilla del generador aleatorio (solo con ``rcl_size > 1``)
+            knapsack: Cómo se decide la compra de cada tramo
+                - "greedy": mochila fraccionaria truncada a enteros
+                - "exact": mochila entera acotada exacta (memoizada por tramo
+                  en ``instance.derived.knapsack``)
         """
+        if rcl_size < 1:
+            raise ValueError(f"rcl_size debe ser positivo: {rcl_size!r}")
         self.port_selection = port_selection
         self.buy_criterion = buy_criterion
+        self.rcl_size = rcl_size
+        self.seed = seed
+        self.knapsack = knapsack
+        self.trade_policy = make_trade_policy(knapsack)
+        self._rng = random.Random(seed)
 
-    def solve(self, instance: DTPInstance) -> DTPSolution:
-        """Resuelve la instancia usando estrategia greedy."""
+    def solve(
+        self,
+        instance: DTPInstance,
+        time_limit: float | None = None,
+        node_limit: int | None = None,
+    ) -> DTPSolution:
+        """Resuelve la instancia usando estrategia greedy.
+
+        Es O(n²), así que ``time_limit`` y ``node_limit`` no se aplican.
+        """
+        self._rng = random.Random(self.seed)
         n_ports = instance.n
         m = instance.m
 
@@ -157,13 +186,13 @@ class GreedySolver(ABCSolver):
         """Selecciona el próximo puerto a visitar usando criterio greedy.
 
         No considera el puerto 0 (Ámsterdam) hasta que sea el retorno final.
+        Con ``rcl_size > 1`` elige al azar entre los mejores puertos viables.
         """
-        n_ports = instance.n
-        best_port = None
-        best_score = float("inf")
-
-        for port in range(1, n_ports + 1):  # Solo considerar puertos 1..n (no 0)
-            if port in visited:
+        # Vecinos de current_port ya ordenados por el criterio (memoizados en la
+        # instancia): el primero viable es el de menor score
+        viable = []
+        for port in instance.derived.neighbors(self.port_selection)[current_port]:
+            if port == 0 or port in visited:
                 continue
 
             cost = instance.costos[current_port, port]
@@ -173,22 +202,15 @@ class GreedySolver(ABCSolver):
             if capital < cost or time_spent + time > instance.tiempo_maximo:
                 continue
 
-            # Calcular score según criterio
-            if self.port_selection == "min_cost":
-                score = cost
-            elif self.port_selection == "min_time":
-                score = time
-            else:  # combined
-                # Normalizar y combinar
-                max_cost = np.max(instance.costos)
-                max_time = np.max(instance.tiempos)
-                score = (cost / max_cost + time / max_time) / 2
-
-            if score < best_score:
-                best_score = score
-                best_port = port
+            viable.append(int(port))
+            if len(viable) == self.rcl_size:
+                break
 
-        return best_port
+        if not viable:
+            return None
+        if len(viable) == 1:
+            return viable[0]
+        return self._rng.choice(viable)
 
     def _trade_at_port(
         self,
@@ -217,7 +239,7 @@ class GreedySolver(ABCSolver):
                 capital += cargo[k] * precio_venta
                 cargo[k] = 0
 
-        # 2. COMPRAR: resolver knapsack con greedy
+        # 2. COMPRAR: resolver la mochila del tramo con la política de trading
         if next_port is None:
             # No hay siguiente puerto, no comprar nada
             compras = np.zeros(m, dtype=float)
@@ -227,13 +249,9 @@ class GreedySolver(ABCSolver):
             capital_disponible = capital - travel_cost
 
             if capital_disponible > 0:
-                # Usar greedy para encontrar la mejor combinación de compras
-                compras = self._knapsack_greedy(
-                    instance,
-                    port,
-                    next_port,
-                    capital_disponible,
-                    instance.capacidad_bodega,
+                # Resolver la mochila del tramo para encontrar la mejor combinación de compras
+                compras = self.trade_policy.buy(
+                    instance, port, next_port, capital_disponible, instance.capacidad_bodega
                 )
             else:
                 compras = np.zeros(m, dtype=float)
@@ -247,89 +265,6 @@ class GreedySolver(ABCSolver):
 
         return ventas, compras, capital, cargo
 
-    def _knapsack_greedy(
-        self,
-        instance: DTPInstance,
-        current_port: int,
-        next_port: int,
-        capital: float,
-        capacidad: float,
-    ) -> np.ndarray:
-        """Resuelve el problema de knapsack usando greedy (fractional knapsack).
-
-        Encuentra la combinación óptima de mercancías a comprar en current_port
-        para maximizar la ganancia al venderlas en next_port.
-
-        Args:
-            current_port: Puerto actual donde compramos
-            next_port: Puerto donde venderemos
-            capital: Capital disponible
-            capacidad: Capacidad de bodega disponible
-
-        Returns:
-            Array con cantidades a comprar de cada mercancía
-        """
-        m = instance.m
-
-        # Calcular oportunidades por mercancía
-        opportunities = []
-        for k in range(m):
-            precio_compra = instance.precios_venta[k, current_port]
-            precio_venta = instance.precios_compra[k, next_port]
-            ganancia_unitaria = precio_venta - precio_compra
-            peso = instance.pesos[k]
-            oferta = instance.oferta_max[k, current_port]
-
-            # Solo considerar si hay ganancia positiva
-            if ganancia_unitaria > 0 and oferta > 0 and peso > 0 and precio_compra > 0:
-                # Calcular cantidad máxima que puedo comprar de esta mercancía
-                max_por_oferta = oferta
-                max_por_capital = capital / precio_compra
-                max_por_peso = capacidad / peso
-                max_units = min(max_por_oferta, max_por_capital, max_por_peso)
-
-                if max_units > 0:
-                    ratio = ganancia_unitaria / peso
-                    opportunities.append(
-                        {
-                            "good": k,
-                            "ratio": ratio,
-                            "profit": ganancia_unitaria,
-                            "cost": precio_compra,
-                            "weight": peso,
-                            "max_units": max_units,
-                        }
-                    )
-
-        if not opportunities:
-            return np.zeros(m, dtype=float)
-
-        # Ordenar por ratio ganancia/peso (mejor primero)
-        opportunities.sort(key=lambda x: x["ratio"], reverse=True)
-
-        # Comprar greedily respetando restricciones
-        compras = np.zeros(m, dtype=float)
-        capital_restante = capital
-        peso_restante = capacidad
-
-        for opp in opportunities:
-            k = opp["good"]
-            precio_compra = opp["cost"]
-            peso = opp["weight"]
-
-            # Calcular cuánto puedo comprar ahora con los recursos restantes
-            max_por_capital = capital_restante / precio_compra
-            max_por_peso = peso_restante / peso
-            cantidad = min(opp["max_units"], max_por_capital, max_por_peso)
-            cantidad = int(cantidad)  # Cantidades enteras
-
-            if cantidad > 0:
-                compras[k] = cantidad
-                capital_restante -= cantidad * precio_compra
-                peso_restante -= cantidad * peso
-
-        return compras
-
     def is_feasible(self, instance: DTPInstance, solution: DTPSolution) -> bool:
         """Verifica si la solución es factible."""
         route = solution.ruta
@@ -3,15 +3,57 @@
 Implementa:
 1. MultiGreedySolver: Ejecuta múltiples estrategias y elige la mejor
 2. GreedyWithLocalSearch: Greedy + 2-OPT improvement
+3. MultiStartLocalSearch: Muchos arranques greedy aleatorizados + búsqueda
+   local en un pool de procesos, con incumbente compartida
 """
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Iterator, Literal, Sequence
+
 from solver.schemas.dtp import DTPInstance, DTPSolution
+from .cache import RouteEvaluationCache
 from .greedy import GreedySolver
-from .solver import ABCSolver
-
+from .moves import NEIGHBORHOODS, Move, two_opt_moves
+from .solver import ABCSolver, CancelToken, ProgressCallback
+
+import copy
+import multiprocessing as mp
+import os
+import random
+import threading
+import time
 import numpy as np
 
 
+@dataclass(slots=True)
+class RouteTrace:
+    """Estados intermedios de la simulación greedy de una ruta.
+
+    ``capitals[i]``, ``cargos[i]`` y ``times[i]`` son el estado al llegar al
+    puerto ``route[i]`` (descontado el viaje, antes de comerciar). Permiten
+    reanudar la simulación de otra ruta que comparta el prefijo.
+    """
+
+    route: tuple[int, ...]
+    capitals: list[float]
+    cargos: list[np.ndarray]
+    times: list[float]
+    compras: np.ndarray
+    ventas: np.ndarray
+    beneficio_final: float
+
+    def to_solution(self) -> DTPSolution:
+        """Construye la DTPSolution correspondiente a la traza."""
+        return DTPSolution(
+            ruta=self.route,
+            compras=self.compras,
+            ventas=self.ventas,
+            beneficio_final=self.beneficio_final,
+        )
+
+
 class MultiGreedySolver(ABCSolver):
     """Heurística multi-estrategia: ejecuta varios greedy y selecciona el mejor.
 
@@ -30,8 +72,16 @@ class MultiGreedySolver(ABCSolver):
         """
         self.num_strategies = num_strategies
 
-    def solve(self, instance: DTPInstance) -> DTPSolution:
-        """Ejecuta múltiples estrategias y retorna la mejor solución."""
+    def solve(
+        self,
+        instance: DTPInstance,
+        time_limit: float | None = None,
+        node_limit: int | None = None,
+    ) -> DTPSolution:
+        """Ejecuta múltiples estrategias y retorna la mejor solución.
+
+        Cada greedy es O(n²), así que los límites no se aplican.
+        """
         strategies = [
             GreedySolver(port_selection="min_cost", buy_criterion="profit_per_weight"),
             GreedySolver(port_selection="min_time", buy_criterion="profit_per_weight"),
@@ -64,8 +114,9 @@ class GreedyWithLocalSearch(ABCSolver):
 
     Estrategia:
     1. Obtener solución greedy inicial
-    2. Aplicar mejoras locales: invertir segmentos de ruta
-    3. Aceptar mejoras que aumenten el beneficio
+    2. Aplicar mejoras locales: invertir segmentos de ruta y, opcionalmente,
+       mover segmentos (or-opt), intercambiar, insertar o quitar puertos
+    3. Aceptar mejoras que aumenten el beneficio (primera o mejor mejora)
     4. Iterar hasta convergencia
 
     Complejidad: O(n³) - dos bucles anidados + evaluación
@@ -73,20 +124,97 @@ class GreedyWithLocalSearch(ABCSolver):
     Mejora sobre greedy: 2-5% típicamente
     """
 
-    def __init__(self, max_iterations: int = 100, verbose: bool = False):
+    def __init__(
+        self,
+        max_iterations: int = 100,
+        verbose: bool = False,
+        candidate_k: int | None = None,
+        candidate_fallback: bool = False,
+        moves: Sequence[str] = (),
+        strategy: Literal["first", "best"] = "first",
+        dont_look_bits: bool = False,
+        knapsack: Literal["greedy", "exact"] = "greedy",
+        cache: RouteEvaluationCache | None = None,
+        progress_callback: ProgressCallback | None = None,
+        progress_interval: int = 1,
+        cancel_token: CancelToken | None = None,
+        time_budget: float | None = None,
+    ):
         """Inicializa el solver con búsqueda local.
 
         Args:
             max_iterations: Máximo número de iteraciones de mejora
             verbose: Si mostrar progreso
+            candidate_k: Si se indica, 2-OPT prueba solo las reversiones que
+                crean una arista hacia uno de los ``candidate_k`` puertos más
+                cercanos, y la búsqueda se detiene en el óptimo local de ese
+                vecindario restringido (None = vecindario completo siempre)
+            candidate_fallback: Con ``candidate_k``, si ninguna reversión
+                candidata mejora, recorrer además el resto del vecindario. Da
+                óptimos locales 2-OPT completos, pero cada pasada en un óptimo
+                local vuelve a costar O(n²)
+            moves: Vecindarios adicionales a 2-OPT, en el orden en que se
+                prueban: "or_opt", "swap", "insert" (agregar un puerto no
+                visitado) y "drop" (quitar un puerto)
+            strategy: "first" acepta la primera mejora encontrada; "best"
+                recorre todo el vecindario y aplica la mejor
+            dont_look_bits: Si es True, 2-OPT usa una cola de posiciones
+                pendientes: solo se reexaminan las posiciones cuyas aristas
+                cambió el último movimiento aceptado, en lugar de recorrer de
+                nuevo todos los pares (i, j)
+            knapsack: Mochila de compras de cada tramo: "greedy" o "exact"
+                (ver GreedySolver)
+            cache: Caché de evaluaciones de rutas (compartible con otros solvers)
+            progress_callback: Recibe un evento "iteration" cada
+                ``progress_interval`` iteraciones de mejora (ver ABCSolver)
+            progress_interval: Iteraciones entre eventos
+            cancel_token: Token para cancelar el solve desde fuera
+            time_budget: Segundos de reloj máximos para el solve
         """
         self.max_iterations = max_iterations
         self.verbose = verbose
+        self.candidate_k = candidate_k
+        self.candidate_fallback = candidate_fallback
+        unknown = set(moves) - set(NEIGHBORHOODS)
+        if unknown:
+            raise ValueError(f"Movimientos desconocidos: {sorted(unknown)}")
+        self.moves = tuple(moves)
+        if strategy not in ("first", "best"):
+            raise ValueError(f"Estrategia desconocida: {strategy!r}")
+        self.strategy = strategy
+        self.dont_look_bits = dont_look_bits
+        self.knapsack = knapsack
+        self.cache = cache if cache is not None else RouteEvaluationCache()
+        self._configure_progress(
+            progress_callback, progress_interval, cancel_token, time_budget
+        )
+        self.visited_nodes = 0
+
+    @property
+    def policy_id(self) -> str:
+        """Identificador de la política de trading (depende de la mochila)."""
+        if self.knapsack == "greedy":
+            return "greedy:trade_at_port"
+        return f"greedy:trade_at_port:knapsack={self.knapsack}"
+
+    def solve(
+        self,
+        instance: DTPInstance,
+        time_limit: float | None = None,
+        node_limit: int | None = None,
+    ) -> DTPSolution:
+        """Resuelve usando greedy + local search.
+
+        Args:
+            instance: Instancia del problema
+            time_limit: Segundos de reloj para esta llamada
+            node_limit: Máximo de rutas evaluadas por la búsqueda local
+        """
+        self._start_run(time_limit, node_limit)
+        self.visited_nodes = 0
 
-    def solve(self, instance: DTPInstance) -> DTPSolution:
-        """Resuelve usando greedy + local search."""
         # Paso 1: Obtener solución greedy inicial
-        greedy = GreedySolver(port_selection="combined")
+        greedy = GreedySolver(port_selection="combined", knapsack=self.knapsack)
         solution = greedy.solve(instance)
 
         if self.verbose:
@@ -106,81 +234,335 @@ class GreedyWithLocalSearch(ABCSolver):
             )
             print(f"Mejora: {improvement:.2f}%")
 
-        return improved_solution
+        return self._finish_run(improved_solution, self.visited_nodes)
 
     def _local_search(
         self, initial_solution: DTPSolution, instance: DTPInstance, greedy: GreedySolver
     ) -> DTPSolution:
-        """Aplica 2-OPT iterativo para mejorar la ruta.
+        """Aplica búsqueda local iterativa (2-OPT y los vecindarios elegidos).
 
-        La mejora se enfoca en reordenar puertos visitados,
+        La mejora se enfoca en reordenar (o agregar/quitar) puertos visitados,
         re-evaluando decisiones de compra/venta con la nueva ruta.
+
+        Cada movimiento deja intacta la ruta hasta alguna posición ``start``
+        (p. ej. invertir [i, j] no altera la ruta hasta i - 1), así que cada
+        candidata se simula a partir del estado guardado de la ruta actual en
+        ``start`` (el último puerto cuya decisión de compra cambia, porque su
+        próximo destino es distinto).
+
+        Con ``strategy="first"`` se acepta la primera mejora y se vuelve a
+        recorrer el vecindario; con ``"best"`` se evalúa el vecindario completo
+        y se aplica la mejor.
         """
+        if self.dont_look_bits:
+            return self._queued_search(initial_solution, instance, greedy)
+
         current_solution = initial_solution
         current_benefit = current_solution.beneficio_final
+        trace = self._simulate_route(current_solution.ruta, instance, greedy)
+        candidates = (
+            instance.derived.candidates("combined", self.candidate_k)
+            if self.candidate_k is not None
+            else None
+        )
 
         improved = True
         iteration = 0
 
-        while improved and iteration < self.max_iterations:
+        while (
+            improved
+            and iteration < self.max_iterations
+            and not self._should_stop(self.visited_nodes)
+        ):
             improved = False
             iteration += 1
 
-            route = list(current_solution.ruta)
-
-            # Intentar invertir cada segmento de ruta (2-OPT)
-            for i in range(1, len(route) - 2):
-                for j in range(i + 1, len(route) - 1):
-                    # Invertir segmento entre i y j
-                    new_route = (
-                        tuple(route[:i])
-                        + tuple(reversed(route[i : j + 1]))
-                        + tuple(route[j + 1 :])
-                    )
-
-                    # Evaluar nueva ruta
-                    new_solution = self._evaluate_route(new_route, instance, greedy)
-
-                    if new_solution and new_solution.beneficio_final > current_benefit:
-                        current_solution = new_solution
-                        current_benefit = new_solution.beneficio_final
-                        improved = True
-
-                        if self.verbose:
-                            print(
-                                f"  Mejora en iter {iteration}: ${current_benefit:.2f}"
-                            )
+            route = tuple(current_solution.ruta)
+            best_move = None
+            best_benefit = current_benefit
+
+            for start, new_route in self._neighborhood(route, instance, candidates):
+                if self._should_stop(self.visited_nodes):
+                    break
+
+                # Evaluar nueva ruta reanudando desde el prefijo común
+                new_solution = self._evaluate_route(
+                    new_route, instance, greedy, trace, start
+                )
+                self.visited_nodes += 1
+
+                if new_solution and new_solution.beneficio_final > best_benefit:
+                    best_move = (start, new_route, new_solution)
+                    best_benefit = new_solution.beneficio_final
+                    if self.strategy == "first":
                         break
 
-                if improved:
+            if best_move is not None:
+                start, new_route, current_solution = best_move
+                current_benefit = best_benefit
+                trace = self._simulate_route(new_route, instance, greedy, trace, start)
+                improved = True
+
+                if self.verbose:
+                    print(f"  Mejora en iter {iteration}: ${current_benefit:.2f}")
+
+            if iteration % self.progress_interval == 0:
+                self._emit(
+                    "iteration",
+                    iteration=iteration,
+                    visited_nodes=self.visited_nodes,
+                    best_benefit=current_benefit,
+                )
+
+        return current_solution
+
+    def _queued_search(
+        self, initial_solution: DTPSolution, instance: DTPInstance, greedy: GreedySolver
+    ) -> DTPSolution:
+        """Búsqueda local con don't-look bits y cola de posiciones pendientes.
+
+        Cada posición de la ruta tiene un bit "no mirar": al sacarla de la cola
+        se prueban solo las reversiones 2-OPT que la tienen como extremo; si
+        ninguna mejora, la posición queda apagada. Al aceptar una reversión
+        [i, j] se vuelven a encolar los extremos de las aristas que cambiaron
+        (i - 1, i, j, j + 1). Cuando la cola se vacía se prueban los
+        vecindarios de ``self.moves``; si alguno mejora, todas las posiciones
+        vuelven a la cola (esos movimientos desplazan las posiciones).
+
+        Con ``candidate_k`` se aplican las mismas listas de candidatos que en
+        ``_two_opt_moves`` (y el mismo respaldo con ``candidate_fallback``).
+
+        ``max_iterations`` limita el número de mejoras aceptadas.
+        """
+        current_solution = initial_solution
+        current_benefit = current_solution.beneficio_final
+        trace = self._simulate_route(current_solution.ruta, instance, greedy)
+        candidates = (
+            instance.derived.candidates("combined", self.candidate_k)
+            if self.candidate_k is not None
+            else None
+        )
+
+        route = tuple(current_solution.ruta)
+        queue = deque(range(1, len(route) - 1))
+        queued = set(queue)
+        iteration = 0
+
+        def requeue(positions) -> None:
+            for position in positions:
+                if 1 <= position < len(route) - 1 and position not in queued:
+                    queue.append(position)
+                    queued.add(position)
+
+        while iteration < self.max_iterations and not self._should_stop(
+            self.visited_nodes
+        ):
+            if queue:
+                position = queue.popleft()
+                queued.discard(position)
+                pairs = self._position_pairs(
+                    route, position, candidates, self.candidate_fallback
+                )
+                neighborhood = two_opt_moves(route, pairs)
+            else:
+                pairs = None
+                neighborhood = (
+                    move
+                    for name in self.moves
+                    for move in NEIGHBORHOODS[name](route, instance.n)
+                )
+
+            best_move = None
+            best_benefit = current_benefit
+            for index, (start, new_route) in enumerate(neighborhood):
+                if self._should_stop(self.visited_nodes):
                     break
 
+                new_solution = self._evaluate_route(
+                    new_route, instance, greedy, trace, start
+                )
+                self.visited_nodes += 1
+
+                if new_solution and new_solution.beneficio_final > best_benefit:
+                    best_move = (index, start, new_route, new_solution)
+                    best_benefit = new_solution.beneficio_final
+                    if self.strategy == "first":
+                        break
+
+            if best_move is None:
+                if pairs is None or self.interrupted:
+                    break  # Ni 2-OPT ni los demás vecindarios mejoran
+                continue  # La posición queda con su bit "no mirar" encendido
+
+            index, start, route, current_solution = best_move
+            current_benefit = best_benefit
+            trace = self._simulate_route(route, instance, greedy, trace, start)
+            iteration += 1
+
+            if pairs is not None:
+                i, j = pairs[index]
+                requeue((i - 1, i, j, j + 1))
+            else:
+                requeue(range(1, len(route) - 1))
+
+            if self.verbose:
+                print(f"  Mejora en iter {iteration}: ${current_benefit:.2f}")
+
+            if iteration % self.progress_interval == 0:
+                self._emit(
+                    "iteration",
+                    iteration=iteration,
+                    visited_nodes=self.visited_nodes,
+                    best_benefit=current_benefit,
+                )
+
         return current_solution
 
+    def _neighborhood(
+        self,
+        route: tuple[int, ...],
+        instance: DTPInstance,
+        candidates: np.ndarray | None,
+    ) -> Iterator[Move]:
+        """Movimientos a probar sobre ``route``: 2-OPT y luego ``self.moves``."""
+        yield from two_opt_moves(
+            route, self._two_opt_moves(list(route), candidates, self.candidate_fallback)
+        )
+        for name in self.moves:
+            yield from NEIGHBORHOODS[name](route, instance.n)
+
+    @staticmethod
+    def _two_opt_moves(
+        route: list[int], candidates: np.ndarray | None, fallback: bool = False
+    ):
+        """Pares (i, j) de segmentos a invertir, en el orden en que se prueban.
+
+        Sin candidatos es el recorrido completo i < j. Con candidatos, solo los
+        pares cuya reversión une ``route[i - 1]`` con uno de sus puertos más
+        cercanos (``route[j]``); con ``fallback``, después el resto.
+        """
+        last = len(route) - 1
+        if candidates is None:
+            for i in range(1, last - 1):
+                for j in range(i + 1, last):
+                    yield i, j
+            return
+
+        position = {port: idx for idx, port in enumerate(route)}
+        restricted = set()
+        for i in range(1, last - 1):
+            near = sorted(
+                j
+                for j in (position.get(int(c)) for c in candidates[route[i - 1]])
+                if j is not None and i < j < last
+            )
+            for j in near:
+                restricted.add((i, j))
+                yield i, j
+
+        if not fallback:
+            return
+        for i in range(1, last - 1):
+            for j in range(i + 1, last):
+                if (i, j) not in restricted:
+                    yield i, j
+
+    @staticmethod
+    def _position_pairs(
+        route: tuple[int, ...],
+        position: int,
+        candidates: np.ndarray | None,
+        fallback: bool = False,
+    ) -> list[tuple[int, int]]:
+        """Pares (i, j) de 2-OPT con ``position`` como extremo, en orden de prueba.
+
+        Con candidatos, solo los que cumplen el criterio de ``_two_opt_moves``
+        (``route[j]`` es candidato de ``route[i - 1]``); con ``fallback``,
+        después el resto.
+        """
+        last = len(route) - 1
+        pairs = [(position, j) for j in range(position + 1, last)] + [
+            (h, position) for h in range(1, position)
+        ]
+        if candidates is None:
+            return pairs
+
+        near = [(i, j) for i, j in pairs if route[j] in candidates[route[i - 1]]]
+        if fallback:
+            restricted = set(near)
+            near += [pair for pair in pairs if pair not in restricted]
+        return near
+
     def _evaluate_route(
-        self, route: tuple, instance: DTPInstance, greedy: GreedySolver
+        self,
+        route: tuple,
+        instance: DTPInstance,
+        greedy: GreedySolver,
+        prefix: RouteTrace | None = None,
+        start: int = 0,
     ) -> DTPSolution | None:
         """Evalúa beneficio de una ruta específica usando greedy para compras.
 
-        Recalcula compras/ventas para la ruta dada manteniendo la estrategia greedy.
+        Las rutas ya evaluadas se resuelven desde el caché. Si se pasa la traza
+        de una ruta que coincide con ``route`` hasta la posición ``start``, la
+        simulación se reanuda desde ahí.
+        """
+
+        def compute() -> DTPSolution | None:
+            trace = self._simulate_route(route, instance, greedy, prefix, start)
+            return trace.to_solution() if trace is not None else None
+
+        return self.cache.get_or_compute(instance, route, self.policy_id, compute)
+
+    def _simulate_route(
+        self,
+        route: tuple,
+        instance: DTPInstance,
+        greedy: GreedySolver,
+        prefix: RouteTrace | None = None,
+        start: int = 0,
+    ) -> RouteTrace | None:
+        """Recalcula compras/ventas para la ruta dada manteniendo la estrategia greedy.
+
+        Args:
+            route: Ruta completa a simular
+            prefix: Traza de una ruta idéntica a ``route`` en las posiciones 0..start
+            start: Primera posición cuyo trading debe recalcularse
+
+        Returns:
+            Traza de la simulación, o None si la ruta es infactible
         """
         try:
-            # Simular ejecución con esta ruta específica
             m = instance.m
+            steps = len(route)
 
-            capital = float(instance.capital_inicial)
-            cargo = np.zeros(m, dtype=float)
-            time_spent = 0.0
+            compras_matrix = np.zeros((m, steps), dtype=float)
+            ventas_matrix = np.zeros((m, steps), dtype=float)
 
-            compras_list = []
-            ventas_list = []
+            if prefix is None:
+                # Simular ejecución desde Ámsterdam
+                start = 0
+                capitals = [float(instance.capital_inicial)]
+                cargos = [np.zeros(m, dtype=float)]
+                times = [0.0]
+            else:
+                # Reutilizar estados y operaciones del prefijo común
+                capitals = prefix.capitals[: start + 1]
+                cargos = prefix.cargos[: start + 1]
+                times = prefix.times[: start + 1]
+                compras_matrix[:, :start] = prefix.compras[:, :start]
+                ventas_matrix[:, :start] = prefix.ventas[:, :start]
+
+            capital = capitals[start]
+            cargo = cargos[start].copy()
+            time_spent = times[start]
 
             # Iterar por la ruta
-            for idx in range(len(route)):
+            for idx in range(start, steps):
                 current_port = route[idx]
 
-                # Calcular costo de viaje al llegar a este puerto (excepto el primero)
-                if idx > 0:
+                # Calcular costo de viaje al llegar a este puerto (excepto el de reanudación)
+                if idx > start:
                     prev_port = route[idx - 1]
                     travel_cost = instance.costos[prev_port, current_port]
                     travel_time = instance.tiempos[prev_port, current_port]
@@ -192,8 +574,12 @@ class GreedyWithLocalSearch(ABCSolver):
                     if capital < 0 or time_spent > instance.tiempo_maximo:
                         return None
 
+                    capitals.append(capital)
+                    cargos.append(cargo.copy())
+                    times.append(time_spent)
+
                 # Determinar próximo puerto para lookahead en compras
-                if idx < len(route) - 1:
+                if idx < steps - 1:
                     next_port = route[idx + 1]
                 else:
                     next_port = None
@@ -202,20 +588,14 @@ class GreedyWithLocalSearch(ABCSolver):
                 ventas, compras, capital, cargo = greedy._trade_at_port(
                     instance, current_port, capital, cargo, next_port
                 )
-                compras_list.append(compras)
-                ventas_list.append(ventas)
-
-            # Construir matriz
-            steps = len(route)
-            compras_matrix = np.zeros((m, steps), dtype=float)
-            ventas_matrix = np.zeros((m, steps), dtype=float)
-
-            for idx in range(min(steps, len(compras_list))):
-                compras_matrix[:, idx] = compras_list[idx]
-                ventas_matrix[:, idx] = ventas_list[idx]
-
-            return DTPSolution(
-                ruta=tuple(route),
+                compras_matrix[:, idx] = compras
+                ventas_matrix[:, idx] = ventas
+
+            return RouteTrace(
+                route=tuple(route),
+                capitals=capitals,
+                cargos=cargos,
+                times=times,
                 compras=compras_matrix,
                 ventas=ventas_matrix,
                 beneficio_final=capital,
@@ -232,3 +612,297 @@ class GreedyWithLocalSearch(ABCSolver):
     def evaluate(self, instance: DTPInstance, solution: DTPSolution) -> float:
         """Evalúa la solución."""
         return solution.beneficio_final
+
+
+# Estado de cada proceso trabajador de MultiStartLocalSearch (lo fija _init_start_worker)
+_START_CONTEXT: dict = {}
+
+
+def _init_start_worker(
+    solver: "MultiStartLocalSearch", instance: DTPInstance, incumbent: "_Incumbent", stop_event, deadline
+) -> None:
+    _START_CONTEXT["solver"] = solver
+    _START_CONTEXT["instance"] = instance
+    _START_CONTEXT["incumbent"] = incumbent
+    _START_CONTEXT["stop"] = CancelToken(stop_event)
+    _START_CONTEXT["deadline"] = deadline
+
+
+def _run_start_in_worker(index: int) -> tuple[DTPSolution | None, int]:
+    """Ejecuta el arranque ``index`` con el contexto del proceso."""
+    return _START_CONTEXT["solver"]._run_start(
+        _START_CONTEXT["instance"],
+        index,
+        _START_CONTEXT["incumbent"],
+        _START_CONTEXT["stop"],
+        _START_CONTEXT["deadline"],
+    )
+
+
+class _Incumbent:
+    """Mejor ruta encontrada, compartida entre procesos (memoria compartida).
+
+    Guarda el beneficio y la ruta en ``multiprocessing.Value``/``Array`` bajo
+    un mismo lock, para que los trabajadores puedan leerla y publicar mejoras.
+    """
+
+    def __init__(self, ctx, n_ports: int):
+        self._lock = ctx.Lock()
+        self._benefit = ctx.Value("d", -np.inf, lock=False)
+        self._length = ctx.Value("i", 0, lock=False)
+        self._route = ctx.Array("i", n_ports + 2, lock=False)
+
+    @property
+    def benefit(self) -> float:
+        return self._benefit.value
+
+    def route(self) -> tuple[int, ...] | None:
+        """Ruta incumbente, o None si todavía no hay ninguna."""
+        with self._lock:
+            length = self._length.value
+            return tuple(self._route[:length]) if length else None
+
+    def publish(self, solution: DTPSolution) -> bool:
+        """Publica la solución si mejora la incumbente; indica si lo hizo."""
+        with self._lock:
+            if solution.beneficio_final <= self._benefit.value:
+                return False
+            self._benefit.value = solution.beneficio_final
+            self._length.value = len(solution.ruta)
+            self._route[: len(solution.ruta)] = list(solution.ruta)
+            return True
+
+
+class MultiStartLocalSearch(ABCSolver):
+    """Búsqueda local multi-arranque en paralelo (GRASP + perturbación).
+
+    Estrategia:
+    1. Lanzar ``n_starts`` arranques repartidos en un pool de procesos
+    2. Cada arranque construye una ruta con greedy aleatorizado (lista
+       restringida de candidatos) o, con probabilidad ``perturb_rate``,
+       perturba la mejor ruta conocida (la incumbente compartida)
+    3. Mejorar la ruta con la búsqueda local de GreedyWithLocalSearch
+    4. Publicar la ruta en la incumbente compartida si la mejora
+
+    Todos los procesos comparten la incumbente (memoria compartida) y un
+    plazo común; al agotarse ``time_budget``/``time_limit`` o cancelarse el
+    solve, los arranques en curso devuelven lo mejor que tienen y los
+    pendientes no se ejecutan.
+
+    Con ``n_jobs=1`` los arranques corren en serie y el resultado es
+    reproducible para una semilla; en paralelo, qué incumbente ve cada
+    perturbación depende del orden en que terminan los procesos.
+
+    Parámetros:
+        n_starts: Número de arranques
+        n_jobs: Procesos (1 = serial, None = todos los núcleos)
+        rcl_size: Candidatos entre los que elige el greedy aleatorizado
+        perturb_rate: Probabilidad de que un arranque perturbe la incumbente
+        seed: Semilla base (el arranque i usa ``seed + i``)
+        moves, strategy, dont_look_bits, candidate_k, candidate_fallback,
+        max_iterations, knapsack:
+            Configuración de la búsqueda local (ver GreedyWithLocalSearch)
+        progress_callback: Recibe un evento "iteration" por arranque terminado
+        progress_interval: Arranques entre eventos
+        cancel_token: Token para cancelar el solve desde fuera
+        time_budget: Segundos de reloj máximos para el solve
+    """
+
+    PORT_SELECTIONS = ("combined", "min_cost", "min_time")
+    # Segundos entre chequeos de cancelación mientras se esperan resultados
+    POLL_INTERVAL = 0.05
+
+    def __init__(
+        self,
+        n_starts: int = 32,
+        n_jobs: int | None = None,
+        rcl_size: int = 3,
+        perturb_rate: float = 0.5,
+        seed: int = 0,
+        moves: Sequence[str] = ("or_opt", "insert", "drop"),
+        strategy: Literal["first", "best"] = "first",
+        dont_look_bits: bool = True,
+        candidate_k: int | None = None,
+        candidate_fallback: bool = False,
+        max_iterations: int = 1000,
+        knapsack: Literal["greedy", "exact"] = "greedy",
+        progress_callback: ProgressCallback | None = None,
+        progress_interval: int = 1,
+        cancel_token: CancelToken | None = None,
+        time_budget: float | None = None,
+    ):
+        if n_starts < 1:
+            raise ValueError(f"n_starts debe ser positivo: {n_starts!r}")
+        if n_jobs is not None and n_jobs < 1:
+            raise ValueError(f"n_jobs debe ser positivo: {n_jobs!r}")
+        if strategy not in ("first", "best"):
+            raise ValueError(f"Estrategia desconocida: {strategy!r}")
+        self.n_starts = n_starts
+        self.n_jobs = n_jobs
+        self.rcl_size = rcl_size
+        self.perturb_rate = perturb_rate
+        self.seed = seed
+        self.moves = tuple(moves)
+        self.strategy = strategy
+        self.dont_look_bits = dont_look_bits
+        self.candidate_k = candidate_k
+        self.candidate_fallback = candidate_fallback
+        self.max_iterations = max_iterations
+        self.knapsack = knapsack
+        self._configure_progress(
+            progress_callback, progress_interval, cancel_token, time_budget
+        )
+        self.visited_nodes = 0
+
+    def solve(
+        self,
+        instance: DTPInstance,
+        time_limit: float | None = None,
+        node_limit: int | None = None,
+    ) -> DTPSolution:
+        """Ejecuta los arranques y devuelve la mejor solución.
+
+        Args:
+            instance: Instancia del problema
+            time_limit: Segundos de reloj para esta llamada (plazo común a
+                todos los procesos)
+            node_limit: Máximo de rutas evaluadas (se verifica entre arranques)
+        """
+        self._start_run(time_limit, node_limit)
+        self.visited_nodes = 0
+        n_jobs = min(self.n_jobs or os.cpu_count() or 1, self.n_starts)
+
+        deadline = (
+            time.monotonic() + self._time_limit if self._time_limit is not None else None
+        )
+        ctx = mp.get_context()
+        incumbent = _Incumbent(ctx, instance.n)
+        stop_event = ctx.Event() if n_jobs > 1 else threading.Event()
+
+        best: DTPSolution | None = None
+        for index, (solution, visited) in enumerate(
+            self._run_starts(instance, n_jobs, incumbent, stop_event, deadline)
+        ):
+            self.visited_nodes += visited
+            # Ante empates gana el arranque de menor índice
+            if solution is not None and (
+                best is None or solution.beneficio_final > best.beneficio_final
+            ):
+                best = solution
+
+            if (index + 1) % self.progress_interval == 0:
+                self._emit(
+                    "iteration",
+                    iteration=index + 1,
+                    visited_nodes=self.visited_nodes,
+                    best_benefit=best.beneficio_final if best else None,
+                )
+            if self._should_stop(self.visited_nodes):
+                stop_event.set()
+
+        if best is None:
+            best = GreedySolver(port_selection="combined", knapsack=self.knapsack).solve(
+                instance
+            )
+        return self._finish_run(best, self.visited_nodes)
+
+    def _run_starts(self, instance, n_jobs, incumbent, stop_event, deadline):
+        """Resultados ``(solución, rutas evaluadas)`` de cada arranque, en orden."""
+        if n_jobs == 1:
+            # En serie, la búsqueda local atiende directamente al token externo
+            stop = self.cancel_token or CancelToken(stop_event)
+            for index in range(self.n_starts):
+                if self._should_stop(self.visited_nodes):
+                    return
+                yield self._run_start(instance, index, incumbent, stop, deadline)
+            return
+
+        # Los procesos no reportan progreso ni se cancelan: lo hace este proceso
+        worker = copy.copy(self)
+        worker._configure_progress(None, self.progress_interval, None, None)
+
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            mp_context=mp.get_context(),
+            initializer=_init_start_worker,
+            initargs=(worker, instance, incumbent, stop_event, deadline),
+        ) as pool:
+            futures = [pool.submit(_run_start_in_worker, i) for i in range(self.n_starts)]
+            for future in futures:
+                # Mientras se espera, vigilar la cancelación y el plazo
+                while not wait([future], timeout=self.POLL_INTERVAL).done:
+                    if self._should_stop(self.visited_nodes):
+                        stop_event.set()
+                        for pending in futures:
+                            pending.cancel()
+                if not future.cancelled():
+                    yield future.result()
+
+    def _run_start(
+        self,
+        instance: DTPInstance,
+        index: int,
+        incumbent: _Incumbent,
+        stop: CancelToken,
+        deadline: float | None,
+    ) -> tuple[DTPSolution | None, int]:
+        """Construye una ruta inicial, la mejora y la publica en la incumbente."""
+        if stop.cancelled:
+            return None, 0
+        time_limit = None
+        if deadline is not None:
+            time_limit = deadline - time.monotonic()
+            if time_limit <= 0:
+                return None, 0
+
+        rng = random.Random(self.seed + index)
+        ls = GreedyWithLocalSearch(
+            max_iterations=self.max_iterations,
+            candidate_k=self.candidate_k,
+            candidate_fallback=self.candidate_fallback,
+            moves=self.moves,
+            strategy=self.strategy,
+            dont_look_bits=self.dont_look_bits,
+            knapsack=self.knapsack,
+            cancel_token=stop,
+        )
+        trader = GreedySolver(port_selection="combined", knapsack=self.knapsack)
+
+        start = None
+        route = incumbent.route()
+        if route is not None and len(route) > 3 and rng.random() < self.perturb_rate:
+            trace = ls._simulate_route(self._perturb(route, rng), instance, trader)
+            start = trace.to_solution() if trace is not None else None
+        if start is None:
+            greedy = GreedySolver(
+                port_selection=self.PORT_SELECTIONS[index % len(self.PORT_SELECTIONS)],
+                rcl_size=self.rcl_size,
+                seed=rng.randrange(2**32),
+                knapsack=self.knapsack,
+            )
+            start = greedy.solve(instance)
+
+        ls._start_run(time_limit)
+        solution = ls._local_search(start, instance, trader)
+        incumbent.publish(solution)
+        return solution, ls.visited_nodes + 1
+
+    @staticmethod
+    def _perturb(route: tuple[int, ...], rng: random.Random) -> tuple[int, ...]:
+        """Perturbación "double bridge": reordena tres tramos de la ruta."""
+        ports = list(route[1:-1])
+        if len(ports) < 4:
+            i, j = sorted(rng.sample(range(len(ports)), 2))
+            ports[i], ports[j] = ports[j], ports[i]
+        else:
+            a, b, c = sorted(rng.sample(range(1, len(ports)), 3))
+            ports = ports[:a] + ports[b:c] + ports[a:b] + ports[c:]
+        return (0, *ports, 0)
+
+    def is_feasible(self, instance: DTPInstance, solution: DTPSolution) -> bool:
+        """Verifica si la solución es factible."""
+        return GreedySolver().is_feasible(instance, solution)
+
+    def evaluate(self, instance: DTPInstance, solution: DTPSolution) -> float:
+        """Evalúa la solución."""
+        return solution.beneficio_final
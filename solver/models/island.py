@@ -0,0 +1,289 @@
+"""
+GA con modelo de islas para el Problema del Comerciante Holandés.
+
+Varias poblaciones de GABeamSolver evolucionan en procesos separados y cada
+``migration_interval`` generaciones envían sus mejores rutas a la isla
+siguiente (topología en anillo) a través de una cola. Las islas mantienen
+diversidad por separado y la migración difunde las buenas rutas.
+"""
+
+import copy
+import multiprocessing as mp
+import os
+import queue
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from typing import Optional, List, Tuple
+
+from solver.models.ga_beam import GABeamSolver
+from solver.models.solver import ABCSolver, CancelToken, ProgressCallback
+from solver.schemas.dtp import DTPInstance, DTPSolution
+
+
+# Estado de cada proceso trabajador (lo fija _init_island_worker)
+_ISLAND_CONTEXT: dict = {}
+
+
+def _init_island_worker(
+    solver: "IslandGASolver", instance: DTPInstance, queues: list, stop_event, deadline
+) -> None:
+    # Las rutas que nadie llegue a leer pueden descartarse al terminar
+    for q in queues:
+        q.cancel_join_thread()
+    _ISLAND_CONTEXT["solver"] = solver
+    _ISLAND_CONTEXT["instance"] = instance
+    _ISLAND_CONTEXT["queues"] = queues
+    _ISLAND_CONTEXT["stop"] = CancelToken(stop_event)
+    _ISLAND_CONTEXT["deadline"] = deadline
+
+
+def _run_island_in_worker(index: int) -> Tuple[Optional[DTPSolution], int]:
+    """Evoluciona la isla ``index`` con el contexto del proceso."""
+    return _ISLAND_CONTEXT["solver"]._run_island(
+        _ISLAND_CONTEXT["instance"],
+        index,
+        _ISLAND_CONTEXT["queues"],
+        _ISLAND_CONTEXT["stop"],
+        _ISLAND_CONTEXT["deadline"],
+    )
+
+
+class IslandGASolver(ABCSolver):
+    """
+    Modelo de islas sobre GABeamSolver.
+
+    - Cada isla es un GABeamSolver con su propia población y semilla
+      (``seed + índice``), ejecutado en su propio proceso
+    - Cada ``migration_interval`` generaciones, una isla envía sus
+      ``n_migrants`` mejores individuos (solo la permutación) a la isla
+      siguiente y reemplaza a sus peores individuos por los inmigrantes que
+      haya recibido, reevaluándolos localmente
+    - La mejor solución global es la mejor de todas las islas (ante empates,
+      la de menor índice)
+
+    Con ``n_jobs=1`` las islas se ejecutan una tras otra en este proceso (la
+    migración solo llega a las islas posteriores) y el resultado es
+    reproducible; en paralelo, cuándo llega cada migración depende de la
+    velocidad relativa de los procesos.
+
+    Parámetros:
+        n_islands: Número de islas (poblaciones)
+        migration_interval: Generaciones entre migraciones
+        n_migrants: Individuos que emigran en cada migración
+        n_jobs: Procesos (None = uno por isla, hasta el número de núcleos)
+        seed: Semilla base
+        population_size, n_generations, beam_width, crossover_rate,
+        mutation_rate, tournament_size, elitism, subset_routes:
+            Configuración de cada isla (ver GABeamSolver)
+        progress_callback: Recibe un evento "iteration" por isla terminada
+        progress_interval: Islas entre eventos
+        cancel_token: Token para cancelar el solve desde fuera
+        time_budget: Segundos de reloj máximos para el solve
+    """
+
+    # Segundos entre chequeos de cancelación mientras se esperan las islas
+    POLL_INTERVAL = 0.05
+
+    def __init__(
+        self,
+        n_islands: int = 4,
+        migration_interval: int = 10,
+        n_migrants: int = 2,
+        n_jobs: Optional[int] = None,
+        seed: int = 0,
+        population_size: int = 30,
+        n_generations: int = 100,
+        beam_width: int = 5,
+        crossover_rate: float = 0.8,
+        mutation_rate: float = 0.2,
+        tournament_size: int = 3,
+        elitism: int = 2,
+        subset_routes: bool = True,
+        progress_callback: Optional[ProgressCallback] = None,
+        progress_interval: int = 1,
+        cancel_token: Optional[CancelToken] = None,
+        time_budget: Optional[float] = None,
+    ):
+        if n_islands < 1:
+            raise ValueError(f"n_islands debe ser positivo: {n_islands!r}")
+        if migration_interval < 1:
+            raise ValueError(f"migration_interval debe ser positivo: {migration_interval!r}")
+        if n_jobs is not None and n_jobs < 1:
+            raise ValueError(f"n_jobs debe ser positivo: {n_jobs!r}")
+        self.n_islands = n_islands
+        self.migration_interval = migration_interval
+        self.n_migrants = n_migrants
+        self.n_jobs = n_jobs
+        self.seed = seed
+        self.population_size = population_size
+        self.n_generations = n_generations
+        self.beam_width = beam_width
+        self.crossover_rate = crossover_rate
+        self.mutation_rate = mutation_rate
+        self.tournament_size = tournament_size
+        self.elitism = elitism
+        self.subset_routes = subset_routes
+        self._configure_progress(
+            progress_callback, progress_interval, cancel_token, time_budget
+        )
+        self.visited_nodes = 0
+
+    def solve(
+        self,
+        instance: DTPInstance,
+        time_limit: Optional[float] = None,
+        node_limit: Optional[int] = None,
+    ) -> DTPSolution:
+        """
+        Evoluciona todas las islas y devuelve la mejor solución.
+
+        Args:
+            instance: Instancia del problema DTP
+            time_limit: Segundos de reloj para esta llamada (plazo común a
+                todas las islas)
+            node_limit: Máximo de rutas evaluadas (se verifica entre islas)
+        """
+        self._start_run(time_limit, node_limit)
+        self.visited_nodes = 0
+        n_jobs = min(self.n_jobs or os.cpu_count() or 1, self.n_islands)
+
+        deadline = (
+            time.monotonic() + self._time_limit if self._time_limit is not None else None
+        )
+
+        best: Optional[DTPSolution] = None
+        for index, (solution, evaluated) in enumerate(
+            self._run_islands(instance, n_jobs, deadline)
+        ):
+            self.visited_nodes += evaluated
+            if solution is not None and (
+                best is None or solution.beneficio_final > best.beneficio_final
+            ):
+                best = solution
+
+            if (index + 1) % self.progress_interval == 0:
+                self._emit(
+                    "iteration",
+                    iteration=index + 1,
+                    visited_nodes=self.visited_nodes,
+                    best_benefit=best.beneficio_final if best else None,
+                )
+            self._should_stop(self.visited_nodes)
+
+        if best is None:
+            best = self._make_island(None)._build_trivial_solution(instance)
+        return self._finish_run(best, self.visited_nodes)
+
+    def _run_islands(self, instance: DTPInstance, n_jobs: int, deadline: Optional[float]):
+        """Resultados ``(mejor solución, rutas evaluadas)`` de cada isla, en orden."""
+        if n_jobs == 1:
+            queues = [queue.Queue() for _ in range(self.n_islands)]
+            stop = self.cancel_token or CancelToken()
+            for index in range(self.n_islands):
+                if self._should_stop(self.visited_nodes):
+                    return
+                yield self._run_island(instance, index, queues, stop, deadline)
+            return
+
+        ctx = mp.get_context()
+        queues = [ctx.Queue() for _ in range(self.n_islands)]
+        stop_event = ctx.Event()
+
+        # Los procesos no reportan progreso ni se cancelan: lo hace este proceso
+        worker = copy.copy(self)
+        worker._configure_progress(None, self.progress_interval, None, None)
+
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            mp_context=ctx,
+            initializer=_init_island_worker,
+            initargs=(worker, instance, queues, stop_event, deadline),
+        ) as pool:
+            futures = [pool.submit(_run_island_in_worker, i) for i in range(self.n_islands)]
+            for future in futures:
+                # Mientras se espera, vigilar la cancelación y el plazo
+                while not wait([future], timeout=self.POLL_INTERVAL).done:
+                    if self._should_stop(self.visited_nodes):
+                        stop_event.set()
+                        for pending in futures:
+                            pending.cancel()
+                if not future.cancelled():
+                    yield future.result()
+
+    def _make_island(self, stop: Optional[CancelToken]) -> GABeamSolver:
+        return GABeamSolver(
+            population_size=self.population_size,
+            n_generations=self.n_generations,
+            beam_width=self.beam_width,
+            crossover_rate=self.crossover_rate,
+            mutation_rate=self.mutation_rate,
+            tournament_size=self.tournament_size,
+            elitism=self.elitism,
+            subset_routes=self.subset_routes,
+            cancel_token=stop,
+        )
+
+    def _run_island(
+        self,
+        instance: DTPInstance,
+        index: int,
+        queues: list,
+        stop: CancelToken,
+        deadline: Optional[float],
+    ) -> Tuple[Optional[DTPSolution], int]:
+        """Evoluciona una isla, migrando con la isla siguiente del anillo."""
+        time_limit = None
+        if deadline is not None:
+            time_limit = deadline - time.monotonic()
+            if time_limit <= 0:
+                return None, 0
+
+        # Generador propio: en serie no se toca el estado global de ``random``
+        rng = random.Random(self.seed + index)
+        ga = self._make_island(stop)
+        inbox = queues[index]
+        outbox = queues[(index + 1) % self.n_islands]
+        immigrants_evaluated = 0
+
+        def migrate(generation: int, population: List[List[int]], fitness_scores: List) -> None:
+            nonlocal immigrants_evaluated
+            if self.n_islands < 2 or generation % self.migration_interval:
+                return
+
+            ranked = sorted(
+                range(len(population)),
+                key=lambda i: fitness_scores[i][1]
+                if fitness_scores[i] is not None
+                else float("-inf"),
+                reverse=True,
+            )
+
+            # Emigrar: copias de los mejores individuos factibles
+            for i in ranked[: self.n_migrants]:
+                if fitness_scores[i] is not None:
+                    outbox.put(list(population[i]))
+
+            # Inmigrar: reemplazar a los peores por los recién llegados
+            arrived = []
+            while len(arrived) < self.n_migrants:
+                try:
+                    arrived.append(inbox.get_nowait())
+                except queue.Empty:
+                    break
+            for slot, route in zip(reversed(ranked), arrived):
+                population[slot] = route
+                fitness_scores[slot] = ga._evaluate_route(instance, route)
+                immigrants_evaluated += 1
+
+        ga._start_run(time_limit)
+        best, evaluated = ga._evolve(instance, None, migrate, rng)
+        return best, evaluated + immigrants_evaluated
+
+    def is_feasible(self, instance: DTPInstance, solution: DTPSolution) -> bool:
+        """Verifica factibilidad de la solución."""
+        return self._make_island(None).is_feasible(instance, solution)
+
+    def evaluate(self, instance: DTPInstance, solution: DTPSolution) -> float:
+        """Evalúa la solución."""
+        return solution.beneficio_final
@@ -0,0 +1,68 @@
+"""Movimientos de vecindario para la búsqueda local sobre rutas del DTP.
+
+Cada generador recibe una ruta completa (Ámsterdam al inicio y al final) y
+produce pares ``(start, nueva_ruta)``: ``nueva_ruta`` coincide con la original
+en las posiciones ``0..start``, así que su simulación puede reanudarse desde el
+estado guardado de la ruta actual en ``start`` (ver ``RouteTrace``).
+"""
+
+from typing import Callable, Iterable, Iterator
+
+Move = tuple[int, tuple[int, ...]]
+
+
+def two_opt_moves(route: tuple[int, ...], pairs: Iterable[tuple[int, int]]) -> Iterator[Move]:
+    """Invierte el segmento ``route[i..j]`` para cada par (i, j) dado."""
+    for i, j in pairs:
+        yield i - 1, route[:i] + tuple(reversed(route[i : j + 1])) + route[j + 1 :]
+
+
+def swap_moves(route: tuple[int, ...]) -> Iterator[Move]:
+    """Intercambia dos puertos no adyacentes de la ruta."""
+    last = len(route) - 1
+    for i in range(1, last - 2):
+        for j in range(i + 2, last):
+            new_route = list(route)
+            new_route[i], new_route[j] = new_route[j], new_route[i]
+            yield i - 1, tuple(new_route)
+
+
+def or_opt_moves(route: tuple[int, ...], max_segment: int = 3) -> Iterator[Move]:
+    """Mueve un segmento de 1 a ``max_segment`` puertos a otra posición."""
+    last = len(route) - 1
+    for length in range(1, max_segment + 1):
+        for i in range(1, last - length + 1):
+            segment = route[i : i + length]
+            rest = route[:i] + route[i + length :]
+            for k in range(1, len(rest)):
+                if k == i:
+                    continue
+                yield min(i, k) - 1, rest[:k] + segment + rest[k:]
+
+
+def insert_moves(route: tuple[int, ...], n_ports: int) -> Iterator[Move]:
+    """Inserta un puerto no visitado en cada posición posible."""
+    visited = set(route)
+    for port in range(1, n_ports + 1):
+        if port in visited:
+            continue
+        for k in range(1, len(route)):
+            yield k - 1, route[:k] + (port,) + route[k:]
+
+
+def drop_moves(route: tuple[int, ...]) -> Iterator[Move]:
+    """Elimina un puerto de la ruta (conservando al menos uno)."""
+    last = len(route) - 1
+    if last < 3:
+        return
+    for i in range(1, last):
+        yield i - 1, route[:i] + route[i + 1 :]
+
+
+# Vecindarios disponibles, salvo 2-OPT (que depende de las listas de candidatos)
+NEIGHBORHOODS: dict[str, Callable[[tuple[int, ...], int], Iterator[Move]]] = {
+    "swap": lambda route, n_ports: swap_moves(route),
+    "or_opt": lambda route, n_ports: or_opt_moves(route),
+    "insert": insert_moves,
+    "drop": lambda route, n_ports: drop_moves(route),
+}
@@ -1,17 +1,87 @@
 from solver.schemas.dtp import DTPInstance, DTPSolution
 from abc import ABC, abstractmethod
-from typing import Iterable, Sequence
+from typing import Any, Callable, Iterable, Sequence
 
+import dataclasses
 import itertools
+import threading
+import time
 import numpy as np
 
 
+ProgressCallback = Callable[[dict[str, Any]], None]
+
+
+class CancelToken:
+    """Token de cancelación cooperativa.
+
+    Se comparte entre quien lanza el solve y el solver; este consulta
+    ``cancelled`` periódicamente y termina devolviendo lo mejor encontrado.
+    Es seguro usarlo desde otro hilo (p. ej. un timeout de un servidor).
+
+    Args:
+        event: Evento subyacente; por defecto un ``threading.Event``. Con un
+            ``multiprocessing.Event`` el token también cancela procesos hijos.
+    """
+
+    def __init__(self, event: Any = None):
+        self._event = event if event is not None else threading.Event()
+
+    def cancel(self) -> None:
+        """Solicita la cancelación del solve en curso."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Si se solicitó la cancelación."""
+        return self._event.is_set()
+
+
 class ABCSolver(ABC):
-    """Interface base para cualquier solver del Comerciante Holandés."""
+    """Interface base para cualquier solver del Comerciante Holandés.
+
+    PROTOCOLO DE PROGRESO Y CANCELACIÓN:
+    - ``progress_callback`` recibe eventos como diccionarios con al menos las
+      claves ``event``, ``solver``, ``elapsed`` (segundos desde el inicio del
+      solve), ``visited_nodes`` y ``best_benefit`` (None si aún no hay solución).
+    - Eventos comunes: "start", "finish" e "iteration" (por iteración o
+      generación); BruteForceSolver emite además "route_progress" y "dfs_progress".
+    - ``progress_interval`` espacía los eventos frecuentes (cada cuántas
+      unidades de trabajo, según el solver).
+    - ``cancel_token`` y ``time_budget`` (segundos de reloj) detienen el solve
+      de forma cooperativa; el solver devuelve la mejor solución encontrada y
+      deja ``interrupted = True``. Lo mismo ocurre con los límites por llamada
+      ``time_limit`` y ``node_limit`` de ``solve``.
+    """
+
+    progress_callback: ProgressCallback | None = None
+    progress_interval: int = 1
+    cancel_token: CancelToken | None = None
+    time_budget: float | None = None
+    interrupted: bool = False
+    _time_limit: float | None = None
+    _node_limit: int | None = None
 
     @abstractmethod
-    def solve(self, instance: DTPInstance) -> DTPSolution:
-        """Resuelve la instancia y devuelve una solución candidata."""
+    def solve(
+        self,
+        instance: DTPInstance,
+        time_limit: float | None = None,
+        node_limit: int | None = None,
+    ) -> DTPSolution:
+        """Resuelve la instancia y devuelve una solución candidata.
+
+        Args:
+            instance: Instancia del problema
+            time_limit: Segundos de reloj para esta llamada (se combina con
+                ``time_budget``: rige el menor)
+            node_limit: Máximo de unidades de trabajo (nodos, estados o rutas
+                evaluadas, según el solver)
+
+        Returns:
+            La mejor solución encontrada dentro del presupuesto. ``es_optimo``
+            indica si el solver completó una búsqueda exacta.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -24,6 +94,87 @@ class ABCSolver(ABC):
         """Evalúa la solución para la instancia dada y devuelve el beneficio final."""
         raise NotImplementedError
 
+    # -------- Progreso y cancelación --------
+    def _configure_progress(
+        self,
+        progress_callback: ProgressCallback | None,
+        progress_interval: int,
+        cancel_token: CancelToken | None,
+        time_budget: float | None,
+    ) -> None:
+        """Guarda los parámetros del protocolo de progreso (para los __init__)."""
+        if progress_interval < 1:
+            raise ValueError(f"progress_interval debe ser positivo: {progress_interval!r}")
+        self.progress_callback = progress_callback
+        self.progress_interval = progress_interval
+        self.cancel_token = cancel_token
+        self.time_budget = time_budget
+
+    def _start_run(
+        self, time_limit: float | None = None, node_limit: int | None = None
+    ) -> None:
+        """Reinicia el reloj, los límites y el estado de interrupción de un solve."""
+        self._run_started = time.perf_counter()
+        self.interrupted = False
+        limits = [t for t in (self.time_budget, time_limit) if t is not None]
+        self._time_limit = min(limits) if limits else None
+        self._node_limit = node_limit
+        self._emit("start", visited_nodes=0, best_benefit=None)
+
+    def _elapsed(self) -> float:
+        return time.perf_counter() - getattr(self, "_run_started", time.perf_counter())
+
+    def _emit(self, event: str, **data: Any) -> None:
+        """Envía un evento de progreso al callback, si lo hay."""
+        if self.progress_callback is None:
+            return
+        payload = {
+            "event": event,
+            "solver": type(self).__name__,
+            "elapsed": self._elapsed(),
+        }
+        payload.update(data)
+        self.progress_callback(payload)
+
+    def _should_stop(self, visited_nodes: int | None = None) -> bool:
+        """Si hay que detener el solve (cancelación o presupuesto agotado).
+
+        Args:
+            visited_nodes: Trabajo realizado hasta ahora, para ``node_limit``
+        """
+        if not self.interrupted:
+            if self.cancel_token is not None and self.cancel_token.cancelled:
+                self.interrupted = True
+            elif self._time_limit is not None and self._elapsed() >= self._time_limit:
+                self.interrupted = True
+            elif (
+                self._node_limit is not None
+                and visited_nodes is not None
+                and visited_nodes >= self._node_limit
+            ):
+                self.interrupted = True
+        return self.interrupted
+
+    def _finish_run(
+        self, solution: DTPSolution, visited_nodes: int, optimal: bool = False
+    ) -> DTPSolution:
+        """Marca si la solución es óptima, emite el evento final y la devuelve.
+
+        La marca se pone en una copia superficial: ``solution`` puede estar
+        compartida (p. ej. en un ``RouteEvaluationCache``) con otros solvers.
+
+        Args:
+            optimal: Si la búsqueda es exacta (solo cuenta si no fue interrumpida)
+        """
+        solution = dataclasses.replace(solution, es_optimo=optimal and not self.interrupted)
+        self._emit(
+            "finish",
+            visited_nodes=visited_nodes,
+            best_benefit=solution.beneficio_final,
+            interrupted=self.interrupted,
+        )
+        return solution
+
     # -------- Helpers --------
     def _port_permutations(self, n_ports: int) -> Iterable[tuple[int, ...]]:
         ports = list(range(1, n_ports + 1))
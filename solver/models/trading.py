@@ -0,0 +1,369 @@
+"""Políticas de trading del DTP: qué comprar y vender a lo largo de una ruta.
+
+Todos los solvers comparten la misma estructura: al llegar a un puerto se vende
+toda la carga y se compra pensando en venderla en el próximo puerto. Lo que
+cambia es cómo se decide la compra de cada tramo. Cada ``TradePolicy`` encapsula
+una de esas decisiones y sabe simular rutas completas con ella:
+
+- ``GreedyKnapsack``: mochila fraccionaria truncada a enteros (``greedy_purchases``)
+- ``ExactKnapsack``: mochila entera acotada exacta, memoizada por tramo
+  (``instance.derived.knapsack``)
+- ``BeamTrading``: beam search sobre los estados (capital, carga) de la ruta,
+  que explora no comprar o comprar greedy las 1 o 2 mercancías de mejor ratio
+
+Las compras se deciden siempre para muchos estados a la vez (``purchases``) y
+las rutas se simulan en lote (``simulate_many``), así que cualquier
+optimización de ``greedy_purchases`` o ``simulate_routes`` llega a todos los
+solvers.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+
+from solver.models.batch import SimulationWorkspace, greedy_purchases, simulate_routes
+from solver.schemas.dtp import DTPInstance, DTPSolution
+from solver.schemas.trade_table import trade_table
+
+
+class TradePolicy(ABC):
+    """Política de trading: compra de cada tramo y simulación de rutas.
+
+    Cada política tiene su propio ``SimulationWorkspace``: las simulaciones
+    reutilizan sus buffers, así que un solver (que tiene su propia política)
+    no reserva memoria por ruta evaluada salvo para las soluciones que
+    devuelve. Por eso una misma política no debe usarse desde varios hilos.
+    """
+
+    def __init__(self):
+        self.workspace = SimulationWorkspace()
+
+    @property
+    @abstractmethod
+    def policy_id(self) -> str:
+        """Identificador de la política (clave del caché de evaluaciones)."""
+
+    @abstractmethod
+    def purchases(
+        self,
+        instance: DTPInstance,
+        ports,
+        next_ports,
+        capital: np.ndarray,
+        capacity: np.ndarray,
+        workspace: Optional[SimulationWorkspace] = None,
+    ) -> np.ndarray:
+        """Compras de muchos estados a la vez (firma de ``greedy_purchases``).
+
+        Args:
+            instance: Instancia del problema
+            ports: Puerto de compra de cada estado (arreglo o un único puerto)
+            next_ports: Puerto de venta de cada estado (arreglo o un único puerto)
+            capital: Capital disponible de cada estado
+            capacity: Capacidad de bodega disponible de cada estado
+            workspace: Buffers reutilizables; con él, el resultado puede ser
+                un buffer que se sobrescribe en la siguiente llamada
+
+        Returns:
+            Cantidades a comprar (estados × mercancías)
+        """
+
+    def buy(
+        self,
+        instance: DTPInstance,
+        port: int,
+        next_port: int,
+        capital: float,
+        capacity: float,
+    ) -> np.ndarray:
+        """Compras de un único estado en ``port`` pensando en vender en ``next_port``."""
+        state = self.workspace.array("buy_state", (2, 1))
+        state[0, 0] = capital
+        state[1, 0] = capacity
+        return self.purchases(
+            instance, port, next_port, state[0], state[1], workspace=self.workspace
+        )[0].copy()
+
+    def simulate(self, instance: DTPInstance, route: Sequence[int]) -> Optional[DTPSolution]:
+        """Simula una ruta completa; None si es infactible."""
+        return self.simulate_many(instance, [route])[0]
+
+    def simulate_many(
+        self, instance: DTPInstance, routes: Sequence[Sequence[int]]
+    ) -> List[Optional[DTPSolution]]:
+        """Simula varias rutas con ``simulate_routes``, un lote por cada longitud.
+
+        Equivale a llamar ``simulate`` sobre cada ruta.
+        """
+        solutions: List[Optional[DTPSolution]] = [None] * len(routes)
+
+        by_length: dict[int, list[int]] = {}
+        for i, route in enumerate(routes):
+            by_length.setdefault(len(route), []).append(i)
+
+        for indices in by_length.values():
+            batch = simulate_routes(
+                instance,
+                np.array([routes[i] for i in indices]),
+                self.purchases,
+                self.workspace,
+            )
+            for row, i in enumerate(indices):
+                if batch.factible[row]:
+                    # Los arreglos del lote son buffers del workspace: copiarlos
+                    solutions[i] = DTPSolution(
+                        ruta=tuple(routes[i]),
+                        compras=batch.compras[row].copy(),
+                        ventas=batch.ventas[row].copy(),
+                        beneficio_final=float(batch.beneficio_final[row]),
+                    )
+
+        return solutions
+
+
+class GreedyKnapsack(TradePolicy):
+    """Mochila greedy: llena la bodega por ratio ganancia/peso descendente."""
+
+    @property
+    def policy_id(self) -> str:
+        return "greedy_knapsack"
+
+    def purchases(
+        self, instance, ports, next_ports, capital, capacity, workspace=None
+    ) -> np.ndarray:
+        return greedy_purchases(
+            instance, ports, next_ports, capital, capacity, workspace=workspace
+        )
+
+
+class ExactKnapsack(TradePolicy):
+    """Mochila entera acotada exacta por tramo (ver ``LegKnapsack``)."""
+
+    @property
+    def policy_id(self) -> str:
+        return "exact_knapsack"
+
+    def purchases(
+        self, instance, ports, next_ports, capital, capacity, workspace=None
+    ) -> np.ndarray:
+        n_states = len(capital)
+        ports = np.broadcast_to(ports, (n_states,))
+        next_ports = np.broadcast_to(next_ports, (n_states,))
+        knapsack = instance.derived.knapsack
+        return np.array(
+            [
+                knapsack.solve(int(i), int(j), float(c), float(w))
+                for i, j, c, w in zip(ports, next_ports, capital, capacity)
+            ]
+        ).reshape(n_states, instance.m)
+
+
+@dataclass(slots=True)
+class BeamLayer:
+    """Estados del beam search de trading tras una parada de la ruta.
+
+    Cada estado vende toda su carga al llegar, compra y paga el viaje; su
+    carga al partir es justamente lo que compró en la parada.
+
+    Atributos (S estados, m mercancías):
+        capital: Capital de cada estado tras pagar el viaje (S,)
+        cargo: Carga comprada por cada estado en la parada (S × m)
+        parent: Índice del estado padre en la capa anterior (S,)
+    """
+
+    capital: np.ndarray
+    cargo: np.ndarray
+    parent: np.ndarray
+
+    @staticmethod
+    def history(
+        layers: List["BeamLayer"], state: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Matrices de compras y ventas (m × paradas) del camino hasta ``state``.
+
+        Args:
+            layers: Capas del beam, una por parada salvo el retorno final
+            state: Índice del estado en la última capa
+        """
+        m = layers[0].cargo.shape[1]
+        n_stops = len(layers) + 1
+        compras = np.zeros((m, n_stops))
+        for idx in range(len(layers) - 1, -1, -1):
+            compras[:, idx] = layers[idx].cargo[state]
+            state = layers[idx].parent[state]
+        # Al llegar a cada parada se vende lo comprado en la anterior
+        ventas = np.zeros((m, n_stops))
+        ventas[:, 1:] = compras[:, :-1]
+        return compras, ventas
+
+
+class BeamTrading(TradePolicy):
+    """
+    Beam search sobre los estados de trading de la ruta.
+
+    Mantiene los ``width`` estados (capital, carga) de mayor capital en cada
+    puerto como arreglos (``BeamLayer``): los sucesores de todo el beam se
+    generan juntos y los mejores se eligen con ``np.argpartition``. Las
+    matrices de compras/ventas se reconstruyen solo para el estado ganador.
+    Fuera del beam (``purchases``) compra como ``GreedyKnapsack``.
+
+    Parámetros:
+        width: Número de estados a mantener en cada puerto
+    """
+
+    # Mercancías de mejor ratio que puede comprar cada sucesor
+    MAX_GOODS = 2
+
+    def __init__(self, width: int = 5):
+        if width < 1:
+            raise ValueError(f"width debe ser positivo: {width!r}")
+        super().__init__()
+        self.width = width
+
+    @property
+    def policy_id(self) -> str:
+        return f"beam:width={self.width}"
+
+    def purchases(
+        self, instance, ports, next_ports, capital, capacity, workspace=None
+    ) -> np.ndarray:
+        return greedy_purchases(
+            instance, ports, next_ports, capital, capacity, workspace=workspace
+        )
+
+    def simulate_many(
+        self, instance: DTPInstance, routes: Sequence[Sequence[int]]
+    ) -> List[Optional[DTPSolution]]:
+        return [self._search(instance, list(route)) for route in routes]
+
+    def _search(self, instance: DTPInstance, route: List[int]) -> Optional[DTPSolution]:
+        """Verifica el tiempo de la ruta y aplica el beam search."""
+        total_time = sum(
+            instance.tiempos[route[i], route[i + 1]] for i in range(len(route) - 1)
+        )
+        if total_time > instance.tiempo_maximo:
+            return None
+
+        m = instance.pesos.shape[0]
+        n_stops = len(route)
+
+        # Inicializar beam con estado inicial
+        capital = np.array([float(instance.capital_inicial)])
+        cargo = np.zeros((1, m))
+        layers: List[BeamLayer] = []
+
+        # Procesar cada transición en la ruta
+        for idx in range(n_stops - 1):
+            layer = self._successors(
+                instance, route[idx], route[idx + 1], capital, cargo, idx < n_stops - 2
+            )
+            if layer is None:
+                return None
+
+            keep = self.top_states(layer.capital, self.width)
+            layer = BeamLayer(layer.capital[keep], layer.cargo[keep], layer.parent[keep])
+            layers.append(layer)
+            capital, cargo = layer.capital, layer.cargo
+
+        # Mejor estado final (el beam queda ordenado de mayor a menor capital)
+        compras_matrix, ventas_matrix = BeamLayer.history(layers, 0)
+
+        return DTPSolution(
+            ruta=tuple(route),
+            compras=compras_matrix,
+            ventas=ventas_matrix,
+            beneficio_final=float(capital[0]),
+        )
+
+    @staticmethod
+    def top_states(capital: np.ndarray, k: int) -> np.ndarray:
+        """
+        Índices de los k estados de mayor capital, de mayor a menor.
+
+        Equivale a un ordenamiento estable descendente truncado a k (ante
+        empates gana el menor índice), pero solo ordena los k elegidos.
+        """
+        if len(capital) > k:
+            threshold = capital[np.argpartition(-capital, k - 1)[k - 1]]
+            above = np.flatnonzero(capital > threshold)
+            tied = np.flatnonzero(capital == threshold)[: k - len(above)]
+            chosen = np.concatenate((above, tied))
+        else:
+            chosen = np.arange(len(capital))
+        return chosen[np.lexsort((chosen, -capital[chosen]))]
+
+    def _successors(
+        self,
+        instance: DTPInstance,
+        current_port: int,
+        next_port: int,
+        capital: np.ndarray,
+        cargo: np.ndarray,
+        can_buy: bool,
+    ) -> Optional[BeamLayer]:
+        """
+        Genera los sucesores de todos los estados del beam a la vez.
+
+        Cada estado vende toda su carga y genera, en este orden, el sucesor
+        que no compra y los que compran greedy las 1 o 2 mercancías de mejor
+        ratio del tramo. Retorna None si ningún estado puede pagar el viaje.
+        """
+        m = instance.pesos.shape[0]
+
+        # 1. VENDER todo lo que tengamos
+        new_capital = capital.copy()
+        for k in range(m):
+            new_capital += cargo[:, k] * instance.precios_compra[k, current_port]
+
+        # 2. Calcular costo de viaje
+        travel_cost = instance.costos[current_port, next_port]
+        feasible = np.flatnonzero(new_capital >= travel_cost)
+        if len(feasible) == 0:
+            return None  # No factible
+        new_capital = new_capital[feasible]
+        n_states = len(feasible)
+
+        # 3. COMPRAR: no comprar nada (opción base) o las top mercancías; la
+        # opción t compra las cantidades greedy de las t primeras
+        goods: np.ndarray = np.empty(0, dtype=int)
+        if can_buy:
+            goods = trade_table(instance).ranked(current_port, next_port)[: self.MAX_GOODS]
+        n_options = len(goods) + 1
+
+        cantidades = greedy_purchases(
+            instance,
+            current_port,
+            next_port,
+            new_capital - travel_cost,
+            np.full(n_states, float(instance.capacidad_bodega)),
+            max_goods=len(goods),
+            workspace=self.workspace,
+        )
+
+        # Sucesores en orden (estado, opción)
+        succ_capital = np.empty((n_states, n_options))
+        succ_cargo = np.zeros((n_states, n_options, m))
+        succ_capital[:, 0] = new_capital - travel_cost
+        spent = np.zeros(n_states)
+        for r, k in enumerate(goods):
+            spent = spent + cantidades[:, k] * instance.precios_venta[k, current_port]
+            succ_capital[:, r + 1] = new_capital - spent - travel_cost
+            succ_cargo[:, r + 1 :, k] = cantidades[:, k, None]
+
+        succ_capital = succ_capital.reshape(-1)
+        succ_cargo = succ_cargo.reshape(-1, m)
+        parent = np.repeat(feasible, n_options)
+
+        valid = np.flatnonzero(succ_capital >= 0)
+        return BeamLayer(succ_capital[valid], succ_cargo[valid], parent[valid])
+
+
+def make_trade_policy(knapsack: Literal["greedy", "exact"] = "greedy") -> TradePolicy:
+    """Política que compra en cada tramo con la mochila indicada."""
+    if knapsack == "greedy":
+        return GreedyKnapsack()
+    if knapsack == "exact":
+        return ExactKnapsack()
+    raise ValueError(f"knapsack desconocido: {knapsack!r}")
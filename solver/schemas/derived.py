@@ -0,0 +1,148 @@
+"""Datos derivados de una instancia del DTP, calculados bajo demanda.
+
+Varios solvers derivan las mismas estructuras de la instancia (máximos de
+costo y tiempo, matrices normalizadas, vecinos ordenados, tabla de ganancias
+y mochilas exactas por tramo). ``DerivedData`` las calcula la primera vez que
+se piden y las memoiza; se obtiene con ``instance.derived`` y se comparte
+entre todos los solvers que usan la misma instancia.
+
+La vista se descarta cuando se reasigna un atributo de la instancia. Si se
+modifica un arreglo en el lugar (``instance.costos[i, j] = ...``) hay que
+llamar a ``instance.invalidate_derived()``.
+"""
+
+from typing import TYPE_CHECKING, Any, Callable
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .dtp import DTPInstance
+    from .knapsack import LegKnapsack
+    from .trade_table import TradeTable
+
+
+class DerivedData:
+    """Vista memoizada de datos derivados de una ``DTPInstance``."""
+
+    __slots__ = ("_instance", "_memo")
+
+    def __init__(self, instance: "DTPInstance"):
+        self._instance = instance
+        self._memo: dict[Any, Any] = {}
+
+    def _get(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """Retorna el valor memoizado de ``key`` o lo calcula con ``compute``."""
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    # -------- Costos y tiempos --------
+    @property
+    def max_cost(self) -> float:
+        """Mayor costo de viaje finito."""
+        costos = self._instance.costos
+        return self._get("max_cost", lambda: float(np.max(costos[costos < np.inf])))
+
+    @property
+    def max_time(self) -> float:
+        """Mayor tiempo de viaje finito."""
+        tiempos = self._instance.tiempos
+        return self._get("max_time", lambda: float(np.max(tiempos[tiempos < np.inf])))
+
+    @property
+    def combined_cost(self) -> np.ndarray:
+        """Promedio de costo y tiempo normalizados por sus máximos, por arista."""
+        instance = self._instance
+        return self._get(
+            "combined_cost",
+            lambda: 0.5 * instance.costos / self.max_cost
+            + 0.5 * instance.tiempos / self.max_time,
+        )
+
+    def neighbors(self, criterion: str = "combined") -> np.ndarray:
+        """Puertos ordenados por cercanía desde cada puerto (sin el propio puerto).
+
+        Args:
+            criterion: "min_cost", "min_time" o "combined"
+
+        Returns:
+            Matriz (n + 1) × n: la fila i lista los demás puertos de menor a
+            mayor costo/tiempo desde i (estable: ante empates, el menor índice)
+        """
+        return self._get(("neighbors", criterion), lambda: self._neighbors(criterion))
+
+    def _neighbors(self, criterion: str) -> np.ndarray:
+        if criterion == "min_cost":
+            scores = self._instance.costos
+        elif criterion == "min_time":
+            scores = self._instance.tiempos
+        elif criterion == "combined":
+            scores = self.combined_cost
+        else:
+            raise ValueError(f"Criterio de vecindad desconocido: {criterion!r}")
+
+        order = np.argsort(scores, axis=1, kind="stable")
+        n_ports = order.shape[0]
+        not_self = order != np.arange(n_ports)[:, None]
+        return order[not_self].reshape(n_ports, n_ports - 1)
+
+    def candidates(self, criterion: str = "combined", k: int = 10) -> np.ndarray:
+        """Listas de candidatos: los k puertos más cercanos a cada puerto.
+
+        Excluyen al propio puerto y a Ámsterdam (0), que solo es destino del
+        retorno final. Sirven como vecindario restringido de los solvers; quien
+        las use debe recurrir a ``neighbors`` si ningún candidato es viable.
+
+        Args:
+            criterion: "min_cost", "min_time" o "combined"
+            k: Candidatos por puerto (se recorta a n - 1)
+
+        Returns:
+            Matriz (n + 1) × min(k, n - 1), cada fila de más a menos cercano
+        """
+        k = max(0, min(k, self._instance.n - 1))
+        return self._get(("candidates", criterion, k), lambda: self._candidates(criterion, k))
+
+    def _candidates(self, criterion: str, k: int) -> np.ndarray:
+        neighbors = self.neighbors(criterion)
+        n_ports = neighbors.shape[0]
+        rows = neighbors[neighbors != 0].reshape(-1)
+        # La fila 0 no contiene a Ámsterdam (es el propio puerto): tiene un elemento más
+        head, tail = rows[: n_ports - 1], rows[n_ports - 1 :]
+        result = np.empty((n_ports, k), dtype=neighbors.dtype)
+        result[0] = head[:k]
+        result[1:] = tail.reshape(n_ports - 1, n_ports - 2)[:, :k]
+        return result
+
+    # -------- Copias contiguas --------
+    def as_array(self, name: str, dtype: type = np.float64) -> np.ndarray:
+        """Copia C-contigua (de solo lectura) de un arreglo de la instancia.
+
+        Args:
+            name: Atributo de la instancia ("costos", "tiempos", "pesos", ...)
+            dtype: Tipo de los elementos (p. ej. np.float32 para ahorrar memoria)
+        """
+
+        def compute() -> np.ndarray:
+            array = np.ascontiguousarray(getattr(self._instance, name), dtype=dtype)
+            if array is getattr(self._instance, name):
+                array = array.copy()
+            array.flags.writeable = False
+            return array
+
+        return self._get(("array", name, np.dtype(dtype).str), compute)
+
+    # -------- Trading --------
+    @property
+    def trade_table(self) -> "TradeTable":
+        """Tabla de ganancias y orden de compra por tramo."""
+        from .trade_table import TradeTable
+
+        return self._get("trade_table", lambda: TradeTable.build(self._instance))
+
+    @property
+    def knapsack(self) -> "LegKnapsack":
+        """Mochila exacta de compras por tramo, con caché LRU propio."""
+        from .knapsack import LegKnapsack
+
+        return self._get("knapsack", lambda: LegKnapsack(self._instance))
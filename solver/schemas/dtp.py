@@ -1,8 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from typing import Sequence, TypeAlias
+from typing import Any, Sequence, TypeAlias
 from numpy.typing import NDArray
 
+from .derived import DerivedData
+
 import numpy as np
 
 MatrixFloat: TypeAlias = NDArray[np.floating]
@@ -19,6 +21,10 @@ class DTPInstance:
 
     Por lo tanto: precios_compra < precios_venta (el puerto compra barato y vende caro)
     El comerciante hace lo opuesto: compra del puerto (a precios_venta) y vende al puerto (a precios_compra)
+
+    Los datos derivados (máximos, matrices normalizadas, vecinos ordenados,
+    tabla de ganancias) se obtienen de ``derived``, que los memoiza y se
+    descarta al reasignar cualquier atributo.
     """
 
     tiempos: MatrixFloat
@@ -36,6 +42,28 @@ class DTPInstance:
     umbral_beneficio: float
     capital_minimo: float
 
+    # Vista de datos derivados, creada bajo demanda
+    _derived: DerivedData | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Reasignar cualquier dato de la instancia invalida los derivados
+        object.__setattr__(self, name, value)
+        if name != "_derived":
+            object.__setattr__(self, "_derived", None)
+
+    @property
+    def derived(self) -> DerivedData:
+        """Datos derivados de la instancia (calculados bajo demanda y memoizados)."""
+        if self._derived is None:
+            self._derived = DerivedData(self)
+        return self._derived
+
+    def invalidate_derived(self) -> None:
+        """Descarta los datos derivados (tras modificar un arreglo en el lugar)."""
+        self._derived = None
+
     @property
     def n(self) -> int:
         """Número de puertos distintos de Ámsterdam."""
@@ -128,6 +156,7 @@ class DTPSolution:
     compras: MatrixFloat
     ventas: MatrixFloat
     beneficio_final: float
+    es_optimo: bool = False  # El solver demostró que es óptima (búsqueda completa)
 
     def __str__(self) -> str:
         """Representación en string legible de la solución."""
@@ -0,0 +1,229 @@
+"""Mochila entera acotada exacta por tramo para una instancia del DTP.
+
+La compra en un puerto i pensando en vender en el próximo puerto j es una
+mochila entera acotada con dos recursos: cada mercancía k aporta
+``profit[i, j, k]`` por unidad, cuesta ``precios_venta[k, i]`` de capital y
+``pesos[k]`` de bodega, y se pueden comprar hasta ``oferta_max[k, i]``
+unidades. El greedy fraccionario truncado a enteros puede dejar bodega o
+capital sin usar; ``LegKnapsack`` la resuelve de forma exacta con
+ramificación y acotación sobre las mercancías.
+
+Las soluciones se memoizan en un caché LRU por tramo y recursos redondeados
+hacia abajo a ``resolution``. La compra memoizada es óptima para los recursos
+redondeados y factible para cualquier recurso mayor; si además vale lo mismo
+que el óptimo con un paso más de ``resolution`` en ambos recursos, es óptima
+para todo recurso intermedio y se devuelve tal cual. Si no, se resuelve con
+los recursos reales, así que el resultado siempre es el óptimo exacto. El
+capital y la capacidad se recortan antes a lo máximo que se podría gastar o
+cargar en el tramo, así que los estados con recursos de sobra comparten entrada.
+"""
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .dtp import DTPInstance
+
+
+class LegKnapsack:
+    """Mochila exacta de compras por tramo (i, j) con caché LRU.
+
+    Se obtiene con ``instance.derived.knapsack``, de modo que el caché se
+    comparte entre solvers y se descarta cuando cambia la instancia.
+
+    Parámetros:
+        instance: Instancia a la que pertenecen los tramos
+        maxsize: Número máximo de soluciones memoizadas (None = sin límite)
+        resolution: Granularidad del capital y la capacidad en las claves
+    """
+
+    def __init__(
+        self, instance: "DTPInstance", maxsize: int | None = 65536, resolution: float = 1.0
+    ):
+        from .trade_table import trade_table
+
+        self.maxsize = maxsize
+        self.resolution = resolution
+        self.hits = 0
+        self.misses = 0
+        self._instance = instance
+        self._table = trade_table(instance)
+        self._legs: dict[tuple[int, int], tuple] = {}
+        self._entries: OrderedDict[tuple[int, int, float, float], tuple[np.ndarray, bool]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fracción de consultas resueltas desde el caché."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def solve(self, i: int, j: int, capital: float, capacity: float) -> np.ndarray:
+        """Compras óptimas en i para vender en j.
+
+        Args:
+            i: Puerto donde se compra
+            j: Puerto donde se venderá
+            capital: Capital disponible para comprar
+            capacity: Capacidad de bodega disponible
+
+        Returns:
+            Cantidades enteras a comprar de cada mercancía (arreglo de solo
+            lectura, posiblemente compartido con el caché: copiarlo antes de
+            modificarlo)
+        """
+        goods, profit, price, weight, offer = self._leg(i, j)
+        # Más recursos de los que el tramo puede usar no cambian la compra
+        # (se recortan a ese máximo redondeado hacia arriba, ya en la grilla)
+        capacity = min(capacity, self._round_up(float(np.sum(offer * weight))))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fits = np.where(weight > 0, np.floor(capacity / weight), np.inf)
+        capital = min(
+            capital, self._round_up(float(np.sum(np.minimum(offer, fits) * price)))
+        )
+
+        low_capital, low_capacity = self._round(capital), self._round(capacity)
+        key = (i, j, low_capital, low_capacity)
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        else:
+            self.misses += 1
+            compras, value = self._optimum(i, j, low_capital, low_capacity)
+            _, upper = self._optimum(
+                i, j, low_capital + self.resolution, low_capacity + self.resolution
+            )
+            self._entries[key] = (compras, value >= upper - 1e-9)
+            if self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        compras, tight = self._entries[key]
+        if tight or (capital, capacity) == (low_capital, low_capacity):
+            return compras
+        # El redondeo pierde ganancia en este intervalo: resolver con lo real
+        return self._optimum(i, j, capital, capacity)[0]
+
+    def _round(self, value: float) -> float:
+        return float(np.floor(value / self.resolution) * self.resolution)
+
+    def _round_up(self, value: float) -> float:
+        return -self._round(-value)
+
+    def _optimum(
+        self, i: int, j: int, capital: float, capacity: float
+    ) -> tuple[np.ndarray, float]:
+        """Compra óptima (solo lectura) y su ganancia para los recursos dados."""
+        goods, profit, price, weight, offer = self._leg(i, j)
+        compras = np.zeros(self._instance.m)
+        if len(goods) and capital >= 0 and capacity >= 0:
+            compras[goods] = self._branch_and_bound(
+                profit, price, weight, offer, capital, capacity
+            )
+        compras.flags.writeable = False
+        return compras, float(compras[goods] @ profit)
+
+    def _leg(self, i: int, j: int) -> tuple:
+        """Datos de las mercancías comprables del tramo (por ratio ganancia/peso)."""
+        if (i, j) not in self._legs:
+            instance = self._instance
+            goods = self._table.ranked(i, j)
+            price = instance.precios_venta[goods, i]
+            weight = instance.pesos[goods]
+            offer = np.floor(instance.oferta_max[goods, i])
+            self._legs[i, j] = (goods, self._table.profit[i, j, goods], price, weight, offer)
+        return self._legs[i, j]
+
+    @staticmethod
+    def _branch_and_bound(
+        profit: np.ndarray,
+        price: np.ndarray,
+        weight: np.ndarray,
+        offer: np.ndarray,
+        capital: float,
+        capacity: float,
+    ) -> np.ndarray:
+        """Ramificación y acotación sobre las mercancías (ya ordenadas por ratio).
+
+        La cota de cada nodo es la menor de dos mochilas fraccionarias sobre
+        las mercancías restantes: una que solo respeta la bodega y otra que
+        solo respeta el capital. La solución inicial es el greedy truncado,
+        así que el resultado nunca es peor que el greedy.
+        """
+        n = len(profit)
+        profit_l = profit.tolist()
+        price_l = price.tolist()
+        weight_l = weight.tolist()
+        offer_l = offer.tolist()
+        # Orden por ganancia/capital para la cota del capital
+        by_price = sorted(
+            range(n),
+            key=lambda r: -(profit_l[r] / price_l[r]) if price_l[r] > 0 else -np.inf,
+        )
+
+        def max_units(r: int, cap: float, room: float) -> int:
+            units = offer_l[r]
+            if price_l[r] > 0:
+                units = min(units, cap / price_l[r])
+            if weight_l[r] > 0:
+                units = min(units, room / weight_l[r])
+            return max(int(units), 0)
+
+        def bound(start: int, cap: float, room: float) -> float:
+            by_room = 0.0
+            left = room
+            for r in range(start, n):
+                units = offer_l[r] if weight_l[r] <= 0 else min(offer_l[r], left / weight_l[r])
+                by_room += units * profit_l[r]
+                left -= units * weight_l[r]
+                if left <= 0:
+                    break
+            by_cap = 0.0
+            left = cap
+            for r in by_price:
+                if r < start:
+                    continue
+                units = offer_l[r] if price_l[r] <= 0 else min(offer_l[r], left / price_l[r])
+                by_cap += units * profit_l[r]
+                left -= units * price_l[r]
+                if left <= 0:
+                    break
+            return min(by_room, by_cap)
+
+        # Incumbente: greedy truncado
+        best = [0] * n
+        cap, room, best_value = capital, capacity, 0.0
+        for r in range(n):
+            best[r] = max_units(r, cap, room)
+            cap -= best[r] * price_l[r]
+            room -= best[r] * weight_l[r]
+            best_value += best[r] * profit_l[r]
+
+        current = [0] * n
+
+        def search(r: int, cap: float, room: float, value: float) -> None:
+            nonlocal best, best_value
+            if r == n:
+                if value > best_value + 1e-9:
+                    best_value = value
+                    best = current.copy()
+                return
+            if value + bound(r, cap, room) <= best_value + 1e-9:
+                return
+            for units in range(max_units(r, cap, room), -1, -1):
+                current[r] = units
+                search(
+                    r + 1,
+                    cap - units * price_l[r],
+                    room - units * weight_l[r],
+                    value + units * profit_l[r],
+                )
+            current[r] = 0
+
+        search(0, capital, capacity, 0.0)
+        return np.array(best, dtype=float)
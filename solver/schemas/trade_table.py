@@ -0,0 +1,158 @@
+"""Tabla precalculada de ganancias por tramo para una instancia del DTP.
+
+Las decisiones de compra de los solvers (mochila greedy hacia el próximo
+puerto) dependen solo del par (puerto actual i, próximo puerto j): la ganancia
+unitaria de cada mercancía, su ratio ganancia/peso y el orden en que se
+compran. Todo eso se calcula una vez por instancia y se reutiliza como
+búsqueda en tablas.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .dtp import DTPInstance
+
+
+@dataclass(slots=True)
+class TradeTable:
+    """Ganancias y orden de compra para cada tramo (i, j) de la instancia.
+
+    Atributos (P = n + 1 puertos, m mercancías):
+        profit: profit[i, j, k] = precios_compra[k, j] - precios_venta[k, i],
+            ganancia por unidad de k comprada en i y vendida en j
+        ratio: Ganancia por unidad de peso (inf si el peso es 0; -inf si no
+            se puede comprar con ganancia)
+        buyable: Si k tiene ganancia positiva en (i, j) y oferta en i
+        order: Mercancías de cada tramo ordenadas por ratio descendente
+            (estable: ante empates, el menor k primero); las no comprables
+            quedan al final
+        n_buyable: Cuántas mercancías de ``order[i, j]`` son comprables
+        leg_bound: Valor de la mochila fraccionaria de cada tramo con la
+            bodega completa (ignora el capital): cota de lo que gana un tramo
+    """
+
+    profit: np.ndarray
+    ratio: np.ndarray
+    buyable: np.ndarray
+    order: np.ndarray
+    n_buyable: np.ndarray
+    leg_bound: np.ndarray
+
+    @classmethod
+    def build(cls, instance: DTPInstance) -> "TradeTable":
+        """Calcula la tabla completa de la instancia."""
+        # Ejes (i, j, k): comprar en i (precios_venta), vender en j (precios_compra)
+        profit = instance.precios_compra.T[None, :, :] - instance.precios_venta.T[:, None, :]
+        buyable = (profit > 0) & (instance.oferta_max.T[:, None, :] > 0)
+
+        with np.errstate(divide="ignore"):
+            ratio = np.where(instance.pesos > 0, profit / instance.pesos, np.inf)
+        ratio = np.where(buyable, ratio, -np.inf)
+
+        order = np.argsort(-ratio, axis=2, kind="stable")
+        n_buyable = buyable.sum(axis=2)
+
+        return cls(
+            profit=profit,
+            ratio=ratio,
+            buyable=buyable,
+            order=order,
+            n_buyable=n_buyable,
+            leg_bound=cls._fractional_bounds(instance, profit, order, buyable),
+        )
+
+    @staticmethod
+    def _fractional_bounds(
+        instance: DTPInstance,
+        profit: np.ndarray,
+        order: np.ndarray,
+        buyable: np.ndarray,
+    ) -> np.ndarray:
+        """Mochila fraccionaria por tramo, vectorizada sobre todos los pares (i, j)."""
+        n_ports, _, m = profit.shape
+        origin = np.broadcast_to(np.arange(n_ports)[:, None], (n_ports, n_ports))
+        capacity = np.full((n_ports, n_ports), float(instance.capacidad_bodega))
+        value = np.zeros((n_ports, n_ports))
+
+        for rank in range(m):
+            k = order[:, :, rank]
+            ok = np.take_along_axis(buyable, k[:, :, None], axis=2)[:, :, 0]
+            units = instance.oferta_max[k, origin]
+            weight = instance.pesos[k]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                take = np.where(weight > 0, np.minimum(units, capacity / weight), units)
+            take = np.where(ok, np.maximum(take, 0.0), 0.0)
+
+            gain = np.take_along_axis(profit, k[:, :, None], axis=2)[:, :, 0]
+            value += take * np.where(ok, gain, 0.0)
+            capacity -= take * weight
+
+        return value
+
+    def ranked(self, i: int, j: int) -> np.ndarray:
+        """Mercancías comprables en el tramo (i, j), de mejor a peor ratio."""
+        return self.order[i, j, : self.n_buyable[i, j]]
+
+
+def fractional_knapsack(
+    profit: np.ndarray, weight: np.ndarray, units: np.ndarray, capacity: float
+) -> float:
+    """Valor óptimo de la mochila fraccionaria con unidades acotadas."""
+    with np.errstate(divide="ignore"):
+        ratio = np.where(weight > 0, profit / weight, np.inf)
+    value = 0.0
+    for k in np.argsort(-ratio):
+        if weight[k] <= 0:
+            value += profit[k] * units[k]
+            continue
+        take = min(units[k], capacity / weight[k])
+        value += take * profit[k]
+        capacity -= take * weight[k]
+        if capacity <= 0:
+            break
+    return value
+
+
+def buy_bounds(instance: DTPInstance, best_sell: np.ndarray) -> tuple[np.ndarray, float]:
+    """Cota de ganancia por compras en cada puerto y mejor margen relativo.
+
+    A diferencia de ``TradeTable.leg_bound``, no fija el puerto de venta: cada
+    mercancía se valora al mejor precio de venta de toda la instancia.
+
+    Args:
+        instance: Instancia del problema
+        best_sell: Mejor precio de venta de cada mercancía (``precios_compra``
+            máximo por fila)
+
+    Returns:
+        (cota_compra[puerto], ganancia máxima por unidad de capital invertido)
+    """
+    n_ports = instance.n + 1
+    bounds = np.zeros(n_ports)
+    return_rate = 0.0
+
+    for port in range(n_ports):
+        price = instance.precios_venta[:, port]
+        profit = best_sell - price
+        useful = (profit > 0) & (instance.oferta_max[:, port] > 0)
+        if not np.any(useful):
+            continue
+
+        with np.errstate(divide="ignore"):
+            rates = np.where(price > 0, profit / price, np.inf)
+        return_rate = max(return_rate, float(np.max(rates[useful])))
+
+        bounds[port] = fractional_knapsack(
+            profit[useful],
+            instance.pesos[useful],
+            instance.oferta_max[useful, port],
+            float(instance.capacidad_bodega),
+        )
+
+    return bounds, return_rate
+
+
+def trade_table(instance: DTPInstance) -> TradeTable:
+    """Tabla de la instancia (memoizada en ``instance.derived``)."""
+    return instance.derived.trade_table
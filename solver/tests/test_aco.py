@@ -0,0 +1,158 @@
+"""Pruebas del solver ACO."""
+
+import numpy as np
+
+from generator.random_gen import RandomDTPGenerator
+from instances.predefined import INSTANCE_MEDIUM
+from solver.models import ACOSolver
+from solver.schemas.dtp import DTPSolution
+
+
+def test_batched_construction_builds_valid_routes():
+    instance = RandomDTPGenerator(seed=7).generate(
+        n_ports=40, max_time_range=(600.0, 800.0), initial_capital_range=(5000, 6000)
+    )
+    aco = ACOSolver(n_ants=30)
+    np.random.seed(0)
+    attractiveness = aco._attractiveness(
+        aco._init_pheromones(instance.n), aco._compute_heuristic(instance) ** aco.beta
+    )
+    routes = aco._construct_routes(instance, attractiveness)
+
+    assert len(routes) == 30
+    for route in routes:
+        if route is None:
+            continue
+        assert route[0] == 0 and route[-1] == 0
+        ports = route[1:-1]
+        assert len(set(ports)) == len(ports)
+        assert all(1 <= p <= instance.n for p in ports)
+        assert aco._route_time(instance, route) <= instance.tiempo_maximo
+
+
+def test_construction_follows_attractiveness():
+    # Con beta alto casi toda la probabilidad va al puerto más atractivo
+    aco = ACOSolver(n_ants=200, beta=50.0)
+    heuristic = aco._compute_heuristic(INSTANCE_MEDIUM)
+    np.random.seed(0)
+    attractiveness = aco._attractiveness(
+        aco._init_pheromones(INSTANCE_MEDIUM.n), heuristic ** aco.beta
+    )
+    routes = aco._construct_routes(INSTANCE_MEDIUM, attractiveness)
+
+    first = [r[1] for r in routes if r is not None and len(r) > 2]
+    assert first
+    assert np.mean(np.array(first) == np.argmax(heuristic[0])) > 0.9
+
+
+def _reference_heuristic(instance):
+    n = instance.tiempos.shape[0]
+    max_cost = np.max(instance.costos[instance.costos < np.inf])
+    max_time = np.max(instance.tiempos[instance.tiempos < np.inf])
+    heuristic = np.zeros((n, n))
+    for i in range(n):
+        for j in range(n):
+            if i != j and instance.costos[i, j] < np.inf:
+                combined = 0.5 * instance.costos[i, j] / max_cost + 0.5 * instance.tiempos[i, j] / max_time
+                heuristic[i, j] = 1.0 / (combined + 1e-6)
+    return heuristic
+
+
+def test_vectorized_heuristic_and_update():
+    aco = ACOSolver(evaporation_rate=0.5, q=10.0)
+    assert np.allclose(aco._compute_heuristic(INSTANCE_MEDIUM), _reference_heuristic(INSTANCE_MEDIUM))
+
+    pheromones = aco._init_pheromones(3)
+    good = DTPSolution(ruta=(0, 1, 2, 0), compras=None, ventas=None, beneficio_final=99.0)
+    poor = DTPSolution(ruta=(0, 1, 0), compras=None, ventas=None, beneficio_final=-5.0)
+    aco._update_pheromones(pheromones, [([0, 1, 2, 0], good), ([0, 1, 0], poor)])
+
+    expected = np.full((4, 4), 0.5)
+    expected[0, 1] += 10.0 * 99.0 / 100.0 + 0.1  # Arista compartida: se acumula
+    expected[1, 2] += 9.9
+    expected[2, 0] += 9.9
+    expected[1, 0] += 0.1
+    assert np.allclose(pheromones, expected)
+
+
+def test_candidate_lists_restrict_construction():
+    instance = RandomDTPGenerator(seed=7).generate(
+        n_ports=40, max_time_range=(600.0, 800.0), initial_capital_range=(5000, 6000)
+    )
+    aco = ACOSolver(n_ants=30, n_candidates=3)
+    candidates = instance.derived.candidates("combined", 3)
+    np.random.seed(0)
+    attractiveness = aco._attractiveness(
+        aco._init_pheromones(instance.n), aco._compute_heuristic(instance) ** aco.beta
+    )
+
+    for route in aco._construct_routes(instance, attractiveness):
+        if route is None:
+            continue
+        ports = route[1:-1]
+        assert len(set(ports)) == len(ports)
+        assert aco._route_time(instance, route) <= instance.tiempo_maximo
+        # Desde Ámsterdam hay candidatos factibles: el primer salto sale de ellos
+        assert ports[0] in candidates[0]
+
+    assert aco.solve(instance).beneficio_final > float("-inf")
+
+
+def test_subset_routes_respect_time_limit():
+    instance = RandomDTPGenerator(seed=1).generate(
+        n_ports=25, n_goods=4, max_time_range=(150, 250)
+    )
+    aco = ACOSolver(n_ants=30)
+    np.random.seed(0)
+    attractiveness = aco._attractiveness(
+        aco._init_pheromones(instance.n), aco._compute_heuristic(instance) ** aco.beta
+    )
+
+    # Cada hormiga elige un subconjunto de puertos y siempre puede volver a tiempo
+    routes = aco._construct_routes(instance, attractiveness)
+    assert all(route is not None for route in routes)
+    assert all(len(route) < instance.n + 2 for route in routes)
+
+    np.random.seed(0)
+    full = ACOSolver(n_ants=30, subset_routes=False)
+    assert any(route is None for route in full._construct_routes(instance, attractiveness))
+
+
+def test_pheromone_exchange_averages_published_colonies():
+    from solver.models.colonies import PheromoneExchange
+
+    exchange = PheromoneExchange(n_colonies=3, n_ports=2)
+    try:
+        first = np.full((3, 3), 2.0)
+        exchange.merge(0, first)
+        assert np.all(first == 2.0)  # Solo publicó la colonia 0
+
+        second = np.full((3, 3), 4.0)
+        exchange.merge(2, second)
+        assert np.all(second == 3.0)
+    finally:
+        exchange.close()
+
+
+def test_multi_colony_serial_and_parallel():
+    from solver.models import MultiColonyACOSolver
+
+    instance = RandomDTPGenerator(seed=3).generate(
+        n_ports=15, n_goods=4, max_time_range=(300, 500)
+    )
+    make = lambda n_jobs: MultiColonyACOSolver(
+        n_colonies=3, n_iterations=10, merge_interval=2, n_jobs=n_jobs
+    )
+
+    np.random.seed(123)
+    expected = np.random.random()
+    np.random.seed(123)
+    first, second = make(1).solve(instance), make(1).solve(instance)
+    # Cada colonia tiene su propio generador: el estado global no cambia
+    assert np.random.random() == expected
+    assert (first.ruta, first.beneficio_final) == (second.ruta, second.beneficio_final)
+
+    solver = make(2)
+    sol = solver.solve(instance)
+    assert solver.is_feasible(instance, sol)
+    assert solver.visited_nodes > 0
@@ -0,0 +1,58 @@
+"""Pruebas de los límites por llamada (time_limit / node_limit) y es_optimo."""
+
+import time
+
+from instances.predefined import INSTANCE_SMALL, INSTANCE_TINY
+from instances.robust import get_extreme_instances
+from solver.models import (
+    ACOSolver,
+    BranchAndBoundSolver,
+    BruteForceSolver,
+    GABeamSolver,
+    GreedySolver,
+    GreedyWithLocalSearch,
+)
+
+
+def test_exact_solvers_prove_optimality():
+    for solver in (BruteForceSolver(engine="dp"), BranchAndBoundSolver()):
+        sol = solver.solve(INSTANCE_SMALL)
+        assert sol.es_optimo
+        assert not solver.interrupted
+
+
+def test_heuristics_never_claim_optimality():
+    for solver in (GreedySolver(), GreedyWithLocalSearch(), ACOSolver(n_iterations=3)):
+        assert not solver.solve(INSTANCE_SMALL).es_optimo
+
+
+def test_time_limit_bounds_exhaustive_search():
+    bf = BruteForceSolver()
+
+    start = time.perf_counter()
+    sol = bf.solve(INSTANCE_TINY, time_limit=0.3)
+
+    assert time.perf_counter() - start < 5.0
+    assert bf.interrupted
+    assert not sol.es_optimo
+    assert bf.is_feasible(INSTANCE_TINY, sol)
+
+
+def test_node_limit_returns_best_so_far():
+    balanced = next(i for i, name in get_extreme_instances() if name.startswith("EXTREME_8"))
+    bb = BranchAndBoundSolver()
+    sol = bb.solve(balanced, node_limit=2)
+    assert bb.nodes_explored == 2
+    assert bb.interrupted and not sol.es_optimo
+
+    aco = ACOSolver(n_ants=5, n_iterations=50)
+    sol = aco.solve(INSTANCE_SMALL, node_limit=7)
+    assert aco.interrupted
+    assert sol is not None
+
+    ga = GABeamSolver(population_size=10, n_generations=50)
+    assert ga.solve(INSTANCE_SMALL, node_limit=10) is not None
+    assert ga.interrupted
+
+    # Sin límites en la llamada siguiente, el solver vuelve a completar
+    assert bb.solve(balanced).es_optimo
@@ -0,0 +1,47 @@
+"""Pruebas de la simulación vectorizada de rutas."""
+
+import numpy as np
+
+from generator.random_gen import RandomDTPGenerator
+from instances.predefined import INSTANCE_MEDIUM
+from solver.models import ACOSolver, RouteEvaluationCache, evaluate_routes, simulate_routes
+
+
+def test_batch_matches_scalar_simulation():
+    # Semilla con rutas factibles e infactibles (por tiempo o capital)
+    instance = RandomDTPGenerator(seed=0).generate(
+        n_ports=12, n_goods=4, initial_capital_range=(1000, 3000), max_time_range=(400, 600)
+    )
+    rng = np.random.default_rng(0)
+    routes = np.array(
+        [[0, *rng.permutation(np.arange(1, 13))[:6], 0] for _ in range(200)]
+    )
+
+    aco = ACOSolver()
+    batch = simulate_routes(instance, routes)
+    profits = evaluate_routes(instance, routes)
+
+    for row, route in enumerate(routes):
+        expected = aco._simulate_route(instance, route.tolist())
+        assert batch.factible[row] == (expected is not None)
+        if expected is None:
+            assert profits[row] == -np.inf
+            continue
+        assert profits[row] == expected.beneficio_final
+        assert np.array_equal(batch.compras[row], expected.compras)
+        assert np.array_equal(batch.ventas[row], expected.ventas)
+
+
+def test_batched_cache_lookup():
+    cache = RouteEvaluationCache()
+    aco = ACOSolver(cache=cache)
+    routes = [[0, 1, 2, 0], [0, 2, 1, 0], [0, 1, 2, 0], [0, 3, 0]]
+
+    first = aco._evaluate_routes(INSTANCE_MEDIUM, routes)
+    assert cache.misses == 3 and cache.hits == 1
+    assert first[0] is first[2]
+
+    second = aco._evaluate_routes(INSTANCE_MEDIUM, routes)
+    assert cache.hits == 5
+    assert all(a is b for a, b in zip(first, second))
+    assert first[3].beneficio_final == aco._simulate_route(INSTANCE_MEDIUM, [0, 3, 0]).beneficio_final
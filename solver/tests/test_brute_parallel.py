@@ -0,0 +1,69 @@
+"""Pruebas del modo paralelo de BruteForceSolver."""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from instances.predefined import INSTANCE_MEDIUM, INSTANCE_TINY
+from instances.robust import get_extreme_instances, get_micro_instances
+from solver.models import BruteForceSolver, CancelToken
+
+
+def test_parallel_dp_matches_serial():
+    cases = get_micro_instances() + [
+        (instance, name)
+        for instance, name in get_extreme_instances()
+        if not name.startswith("EXTREME_3")
+    ] + [(INSTANCE_TINY, "tiny"), (INSTANCE_MEDIUM, "medium")]
+
+    for instance, name in cases:
+        serial = BruteForceSolver(engine="dp").solve(instance)
+        parallel = BruteForceSolver(engine="dp", n_jobs=3).solve(instance)
+
+        assert parallel.ruta == serial.ruta, name
+        assert parallel.beneficio_final == serial.beneficio_final, name
+
+
+def test_parallel_exhaustive_matches_serial():
+    for instance, name in get_micro_instances():
+        serial = BruteForceSolver().solve(instance)
+        parallel = BruteForceSolver(n_jobs=2).solve(instance)
+
+        assert parallel.ruta == serial.ruta, name
+        assert np.array_equal(parallel.compras, serial.compras), name
+        assert np.array_equal(parallel.ventas, serial.ventas), name
+
+
+def test_invalid_n_jobs():
+    with pytest.raises(ValueError):
+        BruteForceSolver(n_jobs=0)
+
+
+def test_parallel_exhaustive_cancellation_returns_promptly():
+    token = CancelToken()
+    solver = BruteForceSolver(n_jobs=2, cancel_token=token)
+    timer = threading.Timer(1.0, token.cancel)
+
+    start = time.perf_counter()
+    timer.start()
+    try:
+        solution = solver.solve(INSTANCE_TINY)
+    finally:
+        timer.cancel()
+    elapsed = time.perf_counter() - start
+
+    # INSTANCE_TINY tarda horas con el motor exhaustivo
+    assert elapsed < 10.0
+    assert solver.interrupted
+    assert not solution.es_optimo
+    assert solver.visited_nodes > 0
+
+
+def test_parallel_node_limit_counts_all_shards():
+    solver = BruteForceSolver(n_jobs=2)
+    solution = solver.solve(INSTANCE_TINY, node_limit=500)
+
+    assert not solution.es_optimo
+    assert solver.visited_nodes >= 500
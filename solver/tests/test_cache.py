@@ -0,0 +1,89 @@
+"""Pruebas del caché de evaluaciones de rutas."""
+
+from instances.micro import INSTANCE_MICRO_1, INSTANCE_MICRO_3
+from solver.models import (
+    ACOSolver,
+    BranchAndBoundSolver,
+    GABeamSolver,
+    GreedySolver,
+    GreedyWithLocalSearch,
+    RouteEvaluationCache,
+)
+
+
+def test_cache_counts_hits_and_misses():
+    cache = RouteEvaluationCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return 42.0
+
+    assert cache.get_or_compute(INSTANCE_MICRO_1, (0, 1, 2, 0), "p", compute) == 42.0
+    assert cache.get_or_compute(INSTANCE_MICRO_1, [0, 1, 2, 0], "p", compute) == 42.0
+
+    # Misma ruta con otra política: no se comparte
+    cache.get_or_compute(INSTANCE_MICRO_1, (0, 1, 2, 0), "otra", compute)
+
+    assert len(calls) == 2
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+
+def test_cache_lru_eviction_and_none_results():
+    cache = RouteEvaluationCache(maxsize=2)
+
+    cache.get_or_compute(INSTANCE_MICRO_1, (0, 1, 0), "p", lambda: None)
+    cache.get_or_compute(INSTANCE_MICRO_1, (0, 2, 0), "p", lambda: 2.0)
+    # Tocar (0, 1, 0) para que (0, 2, 0) sea el menos reciente
+    assert cache.get_or_compute(INSTANCE_MICRO_1, (0, 1, 0), "p", lambda: 99) is None
+    cache.get_or_compute(INSTANCE_MICRO_1, (0, 1, 2, 0), "p", lambda: 3.0)
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.get_or_compute(INSTANCE_MICRO_1, (0, 2, 0), "p", lambda: -1) == -1
+
+
+def test_cache_is_reset_for_new_instance():
+    cache = RouteEvaluationCache()
+    cache.get_or_compute(INSTANCE_MICRO_1, (0, 1, 0), "p", lambda: 1.0)
+    assert cache.get_or_compute(INSTANCE_MICRO_3, (0, 1, 0), "p", lambda: 2.0) == 2.0
+    assert len(cache) == 1
+
+
+def test_shared_cache_across_solvers():
+    cache = RouteEvaluationCache()
+    greedy = GreedySolver(port_selection="combined")
+    aco = ACOSolver(n_ants=5, n_iterations=5, cache=cache)
+    ga = GABeamSolver(population_size=10, n_generations=5, cache=cache)
+    ls = GreedyWithLocalSearch(cache=cache)
+
+    route = (0, 1, 2, 3, 0)
+    first = aco._evaluate_route(INSTANCE_MICRO_3, list(route))
+    assert aco._evaluate_route(INSTANCE_MICRO_3, list(route)) is first
+
+    ga._evaluate_route(INSTANCE_MICRO_3, [1, 2, 3])
+    ls._evaluate_route(route, INSTANCE_MICRO_3, greedy)
+
+    # Cada política ocupa su propia entrada para la misma ruta
+    assert len(cache) == 3
+    assert cache.hits == 1
+
+    aco.solve(INSTANCE_MICRO_3)
+    ga.solve(INSTANCE_MICRO_3)
+    assert cache.hit_rate > 0.5
+
+
+def test_finish_run_does_not_mutate_cached_solutions():
+    cache = RouteEvaluationCache()
+    aco = ACOSolver(n_ants=5, n_iterations=5, cache=cache)
+    solution = aco.solve(INSTANCE_MICRO_3)
+    cached = cache.get_or_compute(INSTANCE_MICRO_3, solution.ruta, aco.policy_id, lambda: None)
+    assert cached is not None and cached is not solution
+
+    # Un solver exacto que devuelve la misma solución no marca la del caché
+    exact = BranchAndBoundSolver()
+    exact._start_run()
+    marked = exact._finish_run(cached, 0, optimal=True)
+    assert marked.es_optimo
+    assert not cached.es_optimo
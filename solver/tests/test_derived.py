@@ -0,0 +1,77 @@
+"""Pruebas de la vista de datos derivados de la instancia."""
+
+import pickle
+
+import numpy as np
+
+from generator.random_gen import RandomDTPGenerator
+from solver.models import GreedySolver
+from solver.schemas.trade_table import trade_table
+
+
+def test_derived_data_is_memoized_and_shared():
+    instance = RandomDTPGenerator(seed=2).generate(n_ports=6, n_goods=3)
+    view = instance.derived
+
+    assert instance.derived is view
+    assert view.combined_cost is view.combined_cost
+    assert trade_table(instance) is view.trade_table
+
+    f32 = view.as_array("costos", np.float32)
+    assert f32.dtype == np.float32 and f32.flags.c_contiguous and not f32.flags.writeable
+    assert view.as_array("costos", np.float32) is f32
+    assert np.allclose(f32, instance.costos)
+
+
+def test_neighbors_sorted_without_self():
+    instance = RandomDTPGenerator(seed=3).generate(n_ports=7, n_goods=3)
+    for criterion, scores in (
+        ("min_cost", instance.costos),
+        ("min_time", instance.tiempos),
+        ("combined", instance.derived.combined_cost),
+    ):
+        neighbors = instance.derived.neighbors(criterion)
+        assert neighbors.shape == (instance.n + 1, instance.n)
+        for i, row in enumerate(neighbors):
+            assert i not in row
+            assert sorted(row.tolist()) == [p for p in range(instance.n + 1) if p != i]
+            assert np.all(np.diff(scores[i, row]) >= 0)
+
+
+def test_mutation_invalidates_derived_data():
+    instance = RandomDTPGenerator(seed=4).generate(n_ports=5, n_goods=3)
+    view = instance.derived
+    table = view.trade_table
+
+    instance.pesos = instance.pesos * 2
+    assert instance.derived is not view
+    assert trade_table(instance) is not table
+
+    # Cambios en el lugar requieren invalidar explícitamente
+    view = instance.derived
+    instance.costos[0, 1] = 0.0
+    assert instance.derived is view
+    instance.invalidate_derived()
+    assert instance.derived is not view
+
+
+def test_greedy_uses_neighbor_lists():
+    instance = RandomDTPGenerator(seed=1).generate(n_ports=8, n_goods=4, max_time_range=(500, 900))
+    clone = pickle.loads(pickle.dumps(instance))
+    for criterion in ("min_cost", "min_time", "combined"):
+        sol = GreedySolver(port_selection=criterion).solve(instance)
+        assert GreedySolver(port_selection=criterion).solve(clone).ruta == sol.ruta
+
+
+def test_candidates_are_nearest_non_depot_ports():
+    instance = RandomDTPGenerator(seed=6).generate(n_ports=9, n_goods=3)
+    neighbors = instance.derived.neighbors("min_time")
+    candidates = instance.derived.candidates("min_time", 4)
+
+    assert candidates.shape == (instance.n + 1, 4)
+    for i in range(instance.n + 1):
+        expected = [p for p in neighbors[i] if p != 0][:4]
+        assert candidates[i].tolist() == expected
+
+    # k se recorta al número de puertos alcanzables
+    assert instance.derived.candidates("min_time", 100).shape == (instance.n + 1, instance.n - 1)
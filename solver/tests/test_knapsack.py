@@ -0,0 +1,95 @@
+"""Pruebas de la mochila exacta por tramo."""
+
+import itertools
+
+import numpy as np
+
+from generator.random_gen import RandomDTPGenerator
+from solver.models import ACOSolver, ExactKnapsack, GreedyKnapsack, GreedySolver
+
+
+def _brute_force(instance, i, j, capital, capacity):
+    """Mejor ganancia del tramo enumerando todas las compras posibles."""
+    profit = instance.derived.trade_table.profit[i, j]
+    goods = instance.derived.trade_table.ranked(i, j).tolist()
+    best = 0.0
+    for combo in itertools.product(*[range(int(instance.oferta_max[k, i]) + 1) for k in goods]):
+        cost = sum(q * instance.precios_venta[k, i] for q, k in zip(combo, goods))
+        weight = sum(q * instance.pesos[k] for q, k in zip(combo, goods))
+        if cost <= capital and weight <= capacity:
+            best = max(best, sum(q * profit[k] for q, k in zip(combo, goods)))
+    return best
+
+
+def test_exact_knapsack_matches_brute_force():
+    instance = RandomDTPGenerator(seed=2).generate(
+        n_ports=4, n_goods=3, max_offer_range=(3, 8)
+    )
+    knapsack = instance.derived.knapsack
+    profit = instance.derived.trade_table.profit
+
+    for i in range(1, instance.n + 1):
+        for j in range(instance.n + 1):
+            if i == j:
+                continue
+            # Recursos fraccionarios: el caché redondea, el resultado no
+            for capital, capacity in [
+                (50.0, 20.0), (300.0, 60.0), (1500.0, 20.0), (299.7, 17.76), (1234.5, 41.3)
+            ]:
+                compras = knapsack.solve(i, j, capital, capacity)
+                assert compras.dot(instance.precios_venta[:, i]) <= capital
+                assert compras.dot(instance.pesos) <= capacity
+                assert np.all(compras == np.round(compras))
+                expected = _brute_force(instance, i, j, capital, capacity)
+                assert abs(compras.dot(profit[i, j]) - expected) < 1e-6
+
+
+def test_exact_knapsack_memoizes_by_leg_and_resources():
+    instance = RandomDTPGenerator(seed=2).generate(n_ports=4, n_goods=3)
+    knapsack = instance.derived.knapsack
+
+    first = knapsack.solve(1, 2, 1000.0, 80.0)
+    assert knapsack.solve(1, 2, 1000.0, 80.0) is first
+    assert knapsack.hits == 1 and knapsack.misses == 1
+
+    # Capital de sobra: se recorta a lo máximo gastable y comparte entrada
+    rich = knapsack.solve(1, 2, 1e9, 10.0)
+    assert knapsack.solve(1, 2, 2e9, 10.0) is rich
+    assert knapsack.hits == 2 and knapsack.misses == 2
+
+    # Una instancia modificada descarta el caché
+    instance.capacidad_bodega = 10
+    assert instance.derived.knapsack is not knapsack
+
+
+def test_exact_knapsack_in_solvers():
+    instance = RandomDTPGenerator(seed=1).generate(n_ports=10, n_goods=5)
+
+    greedy = GreedySolver(port_selection="combined").solve(instance)
+    exact = GreedySolver(port_selection="combined", knapsack="exact").solve(instance)
+    assert exact.ruta == greedy.ruta
+    assert exact.beneficio_final >= greedy.beneficio_final - 1e-6
+
+    aco = ACOSolver(n_iterations=5, knapsack="exact")
+    np.random.seed(0)
+    solution = aco.solve(instance)
+    assert aco.is_feasible(instance, solution)
+    assert aco.policy_id != ACOSolver().policy_id
+
+
+def test_exact_knapsack_never_worse_than_greedy_on_fractional_resources():
+    # El caché redondea los recursos; la compra debe ser óptima para los reales
+    # (pesos fraccionarios: redondear la capacidad puede costar una unidad)
+    instance = RandomDTPGenerator(seed=5).generate(n_ports=8, n_goods=4)
+    profit = instance.derived.trade_table.profit
+    exact, greedy = ExactKnapsack(), GreedyKnapsack()
+    rng = np.random.default_rng(0)
+
+    for _ in range(300):
+        i, j = rng.choice(instance.n + 1, size=2, replace=False).tolist()
+        capital = float(rng.uniform(0, 3000))
+        capacity = float(rng.uniform(0, instance.capacidad_bodega))
+        compras = exact.buy(instance, i, j, capital, capacity)
+        assert compras @ instance.pesos <= capacity + 1e-9
+        baseline = greedy.buy(instance, i, j, capital, capacity)
+        assert compras @ profit[i, j] >= baseline @ profit[i, j] - 1e-6
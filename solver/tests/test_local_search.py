@@ -0,0 +1,120 @@
+"""Pruebas de la búsqueda local sobre rutas."""
+
+import numpy as np
+import pytest
+
+from generator.random_gen import RandomDTPGenerator
+from instances.predefined import INSTANCE_MEDIUM
+from solver.models import GreedySolver, GreedyWithLocalSearch, MultiStartLocalSearch
+
+
+def test_prefix_resume_matches_full_simulation():
+    greedy = GreedySolver(port_selection="combined")
+    ls = GreedyWithLocalSearch()
+    route = (0, 1, 2, 3, 0)
+    base = ls._simulate_route(route, INSTANCE_MEDIUM, greedy)
+    assert base is not None
+
+    for i in range(1, len(route) - 2):
+        for j in range(i + 1, len(route) - 1):
+            new_route = route[:i] + tuple(reversed(route[i : j + 1])) + route[j + 1 :]
+            full = ls._simulate_route(new_route, INSTANCE_MEDIUM, greedy)
+            resumed = ls._simulate_route(new_route, INSTANCE_MEDIUM, greedy, base, i - 1)
+
+            assert (full is None) == (resumed is None)
+            if full is not None:
+                assert resumed.beneficio_final == full.beneficio_final
+                assert np.array_equal(resumed.compras, full.compras)
+                assert np.array_equal(resumed.ventas, full.ventas)
+                # El prefijo común se comparte en lugar de recalcularse
+                assert resumed.cargos[i - 1] is base.cargos[i - 1]
+
+
+def test_candidate_moves_restrict_neighborhood():
+    route = [0, 3, 1, 4, 2, 5, 0]
+    full = list(GreedyWithLocalSearch._two_opt_moves(route, None))
+    candidates = np.array([[1, 2], [2, 3], [1, 3], [1, 2], [5, 3], [4, 2]])
+    restricted = list(GreedyWithLocalSearch._two_opt_moves(route, candidates))
+
+    # Solo los pares que crean aristas hacia candidatos
+    assert restricted[0] == (1, 2)  # route[0] = 0 tiene a 1 (posición 2) como candidato
+    assert all(route[j] in candidates[route[i - 1]] for i, j in restricted)
+    assert len(restricted) < len(full)
+
+    # Con respaldo: mismos pares que el vecindario completo, candidatos primero
+    with_fallback = list(GreedyWithLocalSearch._two_opt_moves(route, candidates, True))
+    assert with_fallback[: len(restricted)] == restricted
+    assert sorted(with_fallback) == sorted(full)
+
+    ls = GreedyWithLocalSearch(candidate_k=2)
+    sol = ls.solve(INSTANCE_MEDIUM)
+    assert sol.beneficio_final >= GreedySolver(port_selection="combined").solve(
+        INSTANCE_MEDIUM
+    ).beneficio_final
+
+
+def test_moves_share_prefix_up_to_start():
+    from solver.models.moves import NEIGHBORHOODS
+
+    route = (0, 3, 1, 4, 2, 0)
+    for name, neighborhood in NEIGHBORHOODS.items():
+        for start, new_route in neighborhood(route, 6):
+            # Mismo prefijo hasta start y cambio justo después
+            assert new_route[: start + 1] == route[: start + 1], name
+            assert new_route[start + 1] != route[start + 1], name
+            assert new_route[0] == 0 and new_route[-1] == 0
+
+    inserted = {r for _, r in NEIGHBORHOODS["insert"](route, 6)}
+    assert len(inserted) == 2 * 5  # Puertos 5 y 6, cinco posiciones cada uno
+    assert {len(r) for _, r in NEIGHBORHOODS["drop"](route, 6)} == {len(route) - 1}
+
+
+def test_extended_moves_and_strategies_improve_on_two_opt():
+    base = GreedyWithLocalSearch().solve(INSTANCE_MEDIUM).beneficio_final
+    moves = ("or_opt", "swap", "insert", "drop")
+    for strategy in ("first", "best"):
+        ls = GreedyWithLocalSearch(moves=moves, strategy=strategy)
+        sol = ls.solve(INSTANCE_MEDIUM)
+        assert sol.beneficio_final >= base
+        assert ls.is_feasible(INSTANCE_MEDIUM, sol)
+
+
+def test_unknown_strategy_is_rejected():
+    for solver_class in (GreedyWithLocalSearch, MultiStartLocalSearch):
+        with pytest.raises(ValueError):
+            solver_class(strategy="worst")
+
+
+def test_dont_look_bits_reach_two_opt_local_optimum():
+    ls = GreedyWithLocalSearch(dont_look_bits=True)
+    sol = ls.solve(INSTANCE_MEDIUM)
+    greedy = GreedySolver(port_selection="combined")
+    assert sol.beneficio_final >= greedy.solve(INSTANCE_MEDIUM).beneficio_final
+
+    # Al vaciarse la cola ninguna reversión mejora la ruta final
+    route = tuple(sol.ruta)
+    for _, new_route in ls._neighborhood(route, INSTANCE_MEDIUM, None):
+        other = ls._simulate_route(new_route, INSTANCE_MEDIUM, greedy)
+        assert other is None or other.beneficio_final <= sol.beneficio_final
+
+
+def test_dont_look_bits_honor_candidate_lists():
+    route = (0, 3, 1, 4, 2, 5, 0)
+    candidates = np.array([[1, 2], [2, 3], [1, 3], [1, 2], [5, 3], [4, 2]])
+    for position in range(1, len(route) - 1):
+        full = GreedyWithLocalSearch._position_pairs(route, position, None)
+        restricted = GreedyWithLocalSearch._position_pairs(route, position, candidates)
+        assert all(route[j] in candidates[route[i - 1]] for i, j in restricted)
+        with_fallback = GreedyWithLocalSearch._position_pairs(
+            route, position, candidates, True
+        )
+        assert with_fallback[: len(restricted)] == restricted
+        assert sorted(with_fallback) == sorted(full)
+
+    instance = RandomDTPGenerator(seed=1).generate(n_ports=10, n_goods=5)
+    visited = {}
+    for k in (None, 2):
+        ls = GreedyWithLocalSearch(dont_look_bits=True, candidate_k=k)
+        ls.solve(instance)
+        visited[k] = ls.visited_nodes
+    assert visited[2] < visited[None]
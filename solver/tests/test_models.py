@@ -13,6 +13,12 @@ def run_brute_tests():
     return run_solver_tests(solver)
 
 
+def run_brute_dp_tests():
+    """Ejecuta BruteForceSolver (motor DP) en todas las instancias MICRO."""
+    solver = BruteForceSolver(engine="dp")
+    return run_solver_tests(solver)
+
+
 def run_greedy_tests():
     """Ejecuta GreedySolver en todas las instancias MICRO."""
     solver = GreedySolver()
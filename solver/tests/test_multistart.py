@@ -0,0 +1,54 @@
+"""Pruebas de la búsqueda local multi-arranque."""
+
+import time
+
+from generator.random_gen import RandomDTPGenerator
+from instances.predefined import INSTANCE_MEDIUM
+from solver.models import GreedySolver, MultiStartLocalSearch
+
+
+def test_serial_multistart_is_reproducible():
+    first = MultiStartLocalSearch(n_starts=4, n_jobs=1, seed=3).solve(INSTANCE_MEDIUM)
+    second = MultiStartLocalSearch(n_starts=4, n_jobs=1, seed=3).solve(INSTANCE_MEDIUM)
+
+    assert first.ruta == second.ruta
+    assert first.beneficio_final == second.beneficio_final
+    assert first.beneficio_final >= GreedySolver(port_selection="combined").solve(
+        INSTANCE_MEDIUM
+    ).beneficio_final
+
+
+def test_parallel_multistart_respects_time_budget():
+    instance = RandomDTPGenerator(seed=1).generate(
+        n_ports=15, n_goods=4, max_time_range=(3000, 5000), initial_capital_range=(5000, 8000)
+    )
+    solver = MultiStartLocalSearch(n_starts=500, n_jobs=2, time_budget=1.0)
+
+    start = time.perf_counter()
+    sol = solver.solve(instance)
+
+    assert time.perf_counter() - start < 10.0
+    assert solver.interrupted and not sol.es_optimo
+    assert solver.is_feasible(instance, sol)
+    assert sol.beneficio_final >= GreedySolver(port_selection="combined").solve(
+        instance
+    ).beneficio_final
+
+
+def test_randomized_greedy_varies_with_seed():
+    instance = RandomDTPGenerator(seed=2).generate(n_ports=10, n_goods=3)
+    routes = {GreedySolver(rcl_size=3, seed=s).solve(instance).ruta for s in range(10)}
+    assert len(routes) > 1
+    # rcl_size=1 es el greedy determinista de siempre
+    assert GreedySolver(rcl_size=1, seed=5).solve(instance).ruta == GreedySolver().solve(instance).ruta
+
+
+def test_candidate_lists_apply_with_default_dont_look_bits():
+    instance = RandomDTPGenerator(seed=1).generate(n_ports=10, n_goods=5)
+    visited = {}
+    for k in (None, 2):
+        solver = MultiStartLocalSearch(n_starts=4, n_jobs=1, seed=3, candidate_k=k)
+        assert solver.dont_look_bits
+        solver.solve(instance)
+        visited[k] = solver.visited_nodes
+    assert visited[2] < visited[None]
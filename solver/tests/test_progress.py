@@ -1,3 +1,6 @@
+import time
+
+from solver.models import ACOSolver, CancelToken, GABeamSolver, GreedyWithLocalSearch
 from solver.models.brute import BruteForceSolver
 from instances.predefined import INSTANCE_TINY
 
@@ -44,3 +47,59 @@ def test_bruteforce_progress_callback():
     ]
     if dfs_nodes:
         assert max(dfs_nodes) > 0
+
+
+def test_time_budget_returns_best_so_far():
+    reported = []
+
+    def cb(ev: dict):
+        # La primera ruta agota el presupuesto: el resultado no depende de la
+        # velocidad de la máquina
+        if ev["event"] == "route_progress" and not reported:
+            reported.append(ev["best_benefit"])
+            time.sleep(0.2)
+
+    bf = BruteForceSolver(time_budget=0.1, progress_callback=cb, progress_interval=1)
+
+    sol = bf.solve(INSTANCE_TINY)
+
+    assert bf.interrupted
+    assert not sol.es_optimo
+    assert bf.is_feasible(INSTANCE_TINY, sol)
+    assert reported[0] is None or sol.beneficio_final >= reported[0]
+
+
+def test_dp_engine_emits_progress():
+    events = []
+    bf = BruteForceSolver(engine="dp", progress_callback=events.append, progress_interval=1)
+
+    sol = bf.solve(INSTANCE_TINY)
+
+    assert [e["event"] for e in events][0] == "start"
+    assert events[-1]["event"] == "finish"
+    assert events[-1]["best_benefit"] == sol.beneficio_final
+    assert any(e["event"] == "dfs_progress" and e["visited_nodes"] > 0 for e in events)
+    assert not bf.interrupted
+
+
+def test_cancel_token_stops_metaheuristics():
+    for make in (
+        lambda cb, tok: ACOSolver(n_iterations=50, progress_callback=cb, cancel_token=tok),
+        lambda cb, tok: GABeamSolver(n_generations=50, progress_callback=cb, cancel_token=tok),
+        lambda cb, tok: GreedyWithLocalSearch(progress_callback=cb, cancel_token=tok),
+    ):
+        token = CancelToken()
+        iterations = []
+
+        def cb(ev: dict):
+            if ev["event"] == "iteration":
+                iterations.append(ev)
+                token.cancel()
+
+        solver = make(cb, token)
+        sol = solver.solve(INSTANCE_TINY)
+
+        assert sol is not None
+        assert len(iterations) <= 1
+        if iterations:
+            assert solver.interrupted
@@ -0,0 +1,32 @@
+"""Pruebas de la tabla precalculada de ganancias por tramo."""
+
+import numpy as np
+
+from generator.random_gen import RandomDTPGenerator
+from solver.schemas.trade_table import fractional_knapsack, trade_table
+
+
+def test_trade_table_matches_direct_computation():
+    instance = RandomDTPGenerator(seed=5).generate(n_ports=6, n_goods=4)
+    table = trade_table(instance)
+    assert trade_table(instance) is table  # Se calcula una sola vez
+
+    for i in range(instance.n + 1):
+        for j in range(instance.n + 1):
+            profit = instance.precios_compra[:, j] - instance.precios_venta[:, i]
+            assert np.array_equal(table.profit[i, j], profit)
+
+            useful = [
+                k for k in range(instance.m)
+                if profit[k] > 0 and instance.oferta_max[k, i] > 0
+            ]
+            expected = sorted(useful, key=lambda k: profit[k] / instance.pesos[k], reverse=True)
+            assert table.ranked(i, j).tolist() == expected
+
+            bound = fractional_knapsack(
+                profit[useful],
+                instance.pesos[useful],
+                instance.oferta_max[useful, i],
+                float(instance.capacidad_bodega),
+            ) if useful else 0.0
+            assert np.isclose(table.leg_bound[i, j], bound)
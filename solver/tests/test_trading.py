@@ -0,0 +1,86 @@
+"""Pruebas de las políticas de trading compartidas por los solvers."""
+
+import random
+
+import numpy as np
+
+from generator.random_gen import RandomDTPGenerator
+from solver.models import (
+    ACOSolver,
+    BeamTrading,
+    ExactKnapsack,
+    GABeamSolver,
+    GreedyKnapsack,
+    GreedySolver,
+    greedy_purchases,
+)
+
+from .test_knapsack import _brute_force
+
+
+def test_single_and_batched_purchases_agree():
+    instance = RandomDTPGenerator(seed=4).generate(n_ports=8, n_goods=5)
+    rng = np.random.default_rng(0)
+    ports = rng.integers(0, instance.n + 1, size=50)
+    next_ports = (ports + rng.integers(1, instance.n + 1, size=50)) % (instance.n + 1)
+    capital = rng.uniform(0, 3000, size=50)
+    capacity = np.full(50, float(instance.capacidad_bodega))
+
+    for policy in (GreedyKnapsack(), ExactKnapsack()):
+        batch = policy.purchases(instance, ports, next_ports, capital, capacity)
+        for row in range(50):
+            single = policy.buy(
+                instance, ports[row], next_ports[row], capital[row], capacity[row]
+            )
+            assert np.array_equal(batch[row], single)
+
+    # El greedy de GreedySolver es el mismo núcleo vectorizado
+    _, compras, _, _ = GreedySolver()._trade_at_port(
+        instance, 1, 5000.0, np.zeros(instance.m), 2
+    )
+    expected = greedy_purchases(
+        instance, 1, 2, np.array([5000.0 - instance.costos[1, 2]]),
+        np.array([float(instance.capacidad_bodega)]),
+    )[0]
+    assert np.array_equal(compras, expected)
+
+
+def test_policies_simulate_the_same_route_consistently():
+    instance = RandomDTPGenerator(seed=4).generate(
+        n_ports=8, n_goods=5, max_time_range=(2000, 3000)
+    )
+    routes = [[0, 1, 2, 3, 0], [0, 4, 2, 0], [0, 5, 6, 7, 1, 0]]
+
+    greedy = GreedyKnapsack().simulate_many(instance, routes)
+    for route, g in zip(routes, greedy):
+        single = GreedyKnapsack().simulate(instance, route)
+        assert g.beneficio_final == single.beneficio_final
+        assert np.array_equal(g.compras, single.compras)
+
+    # Tramo a tramo (con los recursos reales) la mochila exacta es el óptimo
+    profit = instance.derived.trade_table.profit
+    for route in routes:
+        for i, j in zip(route[1:-2], route[2:-1]):
+            for capital, capacity in [(800.0, 50.0), (523.7, 17.76)]:
+                exact = ExactKnapsack().buy(instance, i, j, capital, capacity)
+                greedy = GreedyKnapsack().buy(instance, i, j, capital, capacity)
+                best = _brute_force(instance, i, j, capital, capacity)
+                assert abs(exact @ profit[i, j] - best) < 1e-6
+                assert exact @ profit[i, j] >= greedy @ profit[i, j] - 1e-6
+
+    assert len({p.policy_id for p in (GreedyKnapsack(), ExactKnapsack(), BeamTrading(5))}) == 3
+
+
+def test_solvers_accept_any_policy():
+    instance = RandomDTPGenerator(seed=4).generate(n_ports=8, n_goods=5)
+
+    np.random.seed(0)
+    aco = ACOSolver(n_iterations=3, trade_policy=BeamTrading(10))
+    solution = aco.solve(instance)
+    assert aco.is_feasible(instance, solution)
+    assert aco.policy_id == "aco:beam:width=10"
+
+    random.seed(0)
+    ga = GABeamSolver(population_size=10, n_generations=3, trade_policy=ExactKnapsack())
+    solution = ga.solve(instance)
+    assert ga.is_feasible(instance, solution)
@@ -0,0 +1,118 @@
+"""Pruebas y benchmark de los buffers reutilizables de la simulación en lote."""
+
+import pickle
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from generator.random_gen import RandomDTPGenerator
+from solver.models import GreedyKnapsack, SimulationWorkspace, simulate_routes
+
+
+def _random_routes(n_routes: int, n_ports: int = 12, length: int = 6, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    return np.array(
+        [[0, *rng.permutation(np.arange(1, n_ports + 1))[:length], 0] for _ in range(n_routes)]
+    )
+
+
+def allocated_bytes_per_route(instance, routes, workspace=None) -> float:
+    """Pico de memoria reservada (tracemalloc) por ruta en una simulación.
+
+    Con workspace se hace antes una simulación de calentamiento para que los
+    buffers ya tengan el tamaño del lote.
+    """
+    if workspace is not None:
+        simulate_routes(instance, routes, workspace=workspace)
+    tracemalloc.start()
+    try:
+        simulate_routes(instance, routes, workspace=workspace)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / len(routes)
+
+
+def test_workspace_results_match_fresh_simulation():
+    instance = RandomDTPGenerator(seed=0).generate(
+        n_ports=12, n_goods=4, initial_capital_range=(1000, 3000), max_time_range=(400, 600)
+    )
+    workspace = SimulationWorkspace()
+
+    for seed in range(3):
+        routes = _random_routes(100, seed=seed)
+        fresh = simulate_routes(instance, routes)
+        reused = simulate_routes(instance, routes, workspace=workspace)
+        assert np.array_equal(fresh.beneficio_final, reused.beneficio_final)
+        assert np.array_equal(fresh.factible, reused.factible)
+        assert np.array_equal(fresh.compras, reused.compras)
+        assert np.array_equal(fresh.ventas, reused.ventas)
+
+    # Las soluciones de una política no comparten memoria con su workspace
+    policy = GreedyKnapsack()
+    kept = [s for s in policy.simulate_many(instance, _random_routes(20).tolist()) if s]
+    snapshot = [s.compras.copy() for s in kept]
+    policy.simulate_many(instance, _random_routes(20, seed=5).tolist())
+    assert kept
+    assert all(np.array_equal(s.compras, c) for s, c in zip(kept, snapshot))
+
+
+def test_workspace_allocations_per_route_drop_to_near_zero():
+    instance = RandomDTPGenerator(seed=0).generate(n_ports=12, n_goods=6)
+    routes = _random_routes(1024)
+    workspace = SimulationWorkspace()
+
+    fresh = allocated_bytes_per_route(instance, routes)
+    reused = allocated_bytes_per_route(instance, routes, workspace)
+    # Sin workspace se reservan las matrices de compras/ventas de cada ruta
+    assert fresh > 8 * instance.m * routes.shape[1]
+    assert reused < fresh / 20
+
+    # Lotes iguales o menores no hacen crecer los buffers
+    nbytes = workspace.nbytes
+    simulate_routes(instance, routes[:500], workspace=workspace)
+    assert workspace.nbytes == nbytes
+
+    # Al copiarlo a otro proceso se envía vacío
+    assert pickle.loads(pickle.dumps(workspace)).nbytes == 0
+
+
+def test_out_of_range_ports_raise():
+    instance = RandomDTPGenerator(seed=0).generate(n_ports=4, n_goods=3)
+
+    for route in ([0, 1, 9, 0], [0, -1, 2, 0]):
+        with pytest.raises(IndexError):
+            GreedyKnapsack().simulate(instance, route)
+        with pytest.raises(IndexError):
+            simulate_routes(instance, np.array([route]), workspace=SimulationWorkspace())
+    with pytest.raises(IndexError):
+        GreedyKnapsack().buy(instance, 1, 5, 1000.0, 50.0)
+
+
+def display_allocations():
+    """Muestra memoria reservada y tiempo por ruta con y sin workspace."""
+    instance = RandomDTPGenerator(seed=0).generate(n_ports=12, n_goods=6)
+
+    print("=" * 72)
+    print("SIMULACIÓN EN LOTE: MEMORIA RESERVADA POR RUTA EVALUADA")
+    print("=" * 72)
+    print(f"{'Rutas':>8} | {'Sin workspace':>16} | {'Con workspace':>16} | {'ms/lote (con)':>14}")
+    print("-" * 72)
+    for n_routes in (64, 256, 1024, 4096):
+        routes = _random_routes(n_routes)
+        workspace = SimulationWorkspace()
+        fresh = allocated_bytes_per_route(instance, routes)
+        reused = allocated_bytes_per_route(instance, routes, workspace)
+
+        start = time.perf_counter()
+        for _ in range(20):
+            simulate_routes(instance, routes, workspace=workspace)
+        elapsed = (time.perf_counter() - start) / 20 * 1000
+        print(f"{n_routes:>8} | {fresh:>14.1f} B | {reused:>14.1f} B | {elapsed:>14.2f}")
+    print()
+
+
+if __name__ == "__main__":
+    display_allocations()